@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from mkdocs.config.config_options import Type
+from mkdocs.config.config_options import Optional, Type
 from mkdocs.config.base import Config
 
 # -----------------------------------------------------------------------------
@@ -28,3 +28,6 @@ from mkdocs.config.base import Config
 # Offline plugin configuration
 class OfflineConfig(Config):
     enabled = Type(bool, default = True)
+
+    # Settings for search
+    search_chunk_size = Optional(Type(int))
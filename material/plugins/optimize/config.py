@@ -21,12 +21,25 @@
 import os
 
 from mkdocs.config.base import Config
-from mkdocs.config.config_options import ListOfItems, Type
+from mkdocs.config.config_options import (
+    Choice, DictOfItems, ListOfItems, Optional, SubConfig, Type
+)
 
 # -----------------------------------------------------------------------------
 # Classes
 # -----------------------------------------------------------------------------
 
+# Optimize plugin configuration for files matching a pattern
+class OptimizeOverrideConfig(Config):
+    optimize_png_speed = Optional(Type(int))
+    optimize_png_strip = Optional(Type(bool))
+    optimize_jpg_quality = Optional(Type(int))
+    optimize_jpg_progressive = Optional(Type(bool))
+    optimize_webp_quality = Optional(Type(int))
+    optimize_avif_quality = Optional(Type(int))
+
+# -----------------------------------------------------------------------------
+
 # Optimize plugin configuration
 class OptimizeConfig(Config):
     enabled = Type(bool, default = True)
@@ -41,11 +54,40 @@ class OptimizeConfig(Config):
     optimize_png = Type(bool, default = True)
     optimize_png_speed = Type(int, default = 3)
     optimize_png_strip = Type(bool, default = True)
+    optimize_png_quantizer = Choice(
+        ["pngquant", "pillow"], default = "pngquant"
+    )
+    optimize_png_batch = Type(int, default = 1)
     optimize_jpg = Type(bool, default = True)
     optimize_jpg_quality = Type(int, default = 60)
     optimize_jpg_progressive = Type(bool, default = True)
+    optimize_webp = Type(bool, default = False)
+    optimize_webp_quality = Type(int, default = 80)
+    optimize_avif = Type(bool, default = False)
+    optimize_avif_quality = Type(int, default = 60)
+    optimize_widths = ListOfItems(Type(int), default = [])
+    optimize_sizes = Optional(Type(str))
     optimize_include = ListOfItems(Type(str), default = [])
     optimize_exclude = ListOfItems(Type(str), default = [])
+    optimize_overrides = DictOfItems(
+        SubConfig(OptimizeOverrideConfig), default = {}
+    )
+
+    # Settings for minification
+    minify = Type(bool, default = False)
+    minify_html = Type(bool, default = True)
+    minify_css = Type(bool, default = True)
+    minify_js = Type(bool, default = True)
+    minify_svg = Type(bool, default = True)
+    minify_exclude = ListOfItems(
+        Type(str), default = ["assets/javascripts/lunr/*"]
+    )
+
+    # Settings for compression
+    compress = Type(bool, default = False)
+    compress_gzip = Type(bool, default = True)
+    compress_brotli = Type(bool, default = True)
+    compress_min_size = Type(int, default = 1024)
 
     # Settings for reporting
     print_gain = Type(bool, default = True)
@@ -21,29 +21,56 @@
 from __future__ import annotations
 
 import functools
+import gzip
 import json
 import logging
+import math
 import os
+import posixpath
+import re
 import subprocess
 import sys
+import threading
 
 from fnmatch import fnmatch
 from colorama import Fore, Style
 from concurrent.futures import Future
 from concurrent.futures.thread import ThreadPoolExecutor
 from hashlib import sha1
+from html import escape
 from mkdocs import utils
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.exceptions import PluginError
-from mkdocs.plugins import BasePlugin
+from mkdocs.plugins import BasePlugin, CombinedEvent, event_priority
 from mkdocs.structure.files import File
+from mkdocs.structure.pages import Page
+from re import Match
 from shutil import which
+from tempfile import TemporaryDirectory
+from urllib.parse import urlparse, unquote
 try:
-    from PIL import Image
+    from PIL import Image, features
+except ImportError:
+    pass
+try:
+    import csscompressor
+except ImportError:
+    pass
+try:
+    import htmlmin
+except ImportError:
+    pass
+try:
+    import jsmin
+except ImportError:
+    pass
+try:
+    import brotli
 except ImportError:
     pass
 
 from .config import OptimizeConfig
+from .parser import FragmentParser
 
 # -----------------------------------------------------------------------------
 # Classes
@@ -53,8 +80,9 @@ from .config import OptimizeConfig
 class OptimizePlugin(BasePlugin[OptimizeConfig]):
     supports_multiple_instances = True
 
-    # Manifest
-    manifest: dict[str, str] = {}
+    # Manifest, mapping keys of pages, assets, images, variants and side-cars
+    # to the hashes and settings they were processed with, see _key
+    manifest: dict[str, dict] = {}
 
     # Initialize plugin
     def __init__(self, *args, **kwargs):
@@ -71,11 +99,26 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
         self.pool = ThreadPoolExecutor(self.config.concurrency)
         self.pool_jobs: dict[str, Future] = {}
 
+        # Initialize mapping of images to jobs and generated variants
+        self.images: dict[str, Future] = {}
+        self.variants: dict[str, dict[str, list[int]]] = {}
+        self.widths: dict[str, list[int]] = {}
+        self.dimensions: dict[str, tuple[int, int]] = {}
+
     # Resolve and load manifest
     def on_config(self, config):
         if not self.config.enabled:
             return
 
+        # Initialize style sheets and scripts to minify, and minified sizes -
+        # this must happen on every build, or sizes of previous builds would
+        # be included in the summary when serving the site
+        self.assets: list[File] = []
+        self.minified: dict[str, tuple[int, int]] = {}
+
+        # Initialize compressed sizes
+        self.compressed: dict[str, tuple[int, int]] = {}
+
         # Resolve cache directory (once) - this is necessary, so the cache is
         # always relative to the configuration file, and thus project, and not
         # relative to the current working directory, or it would not work with
@@ -99,46 +142,135 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
         if os.path.isfile(self.manifest_file) and self.config.cache:
             try:
                 with open(self.manifest_file) as f:
-                    self.manifest = json.load(f)
+                    manifest: dict[str, dict] = json.load(f)
+
+                # Only keep entries with known kinds - manifests written by
+                # earlier versions of the plugin use keys without kinds, which
+                # may collide, so we consider those entries to be stale
+                self.manifest = {
+                    key: entry for key, entry in manifest.items()
+                        if key.partition(":")[0] in _manifest_kinds
+                }
             except:
                 pass
 
+        # Resolve quantizer and pngquant binary (once), as they're used for all
+        # PNG images - if pngquant is not available, fall back to pillow, so
+        # the build doesn't fail on systems where it can't be installed
+        self.quantizer = self.config.optimize_png_quantizer
+        self.pngquant  = None
+        if self.quantizer == "pngquant":
+            self.pngquant = which("pngquant")
+            if not self.pngquant and _supports("Image"):
+                self.quantizer = "pillow"
+                if self.config.optimize and self.config.optimize_png:
+                    log.info(
+                        "Couldn't find 'pngquant', falling back to 'pillow' "
+                        "for optimizing PNG images"
+                    )
+
+        # Retrieve versions of encoders (once), as they're part of the digests
+        # of the effective settings, so updating encoders invalidates images
+        self.versions = dict(
+            pngquant = _version_pngquant(self.pngquant),
+            pillow   = _version("Image")
+        )
+
+        # Compute digests of settings for minification, including the version
+        # of the minifier, so changing settings or updating minifiers only
+        # invalidates the minified files of the affected type. Digests of the
+        # settings for images are computed per file, see _settings.
+        self.settings = {
+            ".html": _digest(dict(htmlmin = _version("htmlmin"))),
+            ".css":  _digest(dict(csscompressor = _version("csscompressor"))),
+            ".js":   _digest(dict(jsmin = _version("jsmin"))),
+            ".svg":  _digest(dict(minify = self.config.minify_svg))
+        }
+
+        # Determine modern formats to generate variants of images in, ordered
+        # by preference, as browsers use the first source they support
+        self.formats = [
+            format for format in ["avif", "webp"]
+                if self.config[f"optimize_{format}"]
+        ]
+
     # Initialize optimization pipeline
     def on_env(self, env, *, config, files):
         if not self.config.enabled:
             return
 
-        # Skip if media files should not be optimized
-        if not self.config.optimize:
-            return
+        # Collect style sheets and scripts to minify - they are minified after
+        # the build, since they're copied to the site directory by MkDocs, and
+        # other plugins might still change them before that
+        if self.config.minify:
+            self.assets = [
+                file for file in files if self._is_minifiable(file)
+            ]
 
         # Filter all optimizable media files and steal reponsibility from MkDocs
-        # by removing them from the files collection. Then, start a concurrent
-        # job that checks if an image was already optimized and can be returned
+        # by removing them from the files collection. Then, start concurrent
+        # jobs that check if an image was already optimized and can be returned
         # from the cache, or optimize it accordingly.
+        batch: list[tuple[File, str, Future]] = []
         for file in files.media_files():
             if self._is_excluded(file):
                 continue
 
-            # Spawn concurrent job to optimize the given image and add future
-            # to job dictionary, as it returns the file we need to copy later
+            # Create future for the given image and add it to job dictionary,
+            # as it resolves to the file we need to copy later
             path = os.path.join(self.config.cache_dir, file.src_path)
-            self.pool_jobs[file.abs_src_path] = self.pool.submit(
-                self._optimize_image, file, path, config
-            )
+            self.pool_jobs[file.abs_src_path] = Future()
+            batch.append((file, path, self.pool_jobs[file.abs_src_path]))
+
+            # Remember job for image, so we can later rewrite references
+            self.images[file.dest_uri] = self.pool_jobs[file.abs_src_path]
 
             # Steal responsibility from MkDocs
             files.remove(file)
 
+        # Spawn concurrent jobs to optimize images in batches
+        for chunk in self._batch(batch):
+            self.pool.submit(self._optimize_images, chunk, config)
+
+    # Rewrite images to use variants, and minify page - this hook runs late,
+    # so that changes by other plugins are included in the minified page
+    @event_priority(-100)
+    def on_post_page(self, output, *, page, config):
+        if not self.config.enabled:
+            return
+
+        # Rewrite images, if variants should be generated
+        if self.config.optimize:
+            if self.formats or self.config.optimize_widths:
+                output = self._rewrite_images(output, page)
+
+        # Minify page, if desired
+        if self.config.minify and self.config.minify_html:
+            output = self._minify_page(output, page, config)
+
+        # Return page
+        return output
+
     # Finish optimization pipeline
-    def on_post_build(self, *, config):
+    def _on_post_build_optimize(self, *, config):
         if not self.config.enabled:
             return
 
-        # Skip if media files should not be optimized
-        if not self.config.optimize:
+        # Skip if media files should not be optimized or files minified
+        if not self.config.optimize and not self.config.minify:
             return
 
+        # Spawn concurrent jobs to minify style sheets and scripts, which are
+        # now in the site directory, and wait for them to finish
+        jobs: list[Future] = []
+        for file in self.assets:
+            jobs.append(self.pool.submit(self._minify_asset, file, config))
+
+        # Reconcile concurrent jobs
+        for future in jobs:
+            if future.exception():
+                raise future.exception()
+
         # Reconcile concurrent jobs - we need to wait for all jobs to finish
         # before we can copy the optimized files to the output directory. If an
         # exception occurred in one of the jobs, we raise it here, so the build
@@ -150,6 +282,21 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
                 file: File = future.result()
                 file.copy_file()
 
+                # Copy downscaled variants and variants in modern formats
+                for width in [None, *self.widths.get(file.dest_uri, [])]:
+                    src  = _path_to_width(file.abs_src_path, width)
+                    dest = _path_to_width(file.abs_dest_path, width)
+                    if width:
+                        utils.copy_file(src, dest)
+
+                    # Copy variants in modern formats
+                    variants = self.variants.get(file.dest_uri, {})
+                    for format, widths in variants.items():
+                        if not width or width in widths:
+                            utils.copy_file(
+                                f"{src}.{format}", f"{dest}.{format}"
+                            )
+
         # Save manifest if cache should be used
         if self.config.cache:
             with open(self.manifest_file, "w") as f:
@@ -161,7 +308,7 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
             print(f"  Optimizations:")
 
             # Print summary for file extension
-            for seek in [".png", ".jpg"]:
+            for seek in [".png", ".jpg", ".svg"]:
                 size = size_opt = 0
                 for path, future in self.pool_jobs.items():
                     file: File = future.result()
@@ -176,22 +323,99 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
                     size     += os.path.getsize(path)
                     size_opt += os.path.getsize(file.abs_dest_path)
 
-                # Compute absolute and relative gain
-                if size and size_opt:
-                    gain_abs = size - size_opt
-                    gain_rel = (1 - size_opt / size) * 100
-
-                    # Print summary for files
-                    print(
-                        f"    *{seek} {Fore.GREEN}{_size(size_opt)}"
-                        f"{Fore.WHITE}{Style.DIM} ↓ "
-                        f"{_size(gain_abs)} [{gain_rel:3.1f}%]"
-                        f"{Style.RESET_ALL}"
+                # Print summary for files
+                self._print_gain_summary(seek, size, size_opt)
+
+            # Print summary for variants in modern formats, which is computed
+            # relative to the optimized images they replace
+            for format in self.formats:
+                size = size_opt = 0
+                for path, future in self.pool_jobs.items():
+                    file: File = future.result()
+
+                    # Skip files without variant in the given format
+                    if format not in self.variants.get(file.dest_uri, []):
+                        continue
+
+                    # Compute size before and after conversion
+                    size     += os.path.getsize(file.abs_dest_path)
+                    size_opt += os.path.getsize(
+                        f"{file.abs_dest_path}.{format}"
                     )
 
+                # Print summary for variants
+                self._print_gain_summary(f".{format}", size, size_opt)
+
+            # Print summary for minified pages, style sheets and scripts
+            for seek in [".html", ".css", ".js"]:
+                size = size_opt = 0
+                for path, (value, value_opt) in self.minified.items():
+                    if path.endswith(seek):
+                        size     += value
+                        size_opt += value_opt
+
+                # Print summary for minified files
+                self._print_gain_summary(seek, size, size_opt)
+
+            # Reset all styles
+            print(Style.RESET_ALL)
+
+    # Compress files in site directory - this must happen after all other
+    # plugins wrote their files, e.g., the search index, which is why this
+    # handler runs after those with the lowest priority that we're using
+    @event_priority(-150)
+    def _on_post_build_compress(self, *, config):
+        if not self.config.enabled:
+            return
+
+        # Skip if files should not be compressed
+        if not self.config.compress:
+            return
+
+        # Spawn concurrent jobs to compress all compressible files
+        jobs: list[Future] = []
+        for root, _, names in os.walk(config.site_dir):
+            for name in names:
+                if name.endswith(_compressible):
+                    path = os.path.join(root, name)
+                    jobs.append(self.pool.submit(
+                        self._compress_file, path, config
+                    ))
+
+        # Reconcile concurrent jobs
+        for future in jobs:
+            if future.exception():
+                raise future.exception()
+
+        # Prune manifest entries of side-cars that don't exist anymore, e.g.,
+        # because the file was removed, and compressed files in the cache that
+        # are not referenced by any side-car, so the cache doesn't grow
+        self._prune_compressed(config)
+
+        # Compute and print gains through compression
+        if self.config.print_gain_summary:
+            print(Style.NORMAL)
+            print("  Compression:")
+
+            # Print summary for compression format
+            for seek in [".gz", ".br"]:
+                size = size_opt = 0
+                for path, (value, value_opt) in self.compressed.items():
+                    if path.endswith(seek):
+                        size     += value
+                        size_opt += value_opt
+
+                # Print summary for compressed files
+                self._print_gain_summary(seek, size, size_opt)
+
             # Reset all styles
             print(Style.RESET_ALL)
 
+    # Finish optimization pipeline and compress files
+    on_post_build = CombinedEvent(
+        _on_post_build_optimize, _on_post_build_compress
+    )
+
     # Save manifest on shutdown
     def on_shutdown(self):
         if not self.config.enabled:
@@ -211,25 +435,78 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
 
     # -------------------------------------------------------------------------
 
+    # Print gain summary for files of the given type
+    def _print_gain_summary(self, seek: str, size: int, size_opt: int):
+        if not size or not size_opt:
+            return
+
+        # Compute absolute and relative gain
+        gain_abs = size - size_opt
+        gain_rel = (1 - size_opt / size) * 100
+
+        # Print summary for files
+        print(
+            f"    *{seek} {Fore.GREEN}{_size(size_opt)}"
+            f"{Fore.WHITE}{Style.DIM} ↓ "
+            f"{_size(gain_abs)} [{gain_rel:3.1f}%]"
+            f"{Style.RESET_ALL}"
+        )
+
+    # -------------------------------------------------------------------------
+
     # Check if a file can be optimized
     def _is_optimizable(self, file: File):
 
         # Check if PNG images should be optimized
         if file.url.endswith((".png")):
-            return self.config.optimize_png
+            return self.config.optimize and self.config.optimize_png
 
         # Check if JPG images should be optimized
         if file.url.endswith((".jpg", ".jpeg")):
-            return self.config.optimize_jpg
+            return self.config.optimize and self.config.optimize_jpg
+
+        # Check if SVG images should be minified, which is independent of the
+        # optimization of other media files
+        if file.url.endswith(".svg"):
+            if self.config.minify and self.config.minify_svg:
+                return not self._is_minify_ignored(file)
 
         # File can not be optimized by the plugin
         return False
 
+    # Check if a file can be minified - files that are already minified, which
+    # includes the style sheets and scripts of the theme, are skipped
+    def _is_minifiable(self, file: File):
+        if file.url.endswith((".min.css", ".min.js")):
+            return False
+
+        # Check if file is excluded from minification through patterns
+        if self._is_ignored(file) or self._is_minify_ignored(file):
+            return False
+
+        # Check if style sheets should be minified
+        if file.url.endswith(".css"):
+            return self.config.minify_css
+
+        # Check if scripts should be minified
+        if file.url.endswith(".js"):
+            return self.config.minify_js
+
+        # File can not be minified by the plugin
+        return False
+
     # Check if the given file is excluded
     def _is_excluded(self, file: File):
         if not self._is_optimizable(file):
             return True
 
+        # Check if file is excluded through patterns
+        return self._is_ignored(file)
+
+    # Check if the given file is excluded through inclusion or exclusion
+    # patterns, which apply to media files, style sheets and scripts
+    def _is_ignored(self, file: File):
+
         # Check if file matches one of the inclusion patterns
         path = file.src_path
         if self.config.optimize_include:
@@ -250,49 +527,282 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
         # File is not excluded
         return False
 
+    # Check if the given file is excluded from minification through patterns,
+    # which by default excludes scripts vendored by the theme, e.g., for lunr
+    def _is_minify_ignored(self, file: File):
+        for pattern in self.config.minify_exclude:
+            if fnmatch(file.src_uri, pattern):
+                path = file.src_path
+                log.debug(f"Excluding file '{path}' due to minify patterns")
+                return True
+
+        # File is not excluded
+        return False
+
+    # Retrieve effective settings for the given file - settings of all patterns
+    # in optimize_overrides the file matches are applied in order of definition
+    def _options(self, file: File):
+        options = { name: self.config[name] for name in _overrides }
+        for pattern, override in self.config.optimize_overrides.items():
+            if not fnmatch(file.src_uri, pattern):
+                continue
+
+            # Apply settings that are set for pattern
+            for name, value in override.items():
+                if value is not None:
+                    options[name] = value
+
+        # Return effective settings
+        return options
+
+    # Retrieve digest of effective settings for the given file, or for the
+    # variant of the file with the given extension, i.e., a modern format
+    def _settings(self, file: File, extension: str | None = None):
+        if not extension:
+            _, extension = os.path.splitext(file.url)
+            extension = ".jpg" if extension == ".jpeg" else extension
+
+        # Return digest of settings for minification
+        if extension in self.settings:
+            return self.settings[extension]
+
+        # Compute settings for PNG images, which depend on the quantizer - if
+        # pillow is used, the speed and strip settings don't apply
+        options = self._options(file)
+        if extension == ".png":
+            if self.quantizer == "pillow":
+                return _digest(dict(
+                    quantizer = "pillow",
+                    pillow    = self.versions["pillow"]
+                ))
+
+            # Compute settings for pngquant
+            return _digest(dict(
+                speed    = options["optimize_png_speed"],
+                strip    = options["optimize_png_strip"],
+                pngquant = self.versions["pngquant"]
+            ))
+
+        # Compute settings for JPG images
+        if extension == ".jpg":
+            return _digest(dict(
+                quality     = options["optimize_jpg_quality"],
+                progressive = options["optimize_jpg_progressive"],
+                pillow      = self.versions["pillow"]
+            ))
+
+        # Compute settings for images in modern formats
+        if extension in [".webp", ".avif"]:
+            return _digest(dict(
+                quality = options[f"optimize_{extension[1:]}_quality"],
+                pillow  = self.versions["pillow"]
+            ))
+
+    # Split images into batches - PNG images are batched if desired, so they
+    # can be passed to pngquant in a single invocation, and are distributed
+    # evenly across workers. All other images are optimized one by one.
+    def _batch(self, batch: list[tuple[File, str, Future]]):
+        png: dict[str, list[tuple[File, str, Future]]] = {}
+        for item in batch:
+            file, _, _ = item
+            if file.url.endswith((".png")):
+                png.setdefault(self._settings(file), []).append(item)
+            else:
+                yield [item]
+
+        # Compute batch size for PNG images, if pngquant is used
+        size = 1
+        if self.pngquant and self.config.optimize_png_batch > 1:
+            total = sum(len(group) for group in png.values())
+            size = math.ceil(total / self.config.concurrency)
+            size = max(1, min(size, self.config.optimize_png_batch))
+
+        # Yield batches of PNG images - images are grouped by their effective
+        # settings, as all images of a batch are passed to a single invocation
+        for group in png.values():
+            for index in range(0, len(group), size):
+                yield group[index:index + size]
+
+    # Optimize images and write to cache - all images of a batch that changed
+    # are optimized together, and the future of each image is resolved with
+    # the file that is copied from the cache, or the error that occurred
+    def _optimize_images(
+        self, batch: list[tuple[File, str, Future]], config: MkDocsConfig
+    ):
+        try:
+            checks = [self._check_image(file, path) for file, path, _ in batch]
+
+            # Collect images that changed, so we need to optimize them again
+            stale: list[tuple[File, str]] = []
+            for (file, path, _), (_, changed) in zip(batch, checks):
+                if changed:
+                    stale.append((file, path))
+
+            # Optimize PNG images of a batch in a single invocation of pngquant,
+            # or a single image using the respective optimizer
+            if len(batch) > 1:
+                self._optimize_image_png_batch(stale, config)
+            else:
+                for file, path in stale:
+                    self._optimize_image(file, path, config)
+
+            # Print how much we gained for each image that was optimized
+            for file, path in stale:
+                self._print_gain(file, path)
+
+            # Finish optimization and resolve futures
+            for (file, path, future), (entry, _) in zip(batch, checks):
+                future.set_result(self._finish_image(file, path, entry, config))
+
+        # Resolve futures that are still pending with the error
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    # Check if image changed since the last build - returns the manifest entry
+    # for the image, and whether it needs to be optimized again
+    def _check_image(self, file: File, path: str):
+        stat = _stat(file.abs_src_path)
+
+        # Retrieve previous manifest entry for image
+        prev = self.manifest.get(_key("image", file.url), {})
+
+        # Check if file stat signature changed - if size, modification time and
+        # inode are the same as in the last build, we consider the file to be
+        # unchanged, and skip reading and hashing it entirely
+        if stat == prev.get("stat"):
+            hash = prev.get("hash")
+        else:
+            hash = _hash(file.abs_src_path)
+
+        # Check if file hash or settings changed, so we need to optimize again
+        settings = self._settings(file)
+        changed = (
+            hash != prev.get("hash") or settings != prev.get("settings") or
+            not os.path.isfile(path)
+        )
+
+        # Retain dimensions of image, if the file didn't change
+        dimensions = None
+        if hash == prev.get("hash"):
+            dimensions = prev.get("dimensions")
+
+        # Return manifest entry and whether image changed
+        entry = dict(
+            hash = hash, stat = stat, settings = settings,
+            dimensions = dimensions
+        )
+        return entry, changed
+
     # Optimize image and write to cache
     def _optimize_image(self, file: File, path: str, config: MkDocsConfig):
-        with open(file.abs_src_path, "rb") as f:
-            data = f.read()
-            hash = sha1(data).hexdigest()
+        os.makedirs(os.path.dirname(path), exist_ok = True)
 
-            # Check if file hash changed, so we need to optimize again
-            prev = self.manifest.get(file.url, "")
-            if hash != prev or not os.path.isfile(path):
-                os.makedirs(os.path.dirname(path), exist_ok = True)
+        # Optimize PNG image using pngquant or pillow
+        if file.url.endswith((".png")):
+            self._optimize_image_png(file, path, config)
 
-                # Optimize PNG image using pngquant
-                if file.url.endswith((".png")):
-                    self._optimize_image_png(file, path, config)
-
-                # Optimize JPG image using pillow
-                if file.url.endswith((".jpg", ".jpeg")):
-                    self._optimize_image_jpg(file, path, config)
-
-                # Compute size before and after optimization
-                size     = len(data)
-                size_opt = os.path.getsize(path)
-
-                # Compute absolute and relative gain
-                gain_abs = size - size_opt
-                gain_rel = (1 - size_opt / size) * 100
-
-                # Print how much we gained, if we did and desired
-                gain = ""
-                if gain_abs and self.config.print_gain:
-                    gain += " ↓ "
-                    gain += " ".join([_size(gain_abs), f"[{gain_rel:3.1f}%]"])
-
-                # Print summary for file
-                log.info(
-                    f"Optimized media file: {file.src_uri} "
-                    f"{Fore.GREEN}{_size(size_opt)}"
-                    f"{Fore.WHITE}{Style.DIM}{gain}"
-                    f"{Style.RESET_ALL}"
-                )
+        # Optimize JPG image using pillow
+        if file.url.endswith((".jpg", ".jpeg")):
+            self._optimize_image_jpg(file, path, config)
+
+        # Minify SVG image
+        if file.url.endswith(".svg"):
+            with open(file.abs_src_path, encoding = "utf-8") as f:
+                data = self._minify(f.read(), ".svg", file.src_uri, config)
+
+            # Write minified image to cache
+            _save_to_file(path, data)
+
+    # Print how much we gained through optimization of image
+    def _print_gain(self, file: File, path: str):
+
+        # Compute size before and after optimization
+        size     = os.path.getsize(file.abs_src_path)
+        size_opt = os.path.getsize(path)
+
+        # Compute absolute and relative gain
+        gain_abs = size - size_opt
+        gain_rel = (1 - size_opt / size) * 100
+
+        # Print how much we gained, if we did and desired
+        gain = ""
+        if gain_abs and self.config.print_gain:
+            gain += " ↓ "
+            gain += " ".join([_size(gain_abs), f"[{gain_rel:3.1f}%]"])
+
+        # Print summary for file
+        log.info(
+            f"Optimized media file: {file.src_uri} "
+            f"{Fore.GREEN}{_size(size_opt)}"
+            f"{Fore.WHITE}{Style.DIM}{gain}"
+            f"{Style.RESET_ALL}"
+        )
 
-                # Update manifest by associating file with hash
-                self.manifest[file.url] = hash
+    # Finish optimization of image, and generate variants if desired
+    def _finish_image(
+        self, file: File, path: str, entry: dict, config: MkDocsConfig
+    ):
+        hash = entry["hash"]
+
+        # Update manifest by associating file with hash, stat signature and
+        # digest of the settings that were used for optimization
+        self.manifest[_key("image", file.url)] = entry
+
+        # Skip generation of variants for vector images
+        if file.url.endswith(".svg"):
+            return self._point_to_cache(file, path, config)
+
+        # Determine dimensions of image, if images are rewritten, so we can add
+        # intrinsic dimensions - they're part of the manifest, so we don't need
+        # to open the image again if it didn't change
+        dimensions = None
+        if self.formats or self.config.optimize_widths:
+            if not entry["dimensions"]:
+                entry["dimensions"] = self._open_image(file, config).size
+
+            # Use dimensions of image
+            dimensions = entry["dimensions"]
+
+        # Generate variants of image in modern formats, and remember those
+        # that are smaller than the optimized image, as only those are used
+        variants: dict[str, list[int]] = {}
+        for format in self.formats:
+            if self._convert_image(file, path, hash, format, config):
+                variants[format] = []
+
+        # Generate downscaled variants of image for all widths that are smaller
+        # than the image itself, including variants in modern formats, and
+        # remember the widths for which the variant is smaller, as the source
+        # set falls back to the downscaled image for all other widths
+        widths = []
+        if dimensions:
+            for width in sorted(set(self.config.optimize_widths)):
+                if width >= dimensions[0]:
+                    continue
+
+                # Generate downscaled variant and variants in modern formats
+                self._resize_image(file, path, hash, width, config)
+                for format in variants:
+                    if self._convert_image(
+                        file, path, hash, format, config, width
+                    ):
+                        variants[format].append(width)
+
+                # Remember width
+                widths.append(width)
+
+        # Associate image with variants, widths and dimensions
+        self.variants[file.dest_uri]   = variants
+        self.widths[file.dest_uri]     = widths
+        self.dimensions[file.dest_uri] = dimensions
+        return self._point_to_cache(file, path, config)
+
+    # Point file to optimized image in cache
+    def _point_to_cache(
+        self, file: File, path: str, config: MkDocsConfig
+    ):
 
         # Compute project root
         root = os.path.dirname(config.config_file_path)
@@ -304,41 +814,365 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
         # Return file to be copied from cache
         return file
 
+    # Convert image to modern format and write to cache - returns whether the
+    # variant is smaller than the optimized image, and thus should be used. If
+    # a width is given, the downscaled variant of the image is converted.
+    def _convert_image(
+        self, file: File, path: str, hash: str, format: str,
+        config: MkDocsConfig, width: int | None = None
+    ):
+        path = _path_to_width(path, width)
+        dest = f"{path}.{format}"
+
+        # Retrieve previous manifest entry for variant
+        key  = _key("variant", f"{_path_to_width(file.url, width)}.{format}")
+        prev = self.manifest.get(key, {})
+
+        # Check if file hash or settings changed, so we need to convert again
+        settings = self._settings(file, f".{format}")
+        if (
+            hash != prev.get("hash") or settings != prev.get("settings") or
+            not os.path.isfile(dest)
+        ):
+
+            # Open image and check if pillow supports the given format, and
+            # raise an error to the caller, so he can decide what to do
+            image = self._open_image(file, config, width)
+            if not features.check(format):
+                docs = os.path.relpath(config.docs_dir)
+                path = os.path.relpath(file.abs_src_path, docs)
+                raise PluginError(
+                    f"Couldn't convert image '{path}' in '{docs}' to "
+                    f"'{format}': make sure 'pillow' supports the format"
+                )
+
+            # Save image in modern format
+            options = self._options(file)
+            image.save(dest, format,
+                quality = options[f"optimize_{format}_quality"]
+            )
+
+            # Update manifest by associating variant with hash and digest of
+            # the settings that were used for conversion
+            self.manifest[key] = dict(hash = hash, settings = settings)
+
+        # Check if variant is smaller than optimized image
+        return os.path.getsize(dest) < os.path.getsize(path)
+
+    # Downscale image to the given width and write to cache
+    def _resize_image(
+        self, file: File, path: str, hash: str, width: int,
+        config: MkDocsConfig
+    ):
+        dest = _path_to_width(path, width)
+
+        # Retrieve previous manifest entry for downscaled variant
+        key  = _key("variant", _path_to_width(file.url, width))
+        prev = self.manifest.get(key, {})
+
+        # Check if file hash or settings changed, so we need to resize again
+        settings = self._settings(file)
+        if (
+            hash == prev.get("hash") and settings == prev.get("settings") and
+            os.path.isfile(dest)
+        ):
+            return
+
+        # Downscale PNG image and optimize it using pngquant - we write the
+        # downscaled image to a temporary file first, which is then used as
+        # the source for optimization
+        image = self._open_image(file, config, width)
+        if file.url.endswith((".png")):
+            temp = f"{dest}.tmp"
+            image.save(temp, "png")
+            try:
+                self._optimize_image_png(file, dest, config, temp)
+            finally:
+                os.remove(temp)
+
+        # Downscale JPG image and optimize it using pillow
+        if file.url.endswith((".jpg", ".jpeg")):
+            options = self._options(file)
+            image.save(dest, "jpeg",
+                quality     = options["optimize_jpg_quality"],
+                progressive = options["optimize_jpg_progressive"]
+            )
+
+        # Update manifest by associating variant with hash and digest of the
+        # settings that were used for optimization
+        self.manifest[key] = dict(hash = hash, settings = settings)
+
+    # Open image, and downscale it to the given width, if any
+    def _open_image(
+        self, file: File, config: MkDocsConfig, width: int | None = None
+    ):
+
+        # Check if the required dependencies for converting are available,
+        # which is, at the absolute minimum, the 'pillow' package, and raise an
+        # error to the caller, so he can decide what to do with the error
+        if not _supports("Image"):
+            docs = os.path.relpath(config.docs_dir)
+            path = os.path.relpath(file.abs_src_path, docs)
+            raise PluginError(
+                f"Couldn't process image '{path}' in '{docs}': install "
+                f"required dependencies – pip install 'mkdocs-material[imaging]'"
+            )
+
+        # Open image and downscale it, keeping the aspect ratio
+        image = Image.open(file.abs_src_path)
+        if width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+
+        # Return image
+        return image
+
+    # Wait for the job of the image with the given path - as variants are
+    # generated concurrently, we need to wait for the job to finish
+    def _wait(self, path: str):
+        future = self.images.get(path)
+        if not future or future.exception():
+            return False
+
+        # Job finished successfully
+        return True
+
+    # Rewrite images to use variants - images are wrapped in a picture element,
+    # with a source for each variant in a modern format that was generated and
+    # is smaller than the optimized image, so browsers can pick the best one.
+    # If downscaled variants were generated, they're added as source sets.
+    def _rewrite_images(self, output: str, page: Page):
+
+        # Replace callback
+        def replace(match: Match):
+            if match.group(1):
+                return match.group()
+
+            # Parse image
+            el = self._parse_fragment(match.group())
+            if el is None:
+                return match.group()
+
+            # Skip images that are not relative to the page
+            url = urlparse(el.get("src", ""))
+            if url.scheme or url.netloc or url.path.startswith("/"):
+                return match.group()
+
+            # Resolve image relative to page and wait for its job
+            base = posixpath.dirname(page.file.url)
+            path = posixpath.normpath(posixpath.join(base, unquote(url.path)))
+            if not self._wait(path):
+                return match.group()
+
+            # Retrieve variants, widths and dimensions of image
+            variants   = self.variants.get(path, {})
+            widths     = self.widths.get(path, [])
+            dimensions = self.dimensions.get(path)
+
+            # Compute source set for the given format - if the variant of a
+            # downscaled image is not smaller, the downscaled image is used
+            def srcset(format: str | None = None):
+                suffix = f".{format}" if format else ""
+                if not widths:
+                    return f"{url.path}{suffix}"
+
+                # Add downscaled variants and the image itself
+                candidates = []
+                for width in widths:
+                    value = _path_to_width(url.path, width)
+                    if not format or width in variants[format]:
+                        value += suffix
+
+                    # Add downscaled variant
+                    candidates.append(f"{value} {width}w")
+
+                # Add image itself
+                candidates.append(f"{url.path}{suffix} {dimensions[0]}w")
+                return ", ".join(candidates)
+
+            # Retrieve width and height set by the author - if the width is set
+            # in pixels, the image is rendered at that width, so we use it as
+            # the size, as browsers would otherwise assume the viewport width
+            width  = el.get("width") or ""
+            height = el.get("height") or ""
+            sizes  = self.config.optimize_sizes
+            if width.isdigit():
+                sizes = f"{width}px"
+
+            # Compute attributes for source set
+            attrs = {}
+            if widths and "srcset" not in el.attrib:
+                attrs["srcset"] = srcset()
+                if sizes:
+                    attrs["sizes"] = sizes
+
+            # Compute intrinsic size - if the author set one of width or height
+            # in pixels, the other is computed from the aspect ratio
+            if dimensions:
+                w, h = dimensions
+                if not width and not height:
+                    attrs["width"], attrs["height"] = w, h
+                elif width.isdigit() and not height:
+                    attrs["height"] = max(1, round(int(width) * h / w))
+                elif height.isdigit() and not width:
+                    attrs["width"] = max(1, round(int(height) * w / h))
+
+            # Add attributes to image
+            data = match.group()
+            if attrs:
+                value = "".join(
+                    f" {name}=\"{escape(str(value))}\""
+                        for name, value in attrs.items()
+                )
+                data = re.sub(r"\s*/?>$", lambda end: value + end.group(), data)
+
+            # Return image, if there are no variants in modern formats
+            if not variants:
+                return data
+
+            # Wrap image in picture element with a source for each variant
+            sources = []
+            for format in variants:
+                value = f"type=\"image/{format}\" "
+                value += f"srcset=\"{escape(srcset(format))}\""
+                if widths and sizes:
+                    value += f" sizes=\"{escape(sizes)}\""
+
+                # Add source for variant
+                sources.append(f"<source {value}>")
+
+            # Return picture element
+            return "".join(["<picture>", *sources, data, "</picture>"])
+
+        # Find and replace all images that are not yet in a picture element
+        return re.sub(
+            r"(<picture[\s\S]*?</picture>)|<img[^>]+>",
+            replace, output, flags = re.I | re.M
+        )
+
+    # Parse a fragment
+    def _parse_fragment(self, fragment: str):
+        parser = FragmentParser()
+        parser.feed(fragment)
+        parser.close()
+
+        # Return element
+        return parser.result
+
     # Optimize PNG image - we first tried to use libimagequant, but encountered
     # the occassional segmentation fault, which means it's probably not a good
     # choice. Instead, we just rely on pngquant which seems much more stable.
-    def _optimize_image_png(self, file: File, path: str, config: MkDocsConfig):
+    # If pngquant is not available, pillow can be used for quantization.
+    def _optimize_image_png(
+        self, file: File, path: str, config: MkDocsConfig,
+        source: str | None = None
+    ):
+        source = source or file.abs_src_path
+        if self.quantizer == "pillow":
+            return self._optimize_image_png_pillow(file, path, config, source)
+
+        # Set input file and run, then check if pngquant actually wrote a file,
+        # as we instruct it not to if the size of the optimized file is larger.
+        # This can happen if files are already compressed and optimized by
+        # the author. In that case, just copy the original file.
+        args = self._args_pngquant(file, config)
+        subprocess.run([*args, "--output", path, source])
+        if not os.path.isfile(path):
+            utils.copy_file(source, path)
+
+    # Optimize PNG images in a single invocation of pngquant - as pngquant can
+    # only write multiple files next to their inputs, we link all images into a
+    # temporary directory inside the cache, and move the results into place
+    def _optimize_image_png_batch(
+        self, batch: list[tuple[File, str]], config: MkDocsConfig
+    ):
+        if not batch:
+            return
+
+        # Build command line arguments
+        file, _ = batch[0]
+        args = self._args_pngquant(file, config)
+
+        # Link images into temporary directory, and run pngquant on all of them
+        with TemporaryDirectory(dir = self.config.cache_dir) as temp:
+            inputs = []
+            for index, (file, _) in enumerate(batch):
+                inputs.append(os.path.join(temp, f"{index}.png"))
+                _link(file.abs_src_path, inputs[-1])
+
+            # Run pngquant, writing results with a custom extension
+            subprocess.run([*args, "--ext", ".opt.png", *inputs])
+
+            # Move optimized images into place, and check if pngquant actually
+            # wrote a file, as it doesn't if the optimized file is larger
+            for index, (file, path) in enumerate(batch):
+                os.makedirs(os.path.dirname(path), exist_ok = True)
+                result = os.path.join(temp, f"{index}.opt.png")
+                if os.path.isfile(result):
+                    os.replace(result, path)
+                else:
+                    utils.copy_file(file.abs_src_path, path)
+
+    # Optimize PNG image using pillow - the image is quantized to a palette of
+    # 256 colors, and the original file is used if the result is larger
+    def _optimize_image_png_pillow(
+        self, file: File, path: str, config: MkDocsConfig, source: str
+    ):
+        if source == file.abs_src_path:
+            image = self._open_image(file, config)
+
+        # Open downscaled image instead, if a different source is given - the
+        # dependencies were already checked when the image was downscaled
+        else:
+            image = Image.open(source)
+
+        # Convert image to a mode that supports quantization - images with an
+        # alpha channel can only be quantized with the fast octree method
+        if image.mode not in ["RGB", "RGBA"]:
+            image = image.convert("RGBA")
+
+        # Determine quantization method for image
+        method = Image.Quantize.MEDIANCUT
+        if image.mode == "RGBA":
+            method = Image.Quantize.FASTOCTREE
+
+        # Quantize and save image - metadata is not retained by pillow
+        image = image.quantize(256, method = method)
+        image.save(path, "png", optimize = True)
+
+        # Use original file if the optimized file is larger
+        if os.path.getsize(path) >= os.path.getsize(source):
+            utils.copy_file(source, path)
+
+    # Build command line arguments for pngquant
+    def _args_pngquant(self, file: File, config: MkDocsConfig):
 
         # Check if the required dependencies for optimizing are available, which
         # is, at the absolute minimum, the 'pngquant' binary, and raise an error
         # to the caller, so he can decide what to do with the error. The caller
         # can treat this as a warning or an error to abort the build.
-        if not which("pngquant"):
+        if not self.pngquant:
             docs = os.path.relpath(config.docs_dir)
             path = os.path.relpath(file.abs_src_path, docs)
             raise PluginError(
                 f"Couldn't optimize image '{path}' in '{docs}': 'pngquant' "
-                f"not found. Make sure 'pngquant' is installed and in your path"
+                f"not found. Make sure 'pngquant' is installed and in your "
+                f"path, or install 'pillow' to use it for quantization"
             )
 
         # Build command line arguments
-        args = ["pngquant",
+        options = self._options(file)
+        args = [self.pngquant,
             "--force", "--skip-if-larger",
-            "--output", path,
-            "--speed", f"{self.config.optimize_png_speed}"
+            "--speed", f"{options['optimize_png_speed']}"
         ]
 
         # Add flag to remove optional metadata
-        if self.config.optimize_png_strip:
+        if options["optimize_png_strip"]:
             args.append("--strip")
 
-        # Set input file and run, then check if pngquant actually wrote a file,
-        # as we instruct it not to if the size of the optimized file is larger.
-        # This can happen if files are already compressed and optimized by
-        # the author. In that case, just copy the original file.
-        subprocess.run([*args, file.abs_src_path])
-        if not os.path.isfile(path):
-            utils.copy_file(file.abs_src_path, path)
+        # Return command line arguments
+        return args
 
     # Optimize JPG image
     def _optimize_image_jpg(self, file: File, path: str, config: MkDocsConfig):
@@ -356,12 +1190,216 @@ class OptimizePlugin(BasePlugin[OptimizeConfig]):
             )
 
         # Open and save optimized image
+        options = self._options(file)
         image = Image.open(file.abs_src_path)
         image.save(path, "jpeg",
-            quality     = self.config.optimize_jpg_quality,
-            progressive = self.config.optimize_jpg_progressive
+            quality     = options["optimize_jpg_quality"],
+            progressive = options["optimize_jpg_progressive"]
         )
 
+    # -------------------------------------------------------------------------
+
+    # Minify page - pages are minified synchronously, as the minifiers are pure
+    # Python, so we would not gain anything from using the thread pool here
+    def _minify_page(self, output: str, page: Page, config: MkDocsConfig):
+        if self._is_ignored(page.file) or self._is_minify_ignored(page.file):
+            return output
+
+        # Minify page and write to cache
+        path = os.path.join(self.config.cache_dir, page.file.dest_uri)
+        return self._minify_data(output, path, page.file, config)
+
+    # Minify style sheet or script in site directory - the file is replaced,
+    # and not written in-place, as it might be a link to a file in a cache
+    def _minify_asset(self, file: File, config: MkDocsConfig):
+        with open(file.abs_dest_path, encoding = "utf-8") as f:
+            data = f.read()
+
+        # Minify style sheet or script and write to cache
+        path = os.path.join(self.config.cache_dir, file.dest_uri)
+        data_opt = self._minify_data(data, path, file, config)
+
+        # Replace file in site directory, if it changed
+        if data_opt != data:
+            _save_to_file(file.abs_dest_path, data_opt)
+
+    # Minify data of the given file, or return minified data from the cache,
+    # if neither the data nor the settings changed since the last build
+    def _minify_data(
+        self, data: str, path: str, file: File, config: MkDocsConfig
+    ):
+        _, extension = os.path.splitext(file.dest_uri)
+
+        # Retrieve previous manifest entry for page or asset
+        kind = "page" if file.is_documentation_page() else "asset"
+        prev = self.manifest.get(_key(kind, file.dest_uri), {})
+        hash = sha1(data.encode("utf-8")).hexdigest()
+
+        # Check if data or settings changed, so we need to minify again
+        settings = self.settings[extension]
+        if (
+            hash == prev.get("hash") and settings == prev.get("settings") and
+            os.path.isfile(path)
+        ):
+            with open(path, encoding = "utf-8") as f:
+                data_opt = f.read()
+
+        # Minify data and write to cache
+        else:
+            data_opt = self._minify(data, extension, file.src_uri, config)
+            _save_to_file(path, data_opt)
+
+            # Update manifest by associating file with hash and digest of the
+            # settings that were used for minification
+            self.manifest[_key(kind, file.dest_uri)] = dict(
+                hash = hash, settings = settings
+            )
+
+        # Remember size before and after minification
+        self.minified[file.dest_uri] = (
+            len(data.encode("utf-8")), len(data_opt.encode("utf-8"))
+        )
+
+        # Return minified data
+        return data_opt
+
+    # Minify data using the minifier for the given extension
+    def _minify(
+        self, data: str, extension: str, path: str, config: MkDocsConfig
+    ):
+
+        # Minify SVG image - there's no pure Python minifier for SVG, so we
+        # implement a conservative minification ourselves
+        if extension == ".svg":
+            return _minify_svg(data)
+
+        # Minify page using htmlmin - we keep quotes around attribute values,
+        # as other tools might extract URLs from pages with simple expressions
+        if extension == ".html" and _supports("htmlmin"):
+            return htmlmin.minify(data,
+                remove_comments = True,
+                remove_optional_attribute_quotes = False
+            )
+
+        # Minify style sheet using csscompressor
+        if extension == ".css" and _supports("csscompressor"):
+            return csscompressor.compress(data)
+
+        # Minify script using jsmin, which must also handle template literals
+        if extension == ".js" and _supports("jsmin"):
+            return jsmin.jsmin(data, quote_chars = "'\"`")
+
+        # Otherwise, the required dependencies for minifying are not available,
+        # so raise an error to the caller, so he can decide what to do with the
+        # error. The caller can treat this as a warning or an error to abort.
+        docs = os.path.relpath(config.docs_dir)
+        raise PluginError(
+            f"Couldn't minify file '{path}' in '{docs}': install required "
+            f"dependencies – pip install 'mkdocs-material[recommended]'"
+        )
+
+    # -------------------------------------------------------------------------
+
+    # Compress file in site directory, and write side-cars next to it - files
+    # are compressed at maximum level, and cached by content hash, so files
+    # that didn't change are not compressed again in subsequent builds
+    def _compress_file(self, path: str, config: MkDocsConfig):
+        with open(path, "rb") as f:
+            data = f.read()
+            hash = sha1(data).hexdigest()
+
+        # Compress file in each enabled format
+        for extension, enabled in [
+            (".gz", self.config.compress_gzip),
+            (".br", self.config.compress_brotli)
+        ]:
+            if not enabled:
+                continue
+
+            # Compute path to side-car, and key of side-car in manifest
+            dest = f"{path}{extension}"
+            key  = _key("compressed", os.path.relpath(dest, config.site_dir))
+
+            # Skip files that already have a side-car that was not written by
+            # the plugin, e.g., the sitemap, which is compressed by MkDocs
+            if os.path.isfile(dest) and key not in self.manifest:
+                continue
+
+            # Remove side-car and skip files below the size threshold, as the
+            # side-car might be left over from a previous build
+            if len(data) < self.config.compress_min_size:
+                if os.path.isfile(dest):
+                    os.remove(dest)
+                self.manifest.pop(key, None)
+                continue
+
+            # Compress file and write to cache, if not already cached
+            cache = os.path.join(
+                self.config.cache_dir, "compress", hash[:2],
+                f"{hash}{extension}"
+            )
+            if not os.path.isfile(cache):
+                _save_to_file(cache, self._compress(data, extension, path))
+
+            # Link side-car to cache, if it's smaller than the file
+            size_opt = os.path.getsize(cache)
+            if size_opt < len(data):
+                _link(cache, dest)
+                self.compressed[dest] = (len(data), size_opt)
+
+                # Update manifest by associating side-car with hash, so we know
+                # that we wrote it, and which file in the cache it links to
+                self.manifest[key] = dict(hash = hash)
+
+            # Otherwise, remove side-car left over from a previous build
+            else:
+                if os.path.isfile(dest):
+                    os.remove(dest)
+                self.manifest.pop(key, None)
+
+    # Prune manifest entries of side-cars that don't exist anymore, and remove
+    # compressed files from the cache that are not referenced by side-cars
+    def _prune_compressed(self, config: MkDocsConfig):
+        hashes: set[str] = set()
+        for key, entry in list(self.manifest.items()):
+            kind, _, path = key.partition(":")
+            if kind != "compressed":
+                continue
+
+            # Remove entry, if side-car doesn't exist anymore
+            if not os.path.isfile(os.path.join(config.site_dir, path)):
+                del self.manifest[key]
+            else:
+                hashes.add(f"{entry['hash']}{os.path.splitext(path)[1]}")
+
+        # Remove compressed files that are not referenced anymore
+        base = os.path.join(self.config.cache_dir, "compress")
+        for root, _, names in os.walk(base):
+            for name in names:
+                if name not in hashes:
+                    os.remove(os.path.join(root, name))
+
+    # Compress data in the given format
+    def _compress(self, data: bytes, extension: str, path: str):
+
+        # Compress data using gzip - we don't set a modification time, so the
+        # result only depends on the data
+        if extension == ".gz":
+            return gzip.compress(data, compresslevel = 9, mtime = 0)
+
+        # Check if the required dependencies for compressing are available,
+        # which is the 'brotli' package, and raise an error to the caller, so
+        # he can decide what to do with the error
+        if not _supports("brotli"):
+            path = os.path.relpath(path)
+            raise PluginError(
+                f"Couldn't compress file '{path}': 'brotli' not found. Make "
+                f"sure 'brotli' is installed, or set 'compress_brotli: false'"
+            )
+
+        # Compress data using brotli
+        return brotli.compress(data, quality = 11)
+
 # -----------------------------------------------------------------------------
 # Helper functions
 # -----------------------------------------------------------------------------
@@ -373,6 +1411,111 @@ def _supports(name: str):
 
 # -----------------------------------------------------------------------------
 
+# Compute key of manifest entry for the given kind and path, so entries of
+# different kinds, e.g., pages and images, can never collide
+def _key(kind: str, path: str):
+    return f"{kind}:{path}"
+
+# Compute digest of the given settings
+def _digest(settings: dict):
+    data = json.dumps(settings, sort_keys = True)
+    return sha1(data.encode("utf-8")).hexdigest()
+
+# Retrieve version of pngquant, if available - the version is cached for each
+# binary, so we don't spawn a process every time the configuration is reloaded
+@functools.lru_cache(maxsize = None)
+def _version_pngquant(binary: str | None):
+    if not binary:
+        return None
+
+    # Run pngquant and return version
+    res = subprocess.run(
+        [binary, "--version"],
+        capture_output = True, text = True
+    )
+    return res.stdout.strip()
+
+# Retrieve version of optional import, if available
+def _version(name: str):
+    if not _supports(name):
+        return None
+
+    # Return version of module
+    return getattr(globals()[name], "__version__", None)
+
+# -----------------------------------------------------------------------------
+
+# Minify SVG image - comments are removed, and whitespace is collapsed, but we
+# only remove whitespace between elements, if there's no text element, as it's
+# significant there. Images containing scripts are returned unchanged.
+def _minify_svg(data: str):
+    if "<script" in data:
+        return data
+
+    # Remove comments and collapse whitespace
+    data = re.sub(r"<!--[\s\S]*?-->", "", data)
+    if "<text" not in data:
+        data = re.sub(r">\s+<", "><", data)
+
+    # Return minified image
+    return re.sub(r"\s+", " ", data).strip()
+
+# Save data to file - the data is written to a temporary file, which then
+# replaces the file, so files that are linked to other files are not changed.
+# The temporary file is unique to the thread, as cached files are addressed by
+# content, which means the same file might be written by multiple threads.
+def _save_to_file(path: str, data: str | bytes):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    # Write data to temporary file
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    temp = f"{path}.{threading.get_ident()}.tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+
+    # Replace file
+    os.replace(temp, path)
+
+# Compute path to downscaled variant of image with the given width
+def _path_to_width(path: str, width: int | None):
+    if not width:
+        return path
+
+    # Insert width before extension
+    root, extension = os.path.splitext(path)
+    return f"{root}.{width}w{extension}"
+
+# Link file, or copy it if linking is not possible, e.g., across file systems -
+# the link is created as a temporary file, which then replaces the file, so an
+# existing file that is linked to another file is never written in-place
+def _link(path: str, dest: str):
+    if os.path.isfile(dest) and os.path.samefile(path, dest):
+        return
+
+    # Link or copy file to temporary file
+    temp = f"{dest}.{threading.get_ident()}.tmp"
+    try:
+        os.link(path, temp)
+    except OSError:
+        utils.copy_file(path, temp)
+
+    # Replace file
+    os.replace(temp, dest)
+
+# Compute hash of file
+def _hash(path: str):
+    with open(path, "rb") as f:
+        return sha1(f.read()).hexdigest()
+
+# Compute stat signature of file, which consists of size, modification time in
+# nanoseconds and inode - if any of those change, the file must be re-hashed
+def _stat(path: str):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+# -----------------------------------------------------------------------------
+
 # Print human-readable size
 def _size(value):
     for unit in ["B", "kB", "MB", "GB", "TB", "PB", "EB", "ZB"]:
@@ -384,5 +1527,21 @@ def _size(value):
 # Data
 # -----------------------------------------------------------------------------
 
+# File extensions of files that can be compressed
+_compressible = (".html", ".css", ".js", ".json", ".svg", ".xml")
+
+# Kinds of manifest entries
+_manifest_kinds = ["image", "variant", "page", "asset", "compressed"]
+
+# Settings that can be overridden for files matching a pattern
+_overrides = [
+    "optimize_png_speed",
+    "optimize_png_strip",
+    "optimize_jpg_quality",
+    "optimize_jpg_progressive",
+    "optimize_webp_quality",
+    "optimize_avif_quality"
+]
+
 # Set up logging
 log = logging.getLogger("mkdocs.material.optimize")
@@ -22,7 +22,7 @@ import os
 
 from mkdocs.config.base import Config
 from mkdocs.config.config_options import (
-  Choice, Deprecated, DictOfItems, ListOfItems, Type
+  Choice, Deprecated, DictOfItems, ListOfItems, Optional, Type
 )
 
 # -----------------------------------------------------------------------------
@@ -45,10 +45,22 @@ LogLevel = (
 class PrivacyConfig(Config):
     enabled = Type(bool, default = True)
     concurrency = Type(int, default = max(1, os.cpu_count() - 1))
+    concurrency_per_host = Type(int, default = 4)
 
     # Settings for caching
     cache = Type(bool, default = True)
     cache_dir = Type(str, default = ".cache/plugin/privacy")
+    cache_revalidate = Type(bool, default = False)
+    cache_ttl = Type(int, default = 86400)
+
+    # Settings for lockfile
+    lock = Type(bool, default = False)
+    lock_file = Type(str, default = "privacy.lock")
+    lock_update = Type(bool, default = False)
+
+    # Settings for retries
+    retries = Type(int, default = 3)
+    retries_backoff = Type((int, float), default = 0.5)
 
     # Settings for logging
     log = Type(bool, default = True)
@@ -58,6 +70,11 @@ class PrivacyConfig(Config):
     assets = Type(bool, default = True)
     assets_fetch = Type(bool, default = True)
     assets_fetch_dir = Type(str, default = "assets/external")
+    assets_prefetch = Type(bool, default = False)
+    assets_fetch_timeout = Type((int, float), default = 60)
+    assets_dedupe = Type(bool, default = False)
+    assets_max_size = Optional(Type(int))
+    assets_max_size_skip = Type(bool, default = True)
     assets_include = ListOfItems(Type(str), default = [])
     assets_exclude = ListOfItems(Type(str), default = [])
     assets_expr_map = DictOfItems(Type(str), default = {})
@@ -67,6 +84,10 @@ class PrivacyConfig(Config):
     links_attr_map = DictOfItems(Type(str), default = {})
     links_noopener = Type(bool, default = True)
 
+    # Settings for reporting
+    print_summary = Type(bool, default = False)
+    summary_file = Optional(Type(str))
+
     # Deprecated settings
     external_assets = Deprecated(message = "Deprecated, use 'assets_fetch'")
     external_assets_dir = Deprecated(moved_to = "assets_fetch_dir")
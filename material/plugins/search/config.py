@@ -53,9 +53,28 @@ class SearchConfig(Config):
     pipeline = Optional(ListOfItems(Choice(pipeline)))
     fields = Type(dict, default = {})
 
+    # Settings for search index
+    compact = Type(bool, default = False)
+
+    # Settings for search index budgets
+    budget = Optional(Type(int))
+    budget_page = Optional(Type(int))
+    budget_page_truncate = Type(bool, default = False)
+    budget_strict = Type(bool, default = False)
+
+    # Settings for caching
+    cache = Type(bool, default = True)
+    cache_dir = Type(str, default = ".cache/plugin/search")
+
     # Settings for text segmentation (Chinese)
     jieba_dict = Optional(Type(str))
     jieba_dict_user = Optional(Type(str))
+    jieba_concurrency = Type(int, default = 1)
+    jieba_concurrency_threshold = Type(int, default = 1000)
+
+    # Settings for reporting
+    print_size = Type(bool, default = False)
+    print_size_top = Type(int, default = 10)
 
     # Unsupported settings, originally implemented in MkDocs
     indexing = Deprecated(message = "Unsupported option")
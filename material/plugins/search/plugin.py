@@ -23,10 +23,14 @@ import logging
 import os
 import regex as re
 
+from colorama import Fore, Style
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha1
 from html import escape
 from html.parser import HTMLParser
 from mkdocs import utils
 from mkdocs.config.config_options import SubConfig
+from mkdocs.exceptions import PluginError
 from mkdocs.plugins import BasePlugin
 
 from .config import SearchConfig, SearchFieldConfig
@@ -54,6 +58,11 @@ class SearchPlugin(BasePlugin[SearchConfig]):
         # Initialize search index cache
         self.search_index_prev = None
 
+        # Initialize segmentation cache
+        self.segments = {}
+        self.segments_file = None
+        self.segments_key = None
+
     # Determine whether we're serving the site
     def on_startup(self, *, command, dirty):
         self.is_dirty = dirty
@@ -121,18 +130,27 @@ class SearchPlugin(BasePlugin[SearchConfig]):
                     f"'{self.config.jieba_dict_user}' does not exist."
                 )
 
+        # Load segmentation cache, if jieba is available and should be cached
+        if jieba and self.config.cache:
+            self._load_segments(config)
+
+        # Share segmentation cache with search index
+        self.search_index.segments = self.segments
+
     # Add page to search index
     def on_page_context(self, context, *, page, config, nav):
         if not self.config.enabled:
             return
 
-        # Index page
-        self.search_index.add_entry_from_context(page)
-        page.content = re.sub(
-            r"\s?data-search-\w+=\"[^\"]+\"",
-            "",
-            page.content
-        )
+        # Index page - the parser records the positions of all tags that have
+        # search attributes, so we can remove them without a second full pass
+        spans = self.search_index.add_entry_from_context(page)
+        if spans is not None:
+            page.content = _strip_search_attrs(page.content, spans)
+
+        # Otherwise, the page was excluded and thus not parsed
+        elif "data-search-" in page.content:
+            page.content = search_attrs.sub("", page.content)
 
     # Generate search index
     def on_post_build(self, *, config):
@@ -145,18 +163,150 @@ class SearchPlugin(BasePlugin[SearchConfig]):
 
         # Generate and write search index to file
         data = self.search_index.generate_search_index(self.search_index_prev)
-        utils.write_file(data.encode("utf-8"), path)
+        data = data.encode("utf-8")
+
+        # Enforce budgets and print size of search index, if desired
+        if self.search_index.stats:
+            self._check_budgets(len(data))
+            if self.config.print_size:
+                self._print_size(len(data))
+
+        # Write search index to file
+        utils.write_file(data, path)
 
         # Persist search index for repeated invocation
         if self.is_dirty:
             self.search_index_prev = self.search_index
 
+        # Save segmentation cache - when building the entire site, only keep
+        # segments that were used, so the cache doesn't grow without bounds
+        if self.segments_file and self.search_index.segments_used:
+            segments = self.segments
+            if not self.is_dirtyreload:
+                segments = {
+                    value: segments[value]
+                        for value in self.search_index.segments_used
+                }
+
+            # Write segmentation cache to file
+            data = { "key": self.segments_key, "segments": segments }
+            utils.write_file(
+                json.dumps(data, ensure_ascii = False).encode("utf-8"),
+                self.segments_file
+            )
+
     # Determine whether we're running under dirty reload
     def on_serve(self, server, *, config, builder):
         self.is_dirtyreload = self.is_dirty
 
     # -------------------------------------------------------------------------
 
+    # Check whether the search index and its pages exceed their budgets
+    def _check_budgets(self, size):
+        stats = self.search_index.stats
+        messages = []
+
+        # Check budget for search index
+        if self.config.budget and size > self.config.budget:
+            messages.append(
+                f"Search index exceeds budget: "
+                f"{_size(size)} > {_size(self.config.budget)}"
+            )
+
+        # Check budget for each page
+        if self.config.budget_page:
+            for path, value in stats["pages"].items():
+                if value > self.config.budget_page:
+                    messages.append(
+                        f"Search index entries for page '{path}' exceed "
+                        f"budget: {_size(value)} > "
+                        f"{_size(self.config.budget_page)}"
+                    )
+
+        # Fail the build or print warnings
+        if messages and self.config.budget_strict:
+            raise PluginError("\n".join(messages))
+        for message in messages:
+            log.warning(message)
+
+    # Print size of search index, as well as largest pages and sections
+    def _print_size(self, size):
+        stats = self.search_index.stats
+        top = self.config.print_size_top
+
+        # Print summary for search index
+        print(Style.NORMAL)
+        print(
+            f"  Search index: {Fore.GREEN}{_size(size)}"
+            f"{Fore.WHITE}{Style.DIM} ({stats['entries']} entries)"
+            f"{Style.RESET_ALL}"
+        )
+
+        # Print summary for fields, pages and sections
+        for name, items in [
+            ("Fields", sorted(stats["fields"].items(), key = _by_size)),
+            ("Pages", sorted(stats["pages"].items(), key = _by_size)[:top]),
+            ("Sections", sorted(stats["sections"], key = _by_size)[:top])
+        ]:
+            print(f"    {name}:")
+            for key, value in items:
+                print(
+                    f"      {Fore.GREEN}{_size(value):>9}"
+                    f"{Fore.WHITE}{Style.DIM} {key or '/'}"
+                    f"{Style.RESET_ALL}"
+                )
+
+        # Reset all styles
+        print(Style.RESET_ALL)
+
+    # Load segmentation cache from file
+    def _load_segments(self, config):
+
+        # Resolve cache directory (once) - this is necessary, so the cache is
+        # always relative to the configuration file, and thus project, and not
+        # relative to the current working directory, or it would not work with
+        # the projects plugin.
+        path = os.path.abspath(self.config.cache_dir)
+        if path != self.config.cache_dir:
+            self.config.cache_dir = os.path.join(
+                os.path.dirname(config.config_file_path),
+                os.path.normpath(self.config.cache_dir)
+            )
+
+        # Compute key from jieba version and dictionaries, as segments must be
+        # invalidated when either of them changes
+        hash = sha1(str(getattr(jieba, "__version__", "")).encode("utf-8"))
+        for path in [self.config.jieba_dict, self.config.jieba_dict_user]:
+            if path and os.path.isfile(path):
+                with open(path, "rb") as f:
+                    hash.update(f.read())
+
+        # Skip if segmentation cache was already loaded for the same key, which
+        # is the case when the site is rebuilt while serving
+        key = hash.hexdigest()
+        if key == self.segments_key:
+            return
+
+        # Initialize segmentation cache file
+        self.segments.clear()
+        self.segments_key = key
+        self.segments_file = os.path.join(
+            self.config.cache_dir, "segments.json"
+        )
+
+        # Skip if segmentation cache doesn't exist yet
+        if not os.path.isfile(self.segments_file):
+            return
+
+        # Load segmentation cache if key matches
+        try:
+            with open(self.segments_file, encoding = "utf-8") as f:
+                data = json.load(f)
+                if data.get("key") == self.segments_key:
+                    self.segments.update(data["segments"])
+        except (OSError, ValueError, KeyError):
+            pass
+
     # Translate the given placeholder value
     def _translate(self, config, value):
         env = config.theme.get_env()
@@ -176,27 +326,41 @@ class SearchIndex:
         self.config = config
         self.entries = []
 
+        # Initialize segmentation cache
+        self.segments = {}
+        self.segments_used = set()
+
+        # Initialize statistics
+        self.stats = None
+
     # Add page to search index
     def add_entry_from_context(self, page):
         search = page.meta.get("search") or {}
         if search.get("exclude"):
-            return
+            return None
 
         # Divide page content into sections
         parser = Parser()
         parser.feed(page.content)
         parser.close()
 
+        # Map identifiers to anchors once, so resolving the location of each
+        # section is a lookup and not a walk of the entire table of contents
+        anchors = self._map_toc_by_id(page.toc)
+
         # Add sections to index
         for section in parser.data:
             if not section.is_excluded():
-                self.create_entry_for_section(section, page.toc, page.url, page)
+                self.create_entry_for_section(section, anchors, page.url, page)
+
+        # Return positions of tags with search attributes
+        return parser.spans
 
     # Override: graceful indexing and additional fields
-    def create_entry_for_section(self, section, toc, url, page):
-        item = self._find_toc_by_id(toc, section.id)
-        if item:
-            url = url + item.url
+    def create_entry_for_section(self, section, anchors, url, page):
+        anchor = anchors.get(section.id)
+        if anchor:
+            url = url + anchor
         elif section.id:
             url = url + "#" + section.id
 
@@ -207,15 +371,11 @@ class SearchIndex:
         if not section.title:
             section.title = [str(page.meta.get("title", page.title))]
 
-        # Compute title and text
+        # Compute title and text - if jieba is available, Chinese characters
+        # are segmented in a single batch when generating the search index
         title = "".join(section.title).strip()
         text  = "".join(section.text).strip()
 
-        # Segment Chinese characters if jieba is available
-        if jieba:
-            title = self._segment_chinese(title)
-            text  = self._segment_chinese(text)
-
         # Create entry for section
         entry = {
             "location": url,
@@ -246,6 +406,11 @@ class SearchIndex:
                 for key in ["lang", "separator", "pipeline", "fields"]
         }
 
+        # Segment Chinese characters if jieba is available - note that entries
+        # of the previous search index are already segmented
+        if jieba:
+            self._segment_entries(self.entries)
+
         # Hack: if we're running under dirty reload, the search index will only
         # include the entries for the current page. However, MkDocs > 1.4 allows
         # us to persist plugin state across rebuilds, which is exactly what we
@@ -273,48 +438,285 @@ class SearchIndex:
         if prev and not self.entries:
             self.entries = prev.entries
 
+        # Encode entries in columns (once), if the compact encoding is enabled,
+        # as the encoding is used for measuring and writing the search index
+        data = None
+        if self.config.get("compact"):
+            data = self._compact_entries(self.entries)
+
+        # Measure entries if the size of the search index should be printed or
+        # budgets should be enforced - entries are serialized one by one, so
+        # the result can be reused when assembling the search index
+        docs = None
+        if self._is_measured():
+            docs = self._measure_entries(self.entries, data)
+
+        # Return search index as JSON, using the compact encoding if enabled
+        if data is not None:
+            return _dumps({ "config": config, **data })
+
+        # Otherwise, assemble search index from serialized entries
+        elif docs is not None:
+            return "".join([
+                "{\"config\":", _dumps(config),
+                ",\"docs\":[", ",".join(docs), "]}"
+            ])
+
         # Return search index as JSON
-        data = { "config": config, "docs": self.entries }
-        return json.dumps(
-            data,
-            separators = (",", ":"),
-            default = str
-        )
+        return _dumps({ "config": config, "docs": self.entries })
 
     # -------------------------------------------------------------------------
 
-    # Retrieve item for anchor
-    def _find_toc_by_id(self, toc, id):
+    # Check whether entries must be measured
+    def _is_measured(self):
+        return any(self.config.get(key) for key in [
+            "budget", "budget_page", "print_size"
+        ])
+
+    # Serialize and measure entries, and truncate pages exceeding the budget -
+    # if the compact encoding is given, entries are measured by their cells in
+    # the columns of the encoding, which is what is actually written
+    def _measure_entries(self, entries, data = None):
+        compact = data is not None
+        if compact:
+            docs = None
+            sizes = [
+                _size_cells(data["sections"], i)
+                    for i in range(len(entries))
+            ]
+        else:
+            docs = [_dumps(entry) for entry in entries]
+            sizes = [len(doc) for doc in docs]
+
+        # Group entries by page
+        pages = {}
+        for i, entry in enumerate(entries):
+            path, _, _ = entry["location"].partition("#")
+            pages.setdefault(path, []).append(i)
+
+        # Compute size of each page's row in the page table, which is only
+        # present in the compact encoding, as pages are otherwise not stored
+        rows = dict.fromkeys(pages, 0)
+        if compact:
+            for path, indexes in pages.items():
+                page = data["sections"]["page"][indexes[0]]
+                rows[path] = _size_cells(data["pages"], page)
+
+        # Truncate text of pages that exceed the budget, starting with the last
+        # section, and serialize truncated entries again
+        budget = self.config.get("budget_page")
+        if budget and self.config.get("budget_page_truncate"):
+            for path, indexes in pages.items():
+                excess = rows[path] + sum(sizes[i] for i in indexes) - budget
+                if excess <= 0:
+                    continue
+
+                # Truncate text of sections until budget is met - the size of
+                # the text changes by the same amount in both encodings, so we
+                # only need to update the truncated text in the encoding
+                for i in reversed(indexes):
+                    removed = self._truncate_entry(entries[i], excess)
+                    excess -= removed
+                    sizes[i] -= removed
+                    if compact:
+                        data["sections"]["text"][i] = entries[i]["text"]
+                    else:
+                        docs[i] = _dumps(entries[i])
+                    if excess <= 0:
+                        break
+
+                # Print summary for page
+                log.info(f"Truncated search index entries for page '{path}'")
+
+        # Compute size of pages and sections
+        self.stats = {
+            "entries": len(entries),
+            "pages": {
+                path: rows[path] + sum(sizes[i] for i in indexes)
+                    for path, indexes in pages.items()
+            },
+            "sections": [
+                (entry["location"], sizes[i])
+                    for i, entry in enumerate(entries)
+            ],
+            "fields": {}
+        }
+
+        # Compute size of fields, if the size should be printed - for the
+        # compact encoding, these are the columns of the encoding
+        if self.config.get("print_size"):
+            fields = self.stats["fields"]
+            if compact:
+                fields["tags"] = len(_dumps(data["tags"]))
+                for table in ["pages", "sections"]:
+                    for key, value in data[table].items():
+                        fields[f"{table}.{key}"] = len(_dumps(value))
+            else:
+                for entry in entries:
+                    for key, value in entry.items():
+                        fields[key] = fields.get(key, 0) + len(_dumps(value))
+
+        # Return serialized entries
+        return docs
+
+    # Truncate text of entry by the given number of bytes, and return the
+    # number of bytes that were actually removed
+    def _truncate_entry(self, entry, excess):
+        text = entry["text"]
+        size = len(_dumps(text))
+        if size - 2 <= excess:
+            entry["text"] = ""
+            return size - 2
+
+        # Truncate text proportionally, and remove trailing incomplete tags and
+        # entities, as the text is rendered as HTML - tags that were opened but
+        # not closed before the cut are closed, so the markup stays balanced.
+        # Closing tags add to the size, so we cut further until excess is met.
+        length = int(len(text) * (1 - excess / size))
+        while True:
+            data = re.sub(r"(<[^>]*|&\w*)$", "", text[:length]).rstrip()
+            data = _close_tags(data)
+            removed = size - len(_dumps(data))
+            if removed >= excess or not data:
+                break
+
+            # Cut by the remaining excess, but at least by one character
+            length = max(length - max(excess - removed, 1), 0)
+
+        # Return number of bytes that were removed
+        entry["text"] = data
+        return removed
+
+    # Encode entries in columns, storing location, title, tags and boost only
+    # once for each page, which are otherwise repeated for every section
+    def _compact_entries(self, entries):
+        tags = {}
+        pages = { "location": [], "title": [] }
+        sections = { "page": [], "anchor": [], "title": [], "text": [] }
+
+        # Map locations of pages to their indexes in the page table
+        index = {}
+        for entry in entries:
+            path, _, anchor = entry["location"].partition("#")
+            if path not in index:
+                index[path] = len(pages["location"])
+                pages["location"].append(path)
+                pages["title"].append(entry["title"])
+
+                # Store tags as indexes into the shared string table - note
+                # that tags may also be numbers or booleans, so we must make
+                # sure that, e.g., 1 and True are not considered equal
+                if "tags" in entry:
+                    pages.setdefault("tags", [None] * index[path])
+                    pages["tags"].append([
+                        tags.setdefault((type(name), name), len(tags))
+                            for name in entry["tags"]
+                    ])
+                elif "tags" in pages:
+                    pages["tags"].append(None)
+
+                # Store boost, if given
+                if "boost" in entry:
+                    pages.setdefault("boost", [None] * index[path])
+                    pages["boost"].append(entry["boost"])
+                elif "boost" in pages:
+                    pages["boost"].append(None)
+
+            # Store section, omitting the title if it equals the page title
+            title = entry["title"]
+            if title == pages["title"][index[path]]:
+                title = None
+
+            # Append section to columns
+            sections["page"].append(index[path])
+            sections["anchor"].append(f"#{anchor}" if anchor else "")
+            sections["title"].append(title)
+            sections["text"].append(entry["text"])
+
+        # Return compact encoding
+        return {
+            "schema": compact_schema,
+            "tags": [name for _, name in tags],
+            "pages": pages,
+            "sections": sections
+        }
+
+    # Map identifiers of items to anchors
+    def _map_toc_by_id(self, toc, anchors = None):
+        if anchors is None:
+            anchors = {}
+
+        # Traverse items in document order, so the first item with a given
+        # identifier wins, which is consistent with how browsers resolve them
         for toc_item in toc:
-            if toc_item.id == id:
-                return toc_item
+            anchors.setdefault(toc_item.id, toc_item.url)
 
             # Recurse into children of item
-            toc_item = self._find_toc_by_id(toc_item.children, id)
-            if toc_item is not None:
-                return toc_item
+            self._map_toc_by_id(toc_item.children, anchors)
+
+        # Return anchors
+        return anchors
+
+    # Find and segment Chinese characters in entries
+    def _segment_entries(self, entries):
+        values = set()
+        for entry in entries:
+            values.update(han.findall(entry["title"]))
+            values.update(han.findall(entry["text"]))
+
+        # Collect all runs of Chinese characters that are not cached
+        missing = [value for value in values if value not in self.segments]
+        self.segments_used.update(values)
+
+        # Segment runs in a process pool, as jieba is pure Python and thus CPU-
+        # bound. Spawning processes that load the dictionary is expensive, so
+        # small batches, e.g., on warm builds, are segmented in-process.
+        concurrency = self.config.get("jieba_concurrency", 1)
+        threshold = self.config.get("jieba_concurrency_threshold", 1000)
+        if concurrency > 1 and len(missing) >= threshold:
+            jieba.initialize()
+
+            # Segment runs in chunks, so inter-process communication is cheap
+            with ProcessPoolExecutor(
+                concurrency,
+                initializer = _initialize_jieba,
+                initargs = (
+                    self.config.get("jieba_dict"),
+                    self.config.get("jieba_dict_user")
+                )
+            ) as pool:
+                chunksize = max(1, len(missing) // (concurrency * 4))
+                for value, segments in zip(
+                    missing, pool.map(_segment, missing, chunksize = chunksize)
+                ):
+                    self.segments[value] = segments
+
+        # Otherwise segment runs in-process
+        else:
+            for value in missing:
+                self.segments[value] = _segment(value)
 
-        # No item found
-        return None
+        # Replace runs of Chinese characters with segmented versions
+        for entry in entries:
+            entry["title"] = self._segment_chinese(entry["title"])
+            entry["text"]  = self._segment_chinese(entry["text"])
 
     # Find and segment Chinese characters in string
     def _segment_chinese(self, data):
-        expr = re.compile(r"(\p{IsHan}+)", re.UNICODE)
 
         # Replace callback
         def replace(match):
             value = match.group(0)
+            if value not in self.segments:
+                self.segments[value] = _segment(value)
 
             # Replace occurrence in original string with segmented version and
             # surround with zero-width whitespace for efficient indexing
-            return "".join([
-                "\u200b",
-                "\u200b".join(jieba.cut(value.encode("utf-8"))),
-                "\u200b",
-            ])
+            self.segments_used.add(value)
+            return "".join(["\u200b", self.segments[value], "\u200b"])
 
         # Return string with segmented occurrences
-        return expr.sub(replace, data).strip("\u200b")
+        return han.sub(replace, data).strip("\u200b")
 
 # -----------------------------------------------------------------------------
 
@@ -416,10 +818,19 @@ class Parser(HTMLParser):
         # All parsed sections
         self.data = []
 
+        # Positions of tags with search attributes
+        self.spans = []
+
     # Called at the start of every HTML tag
     def handle_starttag(self, tag, attrs):
         attrs = dict(attrs)
 
+        # Record position and text of tag if it has search attributes
+        for key in attrs:
+            if key.startswith("data-search-"):
+                self.spans.append((self.getpos(), self.get_starttag_text()))
+                break
+
         # Ignore self-closing tags
         el = Element(tag, attrs)
         if not tag in void:
@@ -567,6 +978,95 @@ class Parser(HTMLParser):
                 escape(data, quote = False)
             )
 
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+# Initialize jieba in worker process - when processes are forked, the state of
+# jieba is inherited, so we only need to load dictionaries when it's not
+def _initialize_jieba(path, path_user):
+    if jieba.dt.initialized:
+        return
+
+    # Set jieba dictionary, if given
+    if path and os.path.isfile(os.path.normpath(path)):
+        jieba.set_dictionary(os.path.normpath(path))
+
+    # Set jieba user dictionary, if given
+    if path_user and os.path.isfile(os.path.normpath(path_user)):
+        jieba.load_userdict(os.path.normpath(path_user))
+
+# Segment run of Chinese characters, separated by zero-width whitespace
+def _segment(value):
+    return "\u200b".join(jieba.cut(value.encode("utf-8")))
+
+# Serialize data as compact JSON
+def _dumps(data):
+    return json.dumps(data, separators = (",", ":"), default = str)
+
+# Measure size of the cells of a row in a table of the compact encoding,
+# including the separators between cells
+def _size_cells(table, index):
+    return sum(len(_dumps(column[index])) + 1 for column in table.values())
+
+# Close tags that are left open in the given data, e.g., after truncation
+def _close_tags(data):
+    stack = []
+    for match in html_tags.finditer(data):
+        closing, name = match.groups()
+        name = name.lower()
+        if name in void or match.group(0).endswith("/>"):
+            continue
+
+        # Push opening tags, and pop closing tags including unclosed children
+        if not closing:
+            stack.append(name)
+        elif name in stack:
+            while stack.pop() != name:
+                pass
+
+    # Append closing tags for tags that are still open
+    return data + "".join(f"</{name}>" for name in reversed(stack))
+
+# Sort key for items by size in descending order
+def _by_size(item):
+    return -item[1]
+
+# Print human-readable size
+def _size(value):
+    for unit in ["B", "kB", "MB", "GB", "TB", "PB", "EB", "ZB"]:
+        if abs(value) < 1000.0:
+            return f"{value:3.1f} {unit}"
+        value /= 1000.0
+
+# Remove search attributes from tags at the given positions in a single pass
+def _strip_search_attrs(data, spans):
+    if not spans:
+        return data
+
+    # Compute offsets of lines, as the parser reports line and column
+    lines = [0]
+    index = data.find("\n")
+    while index != -1:
+        lines.append(index + 1)
+        index = data.find("\n", index + 1)
+
+    # Splice tags without search attributes into data
+    parts, prev = [], 0
+    for (lineno, offset), text in spans:
+        start = lines[lineno - 1] + offset
+        if not data.startswith(text, start):
+            return search_attrs.sub("", data)
+
+        # Append data before tag and tag without search attributes
+        parts.append(data[prev:start])
+        parts.append(search_attrs.sub("", text))
+        prev = start + len(text)
+
+    # Append remaining data and return
+    parts.append(data[prev:])
+    return "".join(parts)
+
 # -----------------------------------------------------------------------------
 # Data
 # -----------------------------------------------------------------------------
@@ -574,6 +1074,18 @@ class Parser(HTMLParser):
 # Set up logging
 log = logging.getLogger("mkdocs.material.search")
 
+# Runs of Chinese characters
+han = re.compile(r"\p{IsHan}+", re.UNICODE)
+
+# Version of compact search index encoding
+compact_schema = 1
+
+# Opening and closing tags
+html_tags = re.compile(r"<(/?)([a-zA-Z][\w-]*)[^>]*>")
+
+# Search attributes
+search_attrs = re.compile(r"\s?data-search-\w+=\"[^\"]+\"")
+
 # Tags that are self-closing
 void = set([
     "area",                            # Image map areas
@@ -18,7 +18,12 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import codecs
+import json
 import os
+import shutil
+
+from glob import iglob
 
 from mkdocs.plugins import BasePlugin, event_priority
 
@@ -59,11 +64,62 @@ class OfflinePlugin(BasePlugin[OfflineConfig]):
         if not os.path.isfile(file):
             return
 
-        # Obtain search index contents
+        # Remove chunks of the search index written by a previous build, as
+        # the number of chunks might have changed, or chunking was disabled
+        for chunk in iglob(os.path.join(path, "search_index.*.js")):
+            os.remove(chunk)
+
+        # Split search index into several scripts, if desired
+        if self.config.search_chunk_size:
+            return self._split_search_index(path)
+
+        # Inline search index contents into script - the search index is copied
+        # in chunks, so we don't need to hold it in memory for large projects
         with open(file, encoding = "utf-8") as f:
-            data = f.read()
+            file = os.path.join(path, "search_index.js")
+            with open(file, "w", encoding = "utf-8") as g:
+                g.write("var __index = ")
+                shutil.copyfileobj(f, g, buffer)
+
+    # -------------------------------------------------------------------------
+
+    # Split search index into scripts, each of which contains a chunk of the
+    # search index as a string, as browsers struggle to parse a single script
+    # that is very large. The chunks are joined and parsed as JSON by the client.
+    # The search index is read in chunks of the given size in bytes, which are
+    # decoded incrementally, so characters are never split between chunks.
+    def _split_search_index(self, path):
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        # Read search index in chunks of bytes
+        file = os.path.join(path, "search_index.json")
+        with open(file, "rb") as f:
+            chunks = 0
+            while True:
+                data = f.read(self.config.search_chunk_size)
+                if not data:
+                    break
 
-        # Inline search index contents into script
+                # Decode chunk, holding back incomplete characters at its end,
+                # which are prepended to the next chunk
+                text = decoder.decode(data)
+                if not text:
+                    continue
+
+                # Write chunk of search index contents into script
+                chunks += 1
+                file = os.path.join(path, f"search_index.{chunks}.js")
+                with open(file, "w", encoding = "utf-8") as g:
+                    g.write(f"var __index_chunk = {json.dumps(text)}")
+
+        # Write script that denotes the number of chunks
         file = os.path.join(path, "search_index.js")
         with open(file, "w", encoding = "utf-8") as f:
-            f.write(f"var __index = {data}")
+            f.write(f"var __index = {json.dumps({ 'chunks': chunks })}")
+
+# -----------------------------------------------------------------------------
+# Data
+# -----------------------------------------------------------------------------
+
+# Size of buffer when copying the search index
+buffer = 1024 * 1024
@@ -0,0 +1,166 @@
+# Copyright (c) 2016-2024 Martin Donath <martin.donath@squidfunk.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+
+from concurrent.futures import Executor, Future, wait
+from threading import Lock, Thread, local
+from typing import Callable
+from urllib.parse import urlparse
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+# Fetcher - runs an event loop in a background thread, which schedules jobs to
+# fetch external assets. The actual requests are blocking, so they're run in
+# the given executor, but waiting for a free slot of a host is cheap, as it is
+# done by the event loop, and not by a thread of the executor. Jobs are keyed,
+# so external assets are only fetched once, even when they're discovered by
+# multiple threads at the same time. Jobs never wait for other jobs, as the job
+# they'd wait for might be queued in the executor behind them.
+class Fetcher:
+
+    # Initialize fetcher
+    def __init__(self, executor: Executor, concurrency_per_host: int):
+        self.executor = executor
+        self.concurrency_per_host = concurrency_per_host
+
+        # Initialize jobs and semaphores for hosts
+        self.jobs: dict[str, Future] = {}
+        self.hosts: dict[str, asyncio.Semaphore] = {}
+        self.lock = Lock()
+
+        # Initialize thread-local state, which marks threads running a job
+        self.local = local()
+
+        # Initialize and start event loop in background thread
+        self.loop = asyncio.new_event_loop()
+        self.thread = Thread(target = self.loop.run_forever, daemon = True)
+        self.thread.start()
+
+    # Schedule job to fetch the given URL, unless a job with the same key was
+    # already scheduled, and return a future - it can be awaited from another
+    # event loop with `asyncio.wrap_future`
+    def submit(self, key: str, url: str, fn: Callable, *args) -> Future:
+        with self.lock:
+            if key not in self.jobs:
+                self.jobs[key] = asyncio.run_coroutine_threadsafe(
+                    self._run(url, fn, *args), self.loop
+                )
+
+            # Return future
+            return self.jobs[key]
+
+    # Run job to fetch the given URL in the calling thread, unless a job with
+    # the same key was already scheduled, in which case we wait for it, for at
+    # most the given number of seconds. If the calling thread is running a job
+    # itself, we must not wait, as the job we'd wait for might be queued behind
+    # it, or it might even be the same job, so we return nothing and leave it
+    # to the job that was scheduled before
+    def run(
+        self, key: str, fn: Callable, *args, timeout: float | None = None
+    ):
+        with self.lock:
+            job = self.jobs.get(key)
+            owner = job is None
+            if owner:
+                job = self.jobs[key] = Future()
+                job.set_running_or_notify_cancel()
+
+        # Wait for job and return result, if scheduled by somebody else
+        if not owner:
+            if getattr(self.local, "running", False):
+                return None
+            return job.result(timeout)
+
+        # Run job and set result or exception
+        try:
+            job.set_result(self._call(fn, *args))
+        except BaseException as e:
+            job.set_exception(e)
+            raise
+
+        # Return result
+        return job.result()
+
+    # Check if a job with the given key was already scheduled
+    def __contains__(self, key: str):
+        with self.lock:
+            return key in self.jobs
+
+    # Wait for all jobs and return them by key - jobs might schedule further
+    # jobs before they're done, e.g., for dependent external assets, so we wait
+    # until all jobs are done. Errors are not raised, but left to the caller.
+    def wait(self) -> dict[str, Future]:
+        while True:
+            with self.lock:
+                jobs = dict(self.jobs)
+
+            # Stop if all jobs are done
+            if all(job.done() for job in jobs.values()):
+                return jobs
+            wait(jobs.values())
+
+    # Stop event loop and wait for background thread to finish - jobs that are
+    # still waiting for a free slot are cancelled, e.g., if the build aborted
+    def shutdown(self):
+        if self.loop.is_closed():
+            return
+
+        # Cancel pending jobs and stop event loop
+        asyncio.run_coroutine_threadsafe(self._cancel(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    # -------------------------------------------------------------------------
+
+    # Run job in executor, limiting the number of concurrent jobs per host
+    async def _run(self, url: str, fn: Callable, *args):
+        host = urlparse(url).netloc
+        if host not in self.hosts:
+            self.hosts[host] = asyncio.Semaphore(self.concurrency_per_host)
+
+        # Wait for a free slot, then run job in executor
+        async with self.hosts[host]:
+            return await self.loop.run_in_executor(
+                self.executor, self._call, fn, *args
+            )
+
+    # Cancel all pending jobs and wait for them to finish
+    async def _cancel(self):
+        tasks = asyncio.all_tasks(self.loop) - { asyncio.current_task() }
+        for task in tasks:
+            task.cancel()
+
+        # Wait for tasks to handle cancellation
+        await asyncio.gather(*tasks, return_exceptions = True)
+
+    # Call function, marking the calling thread as running a job
+    def _call(self, fn: Callable, *args):
+        running = getattr(self.local, "running", False)
+        self.local.running = True
+        try:
+            return fn(*args)
+        finally:
+            self.local.running = running
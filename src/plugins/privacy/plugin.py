@@ -21,29 +21,35 @@
 from __future__ import annotations
 
 import errno
+import json
 import logging
 import os
 import posixpath
 import re
 import requests
+import shutil
 import sys
+import time
 
 from colorama import Fore, Style
-from concurrent.futures import Future, wait
+from concurrent.futures import Future, TimeoutError, wait
 from concurrent.futures.thread import ThreadPoolExecutor
-from fnmatch import fnmatch
-from hashlib import sha1
+from fnmatch import translate
+from hashlib import sha1, sha256
 from mkdocs.config.config_options import ExtraScriptValue
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.exceptions import PluginError
 from mkdocs.plugins import BasePlugin, event_priority
 from mkdocs.structure.files import File, Files
-from mkdocs.utils import is_error_template
+from mkdocs.utils import copy_file, is_error_template
 from re import Match
+from requests.adapters import HTTPAdapter
 from urllib.parse import ParseResult as URL, urlparse, unquote
+from urllib3.util import Retry
 from xml.etree.ElementTree import Element, tostring
 
 from .config import PrivacyConfig
+from .fetcher import Fetcher
 from .parser import FragmentParser
 
 # -----------------------------------------------------------------------------
@@ -64,15 +70,124 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
         self.pool = ThreadPoolExecutor(self.config.concurrency)
         self.pool_jobs: list[Future] = []
 
+        # Initialize fetcher, which schedules jobs to fetch external assets in
+        # an event loop, and runs them in the thread pool
+        self.fetcher = Fetcher(self.pool, self.config.concurrency_per_host)
+
+        # Initialize HTTP session, which is shared among all threads
+        self.session = self._create_session()
+
+        # Initialize manifest, which stores metadata of external assets, i.e.,
+        # validators and time to live, in order to revalidate them when stale
+        self.manifest: dict[str, dict] = {}
+        self.manifest_file = os.path.join(
+            os.path.abspath(self.config.cache_dir), "manifest.json"
+        )
+
+        # Load manifest if it exists and the cache should be used
+        if os.path.isfile(self.manifest_file) and self.config.cache:
+            try:
+                with open(self.manifest_file) as f:
+                    self.manifest = json.load(f)
+            except:
+                pass
+
+        # Initialize lockfile, which records the cached copy and content hash
+        # of every external asset - if the lockfile exists, external assets are
+        # resolved from it, and no requests are made, unless it's updated
+        self.lock: dict[str, dict] = {}
+        self.lock_errors: list[str] = []
+
+        # Resolve lockfile relative to the configuration file, and thus the
+        # project, and not relative to the current working directory
+        self.lock_file = os.path.join(
+            os.path.dirname(config.config_file_path),
+            os.path.normpath(self.config.lock_file)
+        )
+
+        # Load lockfile if it exists and should be used - if it can't be read,
+        # e.g., because it was only partially written, we start from scratch
+        self.lock_frozen = False
+        if os.path.isfile(self.lock_file) and self.config.lock:
+            if not self.config.lock_update:
+                try:
+                    with open(self.lock_file) as f:
+                        self.lock = json.load(f)
+
+                    # External assets are resolved from lockfile
+                    self.lock_frozen = True
+
+                # Print warning and recreate lockfile
+                except (OSError, ValueError) as e:
+                    log.warning(
+                        f"Couldn't read lockfile: {self.lock_file}\n{e}"
+                    )
+
         # Initialize collections of external assets
         self.assets = Files([])
         self.assets_done: list[File] = []
+        self.assets_late: dict[str, tuple[File, File]] = {}
+        self.assets_skipped: set[str] = set()
+        self.assets_failed: set[str] = set()
+        self.assets_prefetched: dict[str, File] = {}
+        self.assets_digest: dict[str, str] = {}
+        self.assets_canonical: dict[str, File] = {}
+
+        # Compile inclusion and exclusion patterns, and initialize memoized
+        # canonical paths and reasons for exclusion of URLs
+        self.assets_include = _compile(self.config.assets_include)
+        self.assets_exclude = _compile(self.config.assets_exclude)
+        self.paths: dict[URL, str] = {}
+        self.excluded: dict[URL, str | None] = {}
+
+        # Initialize statistics of external assets, and the initiators that
+        # reference them, which are printed as a summary after the build
+        self.stats: dict[str, dict] = {}
+        self.references: dict[str, set[str]] = {}
+
+        # Resolve summary file relative to the configuration file, if given
+        self.summary_file = None
+        if self.config.summary_file:
+            self.summary_file = os.path.join(
+                os.path.dirname(config.config_file_path),
+                os.path.normpath(self.config.summary_file)
+            )
+
+        # Initialize patches, which map content hashes of style sheets and
+        # scripts to the URLs of external assets they reference
+        self.patches: dict[str, list[str]] = {}
+        self.patches_used: dict[str, list[str]] = {}
+        self.patches_paths: set[str] = set()
+        self.patches_file = os.path.join(
+            os.path.abspath(self.config.cache_dir), "patches.json"
+        )
+
+        # Load patches if they exist and the cache should be used
+        if os.path.isfile(self.patches_file) and self.config.cache:
+            try:
+                with open(self.patches_file) as f:
+                    self.patches = json.load(f)
+            except:
+                pass
+
+        # Initialize collection of rewritten fragments, which are memoized, as
+        # the same tags are usually found on every page of the site
+        self.fragments: dict[tuple, tuple[str, list[URL], list[URL]]] = {}
         self.assets_expr_map = {
             ".css": r"url\((\s*http?[^)]+)\)",
             ".js": r"[\"'](http[^\"']+\.(?:css|js(?:on)?))[\"']",
             **self.config.assets_expr_map
         }
 
+        # Compute digest of settings that affect which external assets are
+        # extracted from style sheets and scripts - it's part of the key of
+        # patches, so changing those settings invalidates them
+        self.patches_settings = sha256(json.dumps([
+            self.assets_expr_map,
+            self.config.assets_include,
+            self.config.assets_exclude
+        ], sort_keys = True).encode("utf-8")).hexdigest()
+
         # Set log level or disable logging altogether - @todo when refactoring
         # this plugin for the next time, we should put this into a factory
         if not self.config.log:
@@ -100,6 +215,7 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
             # downloaded. Create and enqueue a job for each external asset.
             for url in self._parse_media(initiator):
                 if not self._is_excluded(url, initiator):
+                    self._reference(url, initiator)
                     file = self._queue(url, config, concurrent = True)
 
                     # If site URL is not given, ensure that Mermaid.js is always
@@ -135,6 +251,15 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
             if not self._is_excluded(url):
                 self._queue(url, config, concurrent = True)
 
+        # Find all external images in the Markdown sources of all pages, and
+        # prefetch them, so downloads overlap with rendering, instead of being
+        # started after each page was rendered
+        if self.config.assets_fetch and self.config.assets_prefetch:
+            for initiator in files.documentation_pages():
+                for url in self._parse_markdown(initiator):
+                    if self._is_prefetchable(url):
+                        self._prefetch(url, config)
+
     # Process external images in page (run latest) - this stage is the earliest
     # we can start processing external images, since images are the most common
     # type of external asset when writing. Thus, we create and enqueue a job for
@@ -173,16 +298,29 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
         if not self.config.enabled:
             return
 
-        # Reconcile concurrent jobs and clear thread pool, as we will reuse the
-        # same thread pool for fetching all remaining external assets
-        wait(self.pool_jobs)
-        self.pool_jobs.clear()
+        # Reconcile concurrent jobs, as we must hand all downloaded assets to
+        # MkDocs, before the optimize plugin evaluates them
+        self._check_jobs(self.fetcher.wait())
+        self._check_lock()
+
+        # Deduplicate external assets by content hash, so all references to
+        # external assets with identical content point to a single file
+        if self.config.assets_dedupe:
+            self._dedupe()
 
         # Append all downloaded assets that are not style sheets or scripts to
         # MkDocs's collection of files, making them available to other plugins
         # for further processing. The remaining exteral assets are patched
         # before copying, which is done at the end of the build process.
         for file in self.assets:
+            if file.url in self.assets_skipped:
+                continue
+
+            # Skip external asset if it's a duplicate
+            if file.src_uri in self.assets_canonical:
+                continue
+
+            # Hand external asset to MkDocs, if it's not a style sheet or script
             _, extension = posixpath.splitext(file.dest_uri)
             if extension not in [".css", ".js"]:
                 self.assets_done.append(file)
@@ -218,14 +356,22 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
         if not self.config.enabled:
             return
 
-        # Reconcile concurrent jobs and clear thread pool, as we will reuse the
-        # same thread pool for patching all links to external assets
-        wait(self.pool_jobs)
-        self.pool_jobs.clear()
+        # Reconcile concurrent jobs, as we will reuse the same thread pool for
+        # patching all links to external assets
+        self._check_jobs(self.fetcher.wait())
+        self._check_lock()
 
         # Spawn concurrent job to patch all links to dependent external asset
         # in all style sheet and script files
         for file in self.assets:
+            if file.url in self.assets_skipped:
+                continue
+
+            # Skip external asset if it's a duplicate
+            if file.src_uri in self.assets_canonical:
+                continue
+
+            # Patch external style sheet or script
             _, extension = posixpath.splitext(file.dest_uri)
             if extension in [".css", ".js"]:
                 self.pool_jobs.append(self.pool.submit(
@@ -240,7 +386,167 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
         # Reconcile concurrent jobs for the last time, so the plugins following
         # in the build process always have a consistent state to work with
         wait(self.pool_jobs)
-        self.pool.shutdown()
+
+        # Copy external assets that were discovered late to the paths that we
+        # promised, if the extension was resolved differently after download
+        for file, promise in self.assets_late.values():
+            if file.abs_dest_path != promise.abs_dest_path:
+                if os.path.isfile(file.abs_dest_path):
+                    copy_file(file.abs_dest_path, promise.abs_dest_path)
+
+        # Shut down fetcher, thread pool and HTTP session
+        self._shutdown()
+
+        # Save manifest if cache should be used
+        if self.config.cache:
+            os.makedirs(os.path.dirname(self.manifest_file), exist_ok = True)
+            with open(self.manifest_file, "w") as f:
+                f.write(json.dumps(self.manifest, indent = 2, sort_keys = True))
+
+            # Save patches of style sheets and scripts used in this build
+            with open(self.patches_file, "w") as f:
+                f.write(json.dumps(self.patches_used, indent = 2))
+
+        # Prune patched files and blobs that were not used in this build
+        self._prune()
+
+        # Save lockfile if it should be created or updated
+        if self.config.lock and not self.lock_frozen:
+            with open(self.lock_file, "w") as f:
+                f.write(json.dumps(self.lock, indent = 2, sort_keys = True))
+
+        # Print summary and write statistics of external assets
+        if self.stats:
+            if self.config.print_summary:
+                self._print_summary()
+            if self.summary_file:
+                self._write_summary()
+
+    # Shut down fetcher and thread pool if the build was aborted, as they're
+    # otherwise only shut down at the end of the build
+    def on_build_error(self, *, error):
+        if not self.config.enabled:
+            return
+
+        # Shut down fetcher, thread pool and HTTP session
+        self._shutdown()
+
+    # Shut down fetcher and thread pool when serving ends, as the last build
+    # might have been aborted
+    def on_shutdown(self):
+        if not self.config.enabled:
+            return
+
+        # Shut down fetcher, thread pool and HTTP session
+        self._shutdown()
+
+    # -------------------------------------------------------------------------
+
+    # Shut down fetcher, thread pool and HTTP session - this is safe to call
+    # more than once, as the build might be aborted after shutting down. If
+    # we're on Python 3.9 and above, cancel all pending futures that have not
+    # yet been scheduled, which is only the case if the build was aborted.
+    def _shutdown(self):
+        self.fetcher.shutdown()
+        if sys.version_info >= (3, 9):
+            self.pool.shutdown(cancel_futures = True)
+        else:
+            self.pool.shutdown()
+
+        # Close HTTP session
+        self.session.close()
+
+    # Create HTTP session - connections are pooled and kept alive for each host,
+    # so consecutive downloads from the same host don't need to establish a
+    # new connection. The size of each pool limits the number of concurrent
+    # connections to a single host, and threads wait for a free connection.
+    def _create_session(self):
+        session = requests.Session()
+        session.headers["User-Agent"] = " ".join([
+
+            # Set user agent explicitly, so Google Fonts gives us *.woff2
+            # files, which according to caniuse.com is the only format we
+            # need to download as it covers the entire range of browsers
+            # we're officially supporting.
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            "AppleWebKit/537.36 (KHTML, like Gecko)",
+            "Chrome/98.0.4758.102 Safari/537.36"
+        ])
+
+        # Retry requests that failed due to rate limiting or server errors with
+        # exponential backoff, respecting the `Retry-After` header if given
+        retry = Retry(
+            total = self.config.retries,
+            backoff_factor = self.config.retries_backoff,
+            status_forcelist = [429, 500, 502, 503, 504],
+            raise_on_status = False
+        )
+
+        # Mount adapter for HTTP and HTTPS, keeping pools for up to 32 hosts
+        adapter = HTTPAdapter(
+            pool_connections = 32,
+            pool_maxsize = self.config.concurrency_per_host,
+            pool_block = True,
+            max_retries = retry
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # Return session
+        return session
+
+    # -------------------------------------------------------------------------
+
+    # Check jobs that fetched external assets for errors - if an external asset
+    # was discovered late, the page already references the promised file, which
+    # is never written if the job failed, so we raise the error, as we did when
+    # those external assets were fetched synchronously. Otherwise, we report the
+    # error and keep the URL of the external asset, unless it was prefetched,
+    # but never referenced, e.g., because it's part of a code block.
+    def _check_jobs(self, jobs: dict[str, Future]):
+        for full, job in jobs.items():
+            if full in self.assets_failed or job.cancelled():
+                continue
+
+            # Skip job if it succeeded or was never referenced
+            if not job.exception() or full in self.assets_prefetched:
+                continue
+
+            # Raise error if the external asset was discovered late
+            if full in self.assets_late:
+                job.result()
+
+            # Report error and keep URL of external asset
+            file = self.assets.get_file_from_path(full)
+            self._fail(full, file, job.exception())
+
+    # Report error of job that fetched external asset, and keep the URL of the
+    # external asset, as if it was skipped
+    def _fail(self, full: str, file: File | None, error: BaseException):
+        self.assets_failed.add(full)
+        if file:
+            self.assets_skipped.add(file.url)
+
+        # Report error
+        log.warning(f"Couldn't fetch external file: {full}\n{error}")
+
+    # Check if the cached copy of the given file is stale - the time to live is
+    # taken from the `Cache-Control` header of the last response, if given
+    def _is_stale(self, file: File):
+        if not self.config.cache_revalidate:
+            return False
+
+        # External assets that were cached before validators were stored are
+        # considered stale, so they are revalidated once
+        meta = self.manifest.get(file.url)
+        if not meta:
+            return True
+
+        # Check if time to live has expired
+        ttl = meta.get("max_age")
+        if ttl is None:
+            ttl = self.config.cache_ttl
+        return time.time() >= meta["time"] + ttl
 
     # -------------------------------------------------------------------------
 
@@ -249,14 +555,13 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
         hostname = url.hostname or self.site.hostname
         return hostname != self.site.hostname
 
-    # Check if the given URL is excluded
+    # Check if the given URL is excluded - the reason for exclusion is memoized
+    # for each URL, as the same URLs are checked for every page, but printed
+    # every time, so it's reported for each initiator as before
     def _is_excluded(self, url: URL, initiator: File | None = None):
-        if not self._is_external(url):
-            return True
-
-        # Skip if external assets must not be processed
-        if not self.config.assets:
-            return True
+        reason = self._find_exclusion(url)
+        if not reason:
+            return False
 
         # If initiator is given, format for printing
         via = ""
@@ -267,35 +572,59 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
                 Style.RESET_ALL
             ])
 
-        # Check if URL matches one of the inclusion patterns
-        if self.config.assets_include:
-            for pattern in self.config.assets_include:
-                if fnmatch(self._path_from_url(url), pattern):
-                    return False
-
-            # File is not included
+        # Print reason if file is not included or excluded by patterns
+        if reason in ["inclusion", "exclusion"]:
             log.debug(
                 f"Excluding external file '{url.geturl()}' {via}due to "
-                f"inclusion patterns"
+                f"{reason} patterns"
             )
-            return True
-
-        # Check if URL matches one of the exclusion patterns
-        for pattern in self.config.assets_exclude:
-            if fnmatch(self._path_from_url(url), pattern):
-                log.debug(
-                    f"Excluding external file '{url.geturl()}' {via}due to "
-                    f"exclusion patterns"
-                )
-                return True
 
         # Print warning if fetching is not enabled
-        if not self.config.assets_fetch:
+        elif reason == "fetch":
             log.warning(f"External file: {url.geturl()} {via}")
-            return True
+
+        # File is excluded
+        return True
+
+    # Check if the given URL can be prefetched - this is the same check as for
+    # exclusion, but without printing, as the URL is checked again when it's
+    # discovered on the rendered page
+    def _is_prefetchable(self, url: URL):
+        return not self._find_exclusion(url)
+
+    # Find reason for exclusion of the given URL, if any, and memoize it
+    def _find_exclusion(self, url: URL):
+        if url not in self.excluded:
+            self.excluded[url] = self._resolve_exclusion(url)
+
+        # Return reason for exclusion
+        return self.excluded[url]
+
+    # Resolve reason for exclusion of the given URL, if any
+    def _resolve_exclusion(self, url: URL):
+        if not self._is_external(url):
+            return "internal"
+
+        # Skip if external assets must not be processed
+        if not self.config.assets:
+            return "assets"
+
+        # Check if URL matches one of the inclusion patterns
+        path = self._path_from_url(url)
+        if self.assets_include:
+            if not self.assets_include.match(path):
+                return "inclusion"
+
+        # Check if URL matches one of the exclusion patterns
+        elif self.assets_exclude and self.assets_exclude.match(path):
+            return "exclusion"
+
+        # Check if fetching is not enabled
+        elif not self.config.assets_fetch:
+            return "fetch"
 
         # File is not excluded
-        return False
+        return None
 
     # -------------------------------------------------------------------------
 
@@ -330,23 +659,109 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
         with open(initiator.abs_src_path, encoding = "utf-8-sig") as f:
             return [urlparse(url) for url in re.findall(expr, f.read())]
 
+    # Parse and extract all external images from the Markdown source of a page,
+    # i.e., inline and reference-style images, as well as images in HTML. This
+    # doesn't need to be exact, as images are discovered again on the page.
+    def _parse_markdown(self, initiator: File) -> list[URL]:
+        markdown = initiator.content_string
+
+        # Remove all fenced code blocks and code spans, as images inside them
+        # are not rendered - fences may be indented, e.g., inside content tabs
+        markdown = re.sub(
+            r"^[ \t]*((`|~)\2{2,})[^\n]*\n.*?(?:^[ \t]*\1\2*[ \t]*$|\Z)",
+            "", markdown, flags = re.M | re.S
+        )
+        markdown = re.sub(
+            r"(?<!`)(`+)(?!`).+?(?<!`)\1(?!`)",
+            "", markdown, flags = re.S
+        )
+
+        # Find all link reference definitions
+        refs = {
+            key.lower(): value for key, value in re.findall(
+                r"^ {0,3}\[([^\]]+)\]:\s*<?(https?://[^>\s]+)",
+                markdown, flags = re.M
+            )
+        }
+
+        # Find and extract all external image URLs
+        urls = re.findall(
+            r"!\[[^\]]*\]\(\s*<?(https?://[^)>\s]+)|"
+            r"<img[^>]+src=['\"]?(https?://[^'\"\s>]+)",
+            markdown, flags = re.I
+        )
+
+        # Resolve reference-style images - if the reference is empty, the
+        # alternative text is used as the reference
+        for alt, key in re.findall(r"!\[([^\]]*)\]\[([^\]]*)\]", markdown):
+            url = refs.get((key or alt).lower())
+            if url:
+                urls.append((url, ""))
+
+        # Return all external image URLs
+        return [urlparse(inline or html) for inline, html in urls]
+
     # Parse template or page HTML and find all external links that need to be
     # replaced. Many of the assets should already be downloaded earlier, i.e.,
     # everything that was directly referenced in the document, but there may
     # still exist external assets that were added by third-party plugins.
     def _parse_html(self, output: str, initiator: File, config: MkDocsConfig):
 
-        # Resolve callback
-        def resolve(file: File):
+        # Resolve callback - if the URL of the external asset includes a hash
+        # fragment, add it to the resolved URL, e.g. for dark/light images, see
+        # https://t.ly/7b16Y. The file is shared among all references to the
+        # external asset, and with duplicates, so it must not be changed.
+        def resolve(file: File, url: URL):
             if is_error_template(initiator.src_uri):
                 base = urlparse(config.site_url or "/")
-                return posixpath.join(base.path, file.url)
+                value = posixpath.join(base.path, file.url)
             else:
-                return file.url_relative_to(initiator)
+                value = file.url_relative_to(initiator)
 
-        # Replace callback
+            # Add hash fragment, if given
+            if url.fragment:
+                value += f"#{url.fragment}"
+
+            # Return resolved URL
+            return value
+
+        # Exclusion callback - remember all URLs that are excluded, as they
+        # must be checked again when a memoized fragment is reused, so that
+        # they are reported for each initiator
+        def is_excluded(url: URL, excluded: list[URL]):
+            if self._is_excluded(url, initiator):
+                excluded.append(url)
+                return True
+
+            # URL is not excluded
+            return False
+
+        # Replace callback - rewritten fragments are memoized, since resolved
+        # URLs only differ for initiators with a different scope
         def replace(match: Match):
-            el = self._parse_fragment(match.group())
+            key = (match.group(), scope)
+            if key in self.fragments:
+                data, excluded, referenced = self.fragments[key]
+                for url in excluded:
+                    self._is_excluded(url, initiator)
+
+            # Otherwise rewrite fragment and memoize it
+            else:
+                excluded: list[URL] = []
+                referenced: list[URL] = []
+                data = rewrite(match.group(), excluded, referenced)
+                self.fragments[key] = data, excluded, referenced
+
+            # Record initiator for all referenced external assets
+            for url in referenced:
+                self._reference(url, initiator)
+
+            # Return rewritten fragment
+            return data
+
+        # Rewrite callback
+        def rewrite(fragment: str, excluded: list[URL], referenced: list[URL]):
+            el = self._parse_fragment(fragment)
 
             # Handle external link
             if self.config.links and el.tag == "a":
@@ -366,7 +781,7 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
             # Handle external style sheet or preconnect hint
             if el.tag == "link":
                 url = urlparse(el.get("href"))
-                if not self._is_excluded(url, initiator):
+                if not is_excluded(url, excluded):
                     rel = el.get("rel", "")
 
                     # Replace external preconnect hint
@@ -376,24 +791,52 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
                     # Replace external style sheet or favicon
                     if rel == "stylesheet" or rel == "icon":
                         file = self._queue(url, config)
-                        el.set("href", resolve(file))
+                        if file:
+                            el.set("href", resolve(file, url))
+
+                        # Remember referenced external asset
+                        referenced.append(url)
 
             # Handle external script or image
             if el.tag == "script" or el.tag == "img":
                 url = urlparse(el.get("src"))
-                if not self._is_excluded(url, initiator):
+                if not is_excluded(url, excluded):
                     file = self._queue(url, config)
-                    el.set("src", resolve(file))
+                    if file:
+                        el.set("src", resolve(file, url))
+
+                    # Remember referenced external asset
+                    referenced.append(url)
 
             # Return element as string
             return self._print(el)
 
         # Find and replace all external asset URLs in current page
+        scope = self._scope(initiator)
         return re.sub(
             r"<(?:(?:a|link)[^>]+href|(?:script|img)[^>]+src)=['\"]?http[^>]+>",
             replace, output, flags = re.I | re.M
         )
 
+    # Compute scope of initiator for memoizing rewritten fragments - external
+    # assets are resolved relative to the initiator, so resolved URLs are the
+    # same for all initiators with the same depth, unless the initiator shares
+    # the top-level directory with external assets, which is rather rare. URLs
+    # are resolved relative to the site in error templates.
+    def _scope(self, initiator: File):
+        if is_error_template(initiator.src_uri):
+            return None
+
+        # Compute directory of initiator, and use it as scope if the initiator
+        # shares the top-level directory with external assets
+        base = posixpath.dirname(initiator.url)
+        path = [name for name in base.split("/") if name not in ["", "."]]
+        if path and path[0] == self.config.assets_fetch_dir.split("/")[0]:
+            return base
+
+        # Otherwise return depth of initiator
+        return len(path)
+
     # -------------------------------------------------------------------------
 
     # Print element as string - what could possibly go wrong? We're parsing
@@ -415,92 +858,195 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
         path = self._path_from_url(url)
         full = posixpath.join(self.config.assets_fetch_dir, path)
 
-        # Try to retrieve existing file
-        file = self.assets.get_file_from_path(full)
+        # Return nothing if fetching the external asset failed before, so the
+        # caller keeps the URL of the external asset as it is
+        if full in self.assets_failed:
+            return None
+
+        # Try to retrieve promised file, if the external asset was discovered
+        # late and is fetched in the background, or the existing file
+        if full in self.assets_late:
+            _, file = self.assets_late[full]
+        else:
+            file = self.assets.get_file_from_path(full)
+
+        # Create and enqueue job to fetch external asset, if not yet known
         if not file:
 
             # Compute path to external asset, which is sourced from the cache
             # directory, and generate file to register it with MkDocs as soon
             # as it was downloaded. This allows other plugins to apply
-            # additional processing.
-            file = self._path_to_file(path, config)
-            file.url = url.geturl()
-
-            # Spawn concurrent job to fetch external asset if the extension is
-            # known and the concurrent flag is set. In that case, this function
-            # is called in a context where no replacements are carried out, so
-            # the caller must only ensure to reconcile the concurrent jobs.
+            # additional processing. If the external asset was prefetched, we
+            # use its file, as its job is already scheduled.
+            if full in self.assets_prefetched:
+                file = self.assets_prefetched.pop(full)
+            else:
+                file = self._path_to_file(path, config)
+                file.url = url.geturl()
+
+            # Compute promised file, if the external asset is fetched from a
+            # context in which replacements are done, i.e., it's discovered
+            # late, and there's no job for it yet whose result we can reuse
+            promise = None
+            if not concurrent and full not in self.fetcher:
+                promise = self._promise(path, url, config)
+
+            # Schedule concurrent job to fetch external asset if the extension
+            # is known and the concurrent flag is set. In that case, this
+            # function is called in a context where no replacements are carried
+            # out, so the caller must only ensure to reconcile concurrent jobs.
             _, extension = posixpath.splitext(url.path)
             if extension and concurrent:
-                self.pool_jobs.append(self.pool.submit(
-                    self._fetch, file, config
-                ))
-
-            # Fetch external asset synchronously, as it either has no extension
-            # or is fetched from a context in which replacements are done
+                self.fetcher.submit(full, file.url, self._fetch, file, config)
+
+            # Schedule job to fetch external asset in the background, if it is
+            # fetched from a context in which replacements are done, but its
+            # destination path can be determined upfront. Rewriting the page
+            # doesn't need to wait for the download, as we return the promised
+            # file right away and reconcile the job in `on_post_build`.
+            elif promise:
+                self.assets_late[full] = (file, promise)
+                self.fetcher.submit(full, file.url, self._fetch, file, config)
+
+            # Fetch external asset synchronously, as it has no extension and is
+            # not cached yet, so its destination path is only known once it was
+            # downloaded. If the asset is already being fetched, wait for it,
+            # unless we're running inside a job, which must never wait. In that
+            # case, the job fetching the asset registers it, and since jobs are
+            # concurrent, the caller only reconciles them and needs no result.
+            # If the asset is fetched by another job, e.g., because it was
+            # prefetched, errors are reported, and the URL is kept as it is.
             else:
-                self._fetch(file, config)
+                scheduled = full in self.fetcher
+                try:
+                    file = self.fetcher.run(
+                        full, self._fetch, file, config,
+                        timeout = self.config.assets_fetch_timeout
+                    )
+
+                # Keep URL of external asset for this reference, if it takes
+                # too long - the job might still succeed for later references
+                except TimeoutError:
+                    if not scheduled:
+                        raise
+                    log.warning(
+                        f"Timed out waiting for external file: {file.url}"
+                    )
+                    return None
+
+                # Report error and keep URL of external asset
+                except Exception as e:
+                    if not scheduled:
+                        raise
+                    self._fail(full, file, e)
+                    return None
+
+                # Return nothing if we must not wait for the job
+                if not file:
+                    return None
 
             # Register external asset as file - it might have already been
             # registered, and since MkDocs 1.6, trigger a deprecation warning
             if not self.assets.get_file_from_path(file.src_uri):
                 self.assets.append(file)
 
-        # If the URL of the external asset includes a hash fragment, add it to
-        # the returned file, e.g. for dark/light images - see https://t.ly/7b16Y
-        if url.fragment:
-            file.url += f"#{url.fragment}"
+            # Return promised file, if the external asset is fetched late
+            if full in self.assets_late:
+                _, file = self.assets_late[full]
 
-        # Return file associated with external asset
-        return file
+        # Return nothing if the external asset was skipped, so the caller keeps
+        # the URL of the external asset as it is
+        if file.url in self.assets_skipped:
+            return None
 
-    # Fetch external asset referenced through the given file
-    def _fetch(self, file: File, config: MkDocsConfig):
+        # Return canonical file if the external asset is a duplicate - note that
+        # the file is shared, so the caller adds the hash fragment of the URL
+        return self.assets_canonical.get(file.src_uri, file)
 
-        # Check if external asset needs to be downloaded
-        if not os.path.isfile(file.abs_src_path) or not self.config.cache:
-            path = file.abs_src_path
-
-            # Download external asset
-            log.info(f"Downloading external file: {file.url}")
-            res = requests.get(file.url, headers = {
-
-                # Set user agent explicitly, so Google Fonts gives us *.woff2
-                # files, which according to caniuse.com is the only format we
-                # need to download as it covers the entire range of browsers
-                # we're officially supporting.
-                "User-Agent": " ".join([
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-                    "AppleWebKit/537.36 (KHTML, like Gecko)",
-                    "Chrome/98.0.4758.102 Safari/537.36"
-                ])
-            })
+    # Prefetch external asset, i.e., schedule a job to fetch it, but don't
+    # register it yet, since it's only registered when it's discovered on the
+    # rendered page. Otherwise, we'd copy images from code blocks to the site.
+    def _prefetch(self, url: URL, config: MkDocsConfig):
+        path = self._path_from_url(url)
+        full = posixpath.join(self.config.assets_fetch_dir, path)
+        if full in self.assets_prefetched or full in self.fetcher:
+            return
 
-            # Compute expected file extension and append if missing
-            mime = res.headers["content-type"].split(";")[0]
-            extension = extensions.get(mime)
-            if extension and not path.endswith(extension):
-                path += extension
+        # Compute path to external asset and schedule job to fetch it
+        file = self._path_to_file(path, config)
+        file.url = url.geturl()
+        self.assets_prefetched[full] = file
+        self.fetcher.submit(full, file.url, self._fetch, file, config)
+
+    # Compute promised file for an external asset that is discovered late, i.e.,
+    # the file the external asset will be written to once it was fetched. If
+    # the asset is already cached, the extension is resolved from the cached
+    # copy, so this doesn't need to wait for the network. If the URL has no
+    # extension and the asset is not cached, there's nothing we can promise,
+    # and the same is true if the asset might be skipped because of its size.
+    def _promise(self, path: str, url: URL, config: MkDocsConfig):
+        promise = self._path_to_file(path, config)
+
+        # Return nothing if the external asset might be skipped because of its
+        # size, which we only know after downloading it
+        if self.config.assets_max_size and self.config.assets_max_size_skip:
+            cached = os.path.isfile(promise.abs_src_path)
+            if not cached or not self.config.cache:
+                return
+
+        # Resolve extension from cached copy, if it exists
+        _, extension = posixpath.splitext(url.path)
+        if os.path.islink(promise.abs_src_path):
+            _, extension = os.path.splitext(
+                os.path.realpath(promise.abs_src_path)
+            )
 
-            # Save to file and create symlink if no extension was present
-            self._save_to_file(path, res.content)
-            if path != file.abs_src_path:
+            # Append extension if it was added when creating the symlink
+            if not promise.abs_dest_path.endswith(extension):
+                promise.dest_uri += extension
+                promise.abs_dest_path += extension
 
-                # Creating symlinks might fail on Windows. Thus, we just print
-                # a warning and continue - see https://bit.ly/3xYFzcZ
-                try:
-                    os.symlink(os.path.basename(path), file.abs_src_path)
-                except OSError as e:
-                    if e.errno != errno.EEXIST:
-                        log.warning(
-                            f"Couldn't create symbolic link: {file.src_uri}"
-                        )
-
-                    # Fall back for when the symlink could not be created. This
-                    # means that the plugin will download the original file on
-                    # every build, as the content type cannot be resolved from
-                    # the file extension.
-                    file.abs_src_path = path
+        # Return nothing if the extension is unknown
+        elif not extension:
+            return
+
+        # Compute destination URL and return promised file
+        promise.url = promise.dest_uri
+        return promise
+
+    # Fetch external asset referenced through the given file
+    def _fetch(self, file: File, config: MkDocsConfig):
+        url = urlparse(file.url)._replace(fragment = "").geturl()
+        start = time.perf_counter()
+
+        # Resolve external asset from lockfile, if it exists
+        status, size = "hit", 0
+        if self.lock_frozen:
+            self._resolve_from_lock(file, self.lock.get(url))
+
+        # Check if external asset needs to be downloaded or revalidated - if
+        # the download fails, record it before passing on the error
+        elif not os.path.isfile(file.abs_src_path) or not self.config.cache:
+            try:
+                status, size = self._download(file)
+            except requests.RequestException:
+                latency = time.perf_counter() - start
+                self._record(url, file, "failed", 0, latency)
+                raise
+
+        # Revalidate external asset, if stale
+        elif self._is_stale(file):
+            status, size = self._download(file, revalidate = True)
+
+        # Record statistics for external asset
+        self._record(url, file, status, size, time.perf_counter() - start)
+
+        # Return file if the external asset was skipped, and record it in the
+        # lockfile, so it's skipped again when resolving from the lockfile
+        if file.url in self.assets_skipped:
+            if self.config.lock and not self.lock_frozen:
+                self.lock[url] = { "skipped": True }
+            return file
 
         # Resolve destination if file points to a symlink
         _, extension = os.path.splitext(file.abs_src_path)
@@ -517,74 +1063,430 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
                 file.dest_uri += extension
                 file.abs_dest_path += extension
 
+        # Compute content hash of external asset, if necessary
+        digest = None
+        if self.config.assets_dedupe or self.config.lock:
+            if self.config.assets_dedupe or not self.lock_frozen:
+                digest = _digest(file.abs_src_path)
+
+        # Record cached copy and content hash of external asset in lockfile
+        if self.config.lock and not self.lock_frozen:
+            self.lock[url] = {
+                "path": os.path.relpath(
+                    file.abs_src_path, os.path.abspath(self.config.cache_dir)
+                ).replace(os.sep, "/"),
+                "hash": digest
+            }
+
+        # Link cached copy of external asset to blob with the same content, and
+        # remember content hash to deduplicate external assets in the site
+        if self.config.assets_dedupe:
+            self._link_to_blob(file.abs_src_path, digest)
+            self.assets_digest[file.src_uri] = digest
+
         # Compute destination URL
         file.url = file.dest_uri
 
-        # Parse and enqueue dependent external assets
+        # Parse and enqueue dependent external assets, and record the external
+        # asset as their initiator, e.g., a style sheet referencing a font
         for url in self._parse_media(file):
             if not self._is_excluded(url, file):
+                self._reference(url, file)
                 self._queue(url, config, concurrent = True)
 
-    # Patch all links to external assets in the given file
+        # Return file
+        return file
+
+    # Record statistics for the external asset with the given URL, i.e., how it
+    # was resolved, the number of transferred bytes and the latency
+    def _record(
+        self, url: str, file: File, status: str, size: int, latency: float
+    ):
+        self.stats[url] = {
+            "host": urlparse(url).hostname,
+            "status": status,
+            "transferred": size,
+            "latency": latency,
+            "size": 0
+        }
+
+        # Record size of cached copy, if it exists
+        if os.path.isfile(file.abs_src_path):
+            self.stats[url]["size"] = os.path.getsize(file.abs_src_path)
+
+    # Record the given initiator as referencing the external asset with the
+    # given URL, e.g., a page, or a style sheet or script
+    def _reference(self, url: URL, initiator: File):
+        url = url._replace(fragment = "").geturl()
+        self.references.setdefault(url, set()).add(initiator.src_uri)
+
+    # Log summary of external assets for each host, sorted by latency, so it's
+    # easy to spot which hosts slow down the build
+    def _print_summary(self):
+        status = ["hit", "revalidated", "downloaded", "skipped", "failed"]
+
+        # Accumulate statistics for each host
+        hosts: dict[str, dict] = {}
+        for stats in self.stats.values():
+            host = hosts.setdefault(stats["host"], {
+                **dict.fromkeys(status, 0),
+                "transferred": 0, "latency": 0, "size": 0
+            })
+
+            # Count status and sum up transferred bytes, latency and size
+            host[stats["status"]] += 1
+            for key in ["transferred", "latency", "size"]:
+                host[key] += stats[key]
+
+        # Print summary for each host
+        for name, host in sorted(
+            hosts.items(), key = lambda item: -item[1]["latency"]
+        ):
+            counts = ", ".join([
+                f"{host[key]} {key}" for key in status if host[key]
+            ])
+            log.info(
+                f"External assets from {name}: {_size(host['size'])}, "
+                f"{_size(host['transferred'])} transferred in "
+                f"{host['latency']:.2f}s ({counts})"
+            )
+
+    # Write statistics of external assets to the summary file as JSON
+    def _write_summary(self):
+        data = {}
+        for url, stats in self.stats.items():
+            data[url] = {
+                **stats, "pages": sorted(self.references.get(url, []))
+            }
+
+        # Save summary file
+        os.makedirs(os.path.dirname(self.summary_file), exist_ok = True)
+        with open(self.summary_file, "w") as f:
+            f.write(json.dumps(data, indent = 2, sort_keys = True))
+
+    # Link cached copy of external asset at the given path to the blob with the
+    # given content hash, so external assets with identical content, which are
+    # served from different URLs, are only stored once in the cache. If hard
+    # links are not supported, external assets are just stored separately.
+    def _link_to_blob(self, path: str, digest: str):
+        blob = os.path.join(
+            os.path.abspath(self.config.cache_dir), "blobs", digest[:2], digest
+        )
+
+        # Create blob from cached copy, or replace cached copy with a hard link
+        # to the blob, unless they're already the same file
+        try:
+            os.makedirs(os.path.dirname(blob), exist_ok = True)
+            if not os.path.exists(blob):
+                os.link(path, blob)
+            elif not os.path.samefile(path, blob):
+                os.link(blob, f"{path}.tmp")
+                os.replace(f"{path}.tmp", path)
+        except OSError:
+            pass
+
+    # Deduplicate external assets by content hash - for each content hash, the
+    # external asset with the first path is used as the canonical file, which
+    # is the only one written to the site directory, so that all references
+    # point to it. External assets discovered late are not deduplicated.
+    def _dedupe(self):
+        canonical: dict[str, File] = {}
+        for file in sorted(self.assets, key = lambda file: file.src_uri):
+            digest = self.assets_digest.get(file.src_uri)
+            if not digest or file.url in self.assets_skipped:
+                continue
+
+            # Map duplicate to canonical file
+            if digest in canonical:
+                self.assets_canonical[file.src_uri] = canonical[digest]
+            else:
+                canonical[digest] = file
+
+    # Resolve external asset referenced through the given file from the given
+    # entry of the lockfile - the cached copy must exist and match the content
+    # hash that was recorded. Otherwise, the external asset is skipped, and the
+    # build fails once all jobs are reconciled, as we must not make requests.
+    def _resolve_from_lock(self, file: File, entry: dict | None):
+        if not entry:
+            self.lock_errors.append(f"External file not locked: {file.url}")
+
+        # Skip external asset if it was skipped when creating the lockfile
+        elif entry.get("skipped"):
+            pass
+
+        # Check if cached copy exists and matches the recorded content hash
+        else:
+            path = os.path.join(
+                os.path.abspath(self.config.cache_dir), entry["path"]
+            )
+            if not os.path.isfile(path):
+                self.lock_errors.append(
+                    f"External file not cached: {file.url}"
+                )
+            elif _digest(path) != entry["hash"]:
+                self.lock_errors.append(
+                    f"External file doesn't match lockfile: {file.url}"
+                )
+
+            # Resolve external asset from cached copy
+            else:
+                file.abs_src_path = path
+                return
+
+        # Skip external asset
+        self.assets_skipped.add(file.url)
+
+    # Check if external assets could be resolved from the lockfile, and abort
+    # the build if an external asset is not locked or its cached copy is not
+    # available, which is necessary for builds without network access
+    def _check_lock(self):
+        if not self.lock_errors:
+            return
+
+        # Print all errors and abort
+        raise PluginError("\n".join([
+            f"Couldn't resolve external files from lockfile: {self.lock_file}",
+            *sorted(f"  - {message}" for message in self.lock_errors),
+            "Set 'lock_update: true' to update the lockfile."
+        ]))
+
+    # Download external asset referenced through the given file - if the asset
+    # should be revalidated, a conditional request is issued, using the
+    # validators of the last response, so it's only downloaded when changed
+    def _download(self, file: File, revalidate = False):
+        path = file.abs_src_path
+        size = 0
+
+        # Set validators of last response, if the asset should be revalidated
+        meta = self.manifest.get(file.url, {})
+        headers = {}
+        if revalidate:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        # Download or revalidate external asset - if revalidation fails, e.g.,
+        # because we're offline, we just continue using the cached copy
+        try:
+            if revalidate:
+                log.debug(f"Revalidating external file: {file.url}")
+            else:
+                log.info(f"Downloading external file: {file.url}")
+            res = self.session.get(file.url, headers = headers, stream = True)
+
+            # Stream response to file, and close it when done, so the connection
+            # is returned to the pool, even if we don't consume the response
+            with res:
+                meta = _metadata(res, meta)
+
+                # Skip if external asset was not modified
+                if res.status_code == 304:
+                    self.manifest[file.url] = meta
+                    return "revalidated", size
+
+                # Print summary for file if asset was modified
+                if revalidate:
+                    log.info(f"Downloading modified external file: {file.url}")
+
+                # Compute expected file extension and append if missing
+                mime = res.headers["content-type"].split(";")[0]
+                extension = extensions.get(mime)
+                if extension and not path.endswith(extension):
+                    path += extension
+
+                # Save to file, unless the external asset exceeds the maximum
+                # size and is skipped - if it should have been revalidated, we
+                # just continue using the cached copy
+                size = self._save_from_response(path, res, file)
+                if size is None:
+                    if revalidate:
+                        return "revalidated", 0
+
+                    # Skip external asset
+                    self.assets_skipped.add(file.url)
+                    return "skipped", 0
+
+        # Handle failed download or revalidation
+        except requests.RequestException:
+            if not revalidate:
+                raise
+
+            # Print summary for file and continue with cached copy
+            log.info(f"Couldn't revalidate external file: {file.url}")
+            return "revalidated", size
+
+        # Update metadata of external asset
+        self.manifest[file.url] = meta
+
+        # Create symlink if no extension was present
+        if path != file.abs_src_path:
+
+            # Creating symlinks might fail on Windows. Thus, we just print a
+            # warning and continue - see https://bit.ly/3xYFzcZ
+            try:
+                os.symlink(os.path.basename(path), file.abs_src_path)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    log.warning(
+                        f"Couldn't create symbolic link: {file.src_uri}"
+                    )
+
+                # Fall back for when the symlink could not be created. This
+                # means that the plugin will download the original file on
+                # every build, as the content type cannot be resolved from
+                # the file extension.
+                file.abs_src_path = path
+
+        # Return status and number of transferred bytes
+        return "downloaded", size
+
+    # Patch all links to external assets in the given file - if caching is
+    # enabled, the patched file is cached, keyed by the content hash of the
+    # source file and all replacements, so unchanged files are linked from the
+    # cache, instead of being patched again on every build
     def _patch(self, initiator: File):
-        with open(initiator.abs_src_path, encoding = "utf-8-sig") as f:
+        with open(initiator.abs_src_path, "rb") as f:
+            data = f.read()
+
+        # Resolve callback
+        def resolve(value: str):
 
-            # Replace callback
-            def replace(match: Match):
-                value = match.group(1)
+            # Map URL to canonical path
+            path = self._path_from_url(urlparse(value))
+            full = posixpath.join(self.config.assets_fetch_dir, path)
 
-                # Map URL to canonical path
-                path = self._path_from_url(urlparse(value))
-                full = posixpath.join(self.config.assets_fetch_dir, path)
+            # Try to retrieve existing file
+            file = self.assets.get_file_from_path(full)
+            if not file:
+                name = os.readlink(os.path.join(self.config.cache_dir, full))
+                full = posixpath.join(posixpath.dirname(full), name)
 
-                # Try to retrieve existing file
+                # Try again after resolving symlink
                 file = self.assets.get_file_from_path(full)
-                if not file:
-                    name = os.readlink(os.path.join(self.config.cache_dir, full))
-                    full = posixpath.join(posixpath.dirname(full), name)
 
-                    # Try again after resolving symlink
-                    file = self.assets.get_file_from_path(full)
+            # This can theoretically never happen, as we're sure that we
+            # only replace files that we successfully extracted. However,
+            # we might have missed several cases, so it's better to throw
+            # here than to swallow the error.
+            if not file:
+                log.error(
+                    "File not found. This is likely a bug in the built-in "
+                    "privacy plugin. Please create an issue with a minimal "
+                    "reproduction."
+                )
+                sys.exit(1)
 
-                # This can theoretically never happen, as we're sure that we
-                # only replace files that we successfully extracted. However,
-                # we might have missed several cases, so it's better to throw
-                # here than to swallow the error.
-                if not file:
-                    log.error(
-                        "File not found. This is likely a bug in the built-in "
-                        "privacy plugin. Please create an issue with a minimal "
-                        "reproduction."
-                    )
-                    sys.exit(1)
+            # Keep URL of external asset if it was skipped
+            if file.url in self.assets_skipped:
+                return value
+
+            # Use canonical file if the external asset is a duplicate
+            file = self.assets_canonical.get(file.src_uri, file)
 
-                # Create absolute URL for asset in script
-                if file.url.endswith(".js"):
-                    url = posixpath.join(self.site.geturl(), file.url)
+            # Create absolute URL for asset in script
+            if file.url.endswith(".js"):
+                return posixpath.join(self.site.geturl(), file.url)
 
-                # Create relative URL for everything else
-                else:
-                    url = file.url_relative_to(initiator)
+            # Create relative URL for everything else
+            else:
+                return file.url_relative_to(initiator)
 
-                # Switch external asset URL to local path
-                return match.group().replace(value, url)
+        # Copy patched file from cache, if the source file and the settings
+        # that affect extraction are unchanged, and all external assets it
+        # references resolve to the same URLs - the URLs are remembered from
+        # the last build, so we don't need to scan the source file again
+        key = data + self.patches_settings.encode("utf-8")
+        digest = sha256(key).hexdigest()
+        if self.config.cache and digest in self.patches:
+            values = self.patches[digest]
+            path = self._path_to_patch(initiator, digest, {
+                value: resolve(value) for value in values
+            })
 
-            # Resolve replacement expression according to asset type
-            _, extension = posixpath.splitext(initiator.dest_uri)
-            expr = re.compile(self.assets_expr_map[extension], re.I | re.M)
+            # Copy patched file, if it exists
+            if os.path.isfile(path):
+                self.patches_used[digest] = values
+                self.patches_paths.add(path)
+                return _copy(path, initiator.abs_dest_path)
 
-            # Resolve links to external assets in file
-            self._save_to_file(
-                initiator.abs_dest_path,
-                expr.sub(replace, f.read())
-            )
+        # Replace callback
+        replacements: dict[str, str] = {}
+        def replace(match: Match):
+            value = match.group(1)
+            if value not in replacements:
+                replacements[value] = resolve(value)
+
+            # Switch external asset URL to local path
+            return match.group().replace(value, replacements[value])
+
+        # Resolve replacement expression according to asset type
+        _, extension = posixpath.splitext(initiator.dest_uri)
+        expr = re.compile(self.assets_expr_map[extension], re.I | re.M)
+
+        # Resolve links to external assets in file
+        content = expr.sub(replace, data.decode("utf-8-sig"))
+        if not self.config.cache:
+            return self._save_to_file(initiator.abs_dest_path, content)
+
+        # Cache patched file and copy it, and remember URLs for the next build
+        path = self._path_to_patch(initiator, digest, replacements)
+        self._save_to_file(path, content)
+        self.patches_used[digest] = list(replacements)
+        self.patches_paths.add(path)
+        _copy(path, initiator.abs_dest_path)
+
+    # Prune patched files and blobs that were not used in this build, so the
+    # cache doesn't grow with every change to a style sheet or script, or with
+    # every update of an external asset
+    def _prune(self):
+        root = os.path.abspath(self.config.cache_dir)
+        used = {
+            "patches": self.patches_paths,
+            "blobs": {
+                os.path.join(root, "blobs", digest[:2], digest)
+                    for digest in self.assets_digest.values()
+            }
+        }
+
+        # Remove all files that are not used anymore
+        for kind, paths in used.items():
+            for base, _, names in os.walk(os.path.join(root, kind)):
+                for name in names:
+                    path = os.path.join(base, name)
+                    if path not in paths:
+                        os.remove(path)
+
+    # Compute path of patched file in cache for the given content hash of the
+    # source file and replacements of external asset URLs with local paths
+    def _path_to_patch(
+        self, initiator: File, digest: str, replacements: dict[str, str]
+    ):
+        _, extension = posixpath.splitext(initiator.dest_uri)
+        key = json.dumps([digest, replacements], sort_keys = True)
+        key = sha256(key.encode("utf-8")).hexdigest()
+
+        # Return path of patched file
+        return os.path.join(
+            os.path.abspath(self.config.cache_dir),
+            "patches", key[:2], f"{key}{extension}"
+        )
 
     # -------------------------------------------------------------------------
 
     # Normalize (= canonicalize) path by removing trailing slashes, and ensure
     # that hidden folders (`.` after `/`) are unhidden. Otherwise MkDocs will
-    # not consider them being part of the build and refuse to copy them.
+    # not consider them being part of the build and refuse to copy them. The
+    # path is memoized for each URL, as the same URLs are found on every page.
     def _path_from_url(self, url: URL):
+        if url not in self.paths:
+            self.paths[url] = self._resolve_path(url)
+
+        # Return memoized path
+        return self.paths[url]
+
+    # Resolve canonical path for the given URL
+    def _resolve_path(self, url: URL):
         path = posixpath.normpath(url.path)
         path = re.sub(r"/\.", "/_", path)
 
@@ -611,14 +1513,155 @@ class PrivacyPlugin(BasePlugin[PrivacyConfig]):
             False
         )
 
-    # Create a file on the system with the given content
+    # Check if the given size exceeds the maximum size of external assets, and
+    # print a warning, as well as whether the external asset is skipped
+    def _is_oversized(self, file: File, size: int):
+        limit = self.config.assets_max_size
+        if not limit or size <= limit:
+            return False
+
+        # Print warning and skip if configured, or continue otherwise
+        if self.config.assets_max_size_skip:
+            log.warning(
+                f"Skipping external file exceeding maximum size of {limit} "
+                f"bytes: {file.url}"
+            )
+            return True
+        else:
+            log.warning(
+                f"External file exceeds maximum size of {limit} bytes: "
+                f"{file.url}"
+            )
+            return False
+
+    # Save response to file in chunks, so large external assets don't need to
+    # be held in memory - the content is streamed to a temporary file, which is
+    # moved into place atomically, so that interrupted builds never leave
+    # partial files in the cache. Returns the number of bytes written, or
+    # nothing if the external asset was skipped.
+    def _save_from_response(
+        self, path: str, res: requests.Response, file: File
+    ):
+        size = int(res.headers.get("content-length") or 0)
+
+        # Check size upfront, if the server told us - if the external asset is
+        # oversized and not skipped, we don't need to check it again
+        limit = self.config.assets_max_size
+        if size > (limit or size):
+            if self._is_oversized(file, size):
+                return None
+            else:
+                limit = None
+
+        # Stream response to temporary file next to the target file - each file
+        # is only downloaded by a single job, so the name doesn't need to be
+        # unique, and a partial file of an interrupted build is just replaced
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        temp = f"{path}.tmp"
+        try:
+            size = 0
+            with open(temp, "wb") as f:
+                for chunk in res.iter_content(chunk_size = 64 * 1024):
+                    size += len(chunk)
+
+                    # Check size, as the server might not have told us
+                    if size > (limit or size):
+                        if self._is_oversized(file, size):
+                            return None
+                        else:
+                            limit = None
+
+                    # Write chunk to temporary file
+                    f.write(chunk)
+
+            # Move temporary file into place
+            os.replace(temp, path)
+            return size
+
+        # Remove temporary file, if it was not moved into place
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+
+    # Create a file on the system with the given content - it's moved into
+    # place, so that files that are hard linked to it are never changed
     def _save_to_file(self, path: str, content: str | bytes):
         os.makedirs(os.path.dirname(path), exist_ok = True)
         if isinstance(content, str):
             content = bytes(content, "utf-8")
-        with open(path, "wb") as f:
+        with open(f"{path}.tmp", "wb") as f:
             f.write(content)
 
+        # Move file into place
+        os.replace(f"{path}.tmp", path)
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+# Compile the given patterns into a single regular expression, or return
+# nothing if no patterns are given - like `fnmatch`, matching is case
+# insensitive on case insensitive file systems
+def _compile(patterns: list[str]):
+    if not patterns:
+        return None
+
+    # Compile patterns into alternation
+    flags = re.I if os.path.normcase("A") != "A" else 0
+    return re.compile("|".join(map(translate, patterns)), flags)
+
+# Format size in human-readable form
+def _size(value: float):
+    for unit in ["B", "kB", "MB", "GB", "TB", "PB", "EB", "ZB"]:
+        if abs(value) < 1000.0:
+            return f"{value:3.1f} {unit}"
+        value /= 1000.0
+
+# Copy the file at the given path to the given destination - the file is never
+# linked, as other plugins might change files in the site directory in place,
+# and it's copied next to the destination and moved into place, so that files
+# hard linked to the destination, e.g., by earlier versions, are never changed
+def _copy(path: str, dest: str):
+    os.makedirs(os.path.dirname(dest), exist_ok = True)
+    shutil.copyfile(path, f"{dest}.tmp")
+    os.replace(f"{dest}.tmp", dest)
+
+# Compute content hash of the file at the given path
+def _digest(path: str):
+    with open(path, "rb") as f:
+        return sha256(f.read()).hexdigest()
+
+# Compute metadata of external asset from response, i.e., the validators and
+# time to live, falling back to the given metadata of the last response
+def _metadata(res: requests.Response, meta: dict):
+    max_age = None
+
+    # Compute time to live from `Cache-Control` and `Age` headers
+    cache_control = res.headers.get("cache-control", "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        max_age = 0
+    else:
+        match = re.search(r"max-age=(\d+)", cache_control)
+        if match:
+            age = res.headers.get("age", "")
+            age = int(age) if age.isdigit() else 0
+            max_age = max(0, int(match.group(1)) - age)
+
+        # Responses to conditional requests might omit the `Cache-Control`
+        # header, in which case we keep the time to live of the last response
+        elif res.status_code == 304:
+            max_age = meta.get("max_age")
+
+    # Return metadata
+    return {
+        "etag": res.headers.get("etag", meta.get("etag")),
+        "last_modified": res.headers.get(
+            "last-modified", meta.get("last_modified")
+        ),
+        "max_age": max_age,
+        "time": time.time()
+    }
+
 # -----------------------------------------------------------------------------
 # Data
 # -----------------------------------------------------------------------------
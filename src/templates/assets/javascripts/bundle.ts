@@ -27,14 +27,17 @@ import {
   NEVER,
   Observable,
   Subject,
+  concat,
   defer,
   delay,
   filter,
   map,
   merge,
   mergeWith,
+  of,
   shareReplay,
-  switchMap
+  switchMap,
+  toArray
 } from "rxjs"
 
 import { configuration, feature } from "./_"
@@ -77,6 +80,7 @@ import {
 } from "./components"
 import {
   SearchIndex,
+  decodeSearchIndex,
   fetchSitemap,
   setupAlternate,
   setupClipboardJS,
@@ -95,6 +99,33 @@ import "./polyfills"
  * Functions - @todo refactor
  * ------------------------------------------------------------------------- */
 
+/**
+ * Fetch search index chunks
+ *
+ * The offline plugin can be configured to split the search index into several
+ * scripts, each of which contains a chunk of the search index as a string. The
+ * chunks are loaded in order, joined and parsed as JSON.
+ *
+ * @param chunks - Number of chunks
+ *
+ * @returns Search index observable
+ */
+function fetchSearchIndexChunks(chunks: number): Observable<SearchIndex> {
+  return concat(...Array.from({ length: chunks }, (_, i) => (
+    watchScript(
+      `${new URL(`search/search_index.${i + 1}.js`, config.base)}`
+    )
+      .pipe(
+        // @ts-ignore - @todo fix typings
+        map(() => __index_chunk as string)
+      )
+  )))
+    .pipe(
+      toArray(),
+      map(data => JSON.parse(data.join("")))
+    )
+}
+
 /**
  * Fetch search index
  *
@@ -108,12 +139,20 @@ function fetchSearchIndex(): Observable<SearchIndex> {
       .pipe(
         // @ts-ignore - @todo fix typings
         map(() => __index),
+        switchMap(index => typeof index.chunks === "number"
+          ? fetchSearchIndexChunks(index.chunks)
+          : of(index)
+        ),
+        map(decodeSearchIndex),
         shareReplay(1)
       )
   } else {
     return requestJSON<SearchIndex>(
       new URL("search/search_index.json", config.base)
     )
+      .pipe(
+        map(decodeSearchIndex)
+      )
   }
 }
 
@@ -71,6 +71,37 @@ export interface SearchIndex {
   options: SearchOptions               /* Search options */
 }
 
+/**
+ * Search index page table (compact encoding)
+ */
+export interface CompactSearchPages {
+  location: string[]                   /* Page locations */
+  title: string[]                      /* Page titles */
+  tags?: (number[] | null)[]           /* Page tags (string table indexes) */
+  boost?: (number | null)[]            /* Page boosts */
+}
+
+/**
+ * Search index section table (compact encoding)
+ */
+export interface CompactSearchSections {
+  page: number[]                       /* Section pages (page table indexes) */
+  anchor: string[]                     /* Section anchors */
+  title: (string | null)[]             /* Section titles (null = page title) */
+  text: string[]                       /* Section texts */
+}
+
+/**
+ * Search index (compact encoding)
+ */
+export interface CompactSearchIndex {
+  config: SearchConfig                 /* Search configuration */
+  schema: 1                            /* Schema version */
+  tags: string[]                       /* Tag string table */
+  pages: CompactSearchPages            /* Page table */
+  sections: CompactSearchSections      /* Section table */
+}
+
 /* ----------------------------------------------------------------------------
  * Helper types
  * ------------------------------------------------------------------------- */
@@ -121,3 +152,53 @@ export function setupSearchDocumentMap(
   /* Return search document map */
   return map
 }
+
+/**
+ * Decode a search index
+ *
+ * The search plugin can be configured to emit a compact encoding of the search
+ * index, which stores the location, title, tags and boost of each page only
+ * once, and references pages from sections by index. This function expands
+ * the compact encoding into search documents, and returns search indexes that
+ * are not compact as they are.
+ *
+ * @param index - Search index
+ *
+ * @returns Search index
+ */
+export function decodeSearchIndex(
+  index: SearchIndex | CompactSearchIndex
+): SearchIndex {
+  if (!("schema" in index))
+    return index
+
+  /* Check schema version */
+  const { config, schema, tags, pages, sections } = index
+  if (schema !== 1)
+    throw new Error(`Unsupported search index schema: ${schema}`)
+
+  /* Expand sections into search documents */
+  const docs: SearchDocument[] = []
+  for (let i = 0; i < sections.page.length; i++) {
+    const page = sections.page[i]
+    const doc: SearchDocument = {
+      location: pages.location[page] + sections.anchor[i],
+      title: sections.title[i] ?? pages.title[page],
+      text: sections.text[i]
+    }
+
+    /* Add page tags and boost, if given */
+    const ids = pages.tags?.[page]
+    if (ids)
+      doc.tags = ids.map(id => tags[id])
+    const boost = pages.boost?.[page]
+    if (typeof boost === "number")
+      doc.boost = boost
+
+    /* Add search document */
+    docs.push(doc)
+  }
+
+  /* Return search index */
+  return { config, docs } as SearchIndex
+}
@@ -0,0 +1,135 @@
+# Copyright (c) 2016-2024 Martin Donath <martin.donath@squidfunk.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import json
+import os
+import unittest
+
+from material.plugins.offline.plugin import OfflinePlugin
+from tempfile import TemporaryDirectory
+
+from tests.helpers import stub_config
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+class TestOfflinePlugin(unittest.TestCase):
+    """
+    Test cases for offline plugin.
+    """
+
+    def setUp(self):
+        self.site = TemporaryDirectory()
+        self.config = stub_config(site_dir = self.site.name)
+
+        # Write search index with multi-byte characters
+        self.path = os.path.join(self.site.name, "search")
+        self.index = { "docs": [{ "text": "Ünïcödé 中文 " * 20 }] }
+        os.makedirs(self.path)
+        with open(
+            os.path.join(self.path, "search_index.json"), "w",
+            encoding = "utf-8"
+        ) as f:
+            json.dump(self.index, f, ensure_ascii = False)
+
+    def tearDown(self):
+        self.site.cleanup()
+
+    # -------------------------------------------------------------------------
+
+    def build(self, **settings: dict) -> list[str]:
+        """
+        Run the post-build hook with the given settings.
+
+        Arguments:
+            **settings: Plugin settings.
+
+        Returns:
+            The chunks of the search index.
+        """
+        plugin = OfflinePlugin()
+        self.assertEqual(plugin.load_config(settings), ([], []))
+        plugin.on_post_build(config = self.config)
+
+        # Read number of chunks, and then the chunks
+        with open(os.path.join(self.path, "search_index.js")) as f:
+            data = f.read()
+        if "chunks" not in data:
+            return []
+
+        # Read chunks
+        chunks = []
+        for i in range(json.loads(data.split(" = ", 1)[1])["chunks"]):
+            with open(
+                os.path.join(self.path, f"search_index.{i + 1}.js"),
+                encoding = "utf-8"
+            ) as f:
+                chunks.append(json.loads(f.read().split(" = ", 1)[1]))
+
+        # Return chunks
+        return chunks
+
+    # -------------------------------------------------------------------------
+
+    def test_inline_search_index(self):
+        """
+        Should inline the search index into a single script.
+        """
+        self.assertEqual(self.build(), [])
+        with open(os.path.join(self.path, "search_index.js")) as f:
+            data = f.read()
+
+        # Perform assertions
+        self.assertEqual(json.loads(data.split(" = ", 1)[1]), self.index)
+
+    def test_split_search_index(self):
+        """
+        Should split the search index into chunks of the given size in bytes.
+        """
+        chunks = self.build(search_chunk_size = 100)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(json.loads("".join(chunks)), self.index)
+
+        # All chunks except for the last should be of roughly the given size,
+        # as multi-byte characters are never split between chunks
+        for chunk in chunks[:-1]:
+            self.assertLessEqual(abs(len(chunk.encode()) - 100), 3)
+
+    def test_split_search_index_smaller_than_character(self):
+        """
+        Should not split multi-byte characters, even for tiny chunk sizes.
+        """
+        chunks = self.build(search_chunk_size = 1)
+        self.assertEqual(json.loads("".join(chunks)), self.index)
+
+    def test_split_search_index_removes_stale_chunks(self):
+        """
+        Should remove chunks written by a previous build.
+        """
+        self.assertGreater(len(self.build(search_chunk_size = 100)), 1)
+        self.assertEqual(len(self.build(search_chunk_size = 10000)), 1)
+        self.assertEqual(self.build(), [])
+
+        # Ensure that no chunks remain
+        self.assertEqual(sorted(os.listdir(self.path)), [
+            "search_index.js",
+            "search_index.json"
+        ])
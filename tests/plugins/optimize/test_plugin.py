@@ -0,0 +1,620 @@
+# Copyright (c) 2016-2024 Martin Donath <martin.donath@squidfunk.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import gzip
+import json
+import os
+import unittest
+
+from concurrent.futures import Future
+from material.plugins.optimize.plugin import (
+    OptimizePlugin, _version_pngquant
+)
+from mkdocs.exceptions import PluginError
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from tests.helpers import stub_config, stub_file, stub_page
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+class TestOptimizePlugin(unittest.TestCase):
+    """
+    Test cases for optimize plugin.
+    """
+
+    def setUp(self):
+        self.temp = TemporaryDirectory()
+        self.addCleanup(self.temp.cleanup)
+        docs = os.path.join(self.temp.name, "docs")
+        os.makedirs(docs)
+        os.makedirs(os.path.join(self.temp.name, "cache"))
+
+        # Create configuration with docs and site directory in temporary
+        # directory, so that we can write files to both of them
+        self.config = stub_config(
+            docs_dir = docs,
+            site_dir = os.path.join(self.temp.name, "site")
+        )
+        self.config.config_file_path = os.path.join(
+            self.temp.name, "mkdocs.yml"
+        )
+
+    # -------------------------------------------------------------------------
+
+    def stub_plugin(self, **settings: dict) -> OptimizePlugin:
+        """
+        Stub an optimize plugin with the given settings.
+
+        Arguments:
+            **settings: Plugin settings.
+
+        Returns:
+            The optimize plugin.
+        """
+        plugin = OptimizePlugin()
+        settings.setdefault("cache_dir", os.path.join(self.temp.name, "cache"))
+        self.assertEqual(plugin.load_config(settings), ([], []))
+
+        # Initialize plugin with an empty manifest, as the default manifest is
+        # shared by all instances, and shut it down after the test
+        plugin.manifest = {}
+        plugin.on_startup(command = "build", dirty = False)
+        plugin.on_config(self.config)
+        self.addCleanup(plugin.on_shutdown)
+        return plugin
+
+    def stub_image(self, path: str):
+        """
+        Stub an image in the docs directory.
+
+        Arguments:
+            path: The file path.
+
+        Returns:
+            The file.
+        """
+        file = stub_file(path = path, config = self.config)
+        os.makedirs(os.path.dirname(file.abs_src_path), exist_ok = True)
+        with open(file.abs_src_path, "wb") as f:
+            f.write(path.encode("utf-8"))
+
+        # Return file
+        return file
+
+    def stub_png(self, path: str):
+        """
+        Stub an uncompressed PNG image in the docs directory, and its optimized
+        copy in the cache directory.
+
+        Arguments:
+            path: The file path.
+
+        Returns:
+            The file and the file system path of the optimized copy.
+        """
+        file = stub_file(path = path, config = self.config)
+        os.makedirs(os.path.dirname(file.abs_src_path), exist_ok = True)
+        image = Image.linear_gradient("L").resize((64, 64)).convert("RGB")
+        image.save(file.abs_src_path, compress_level = 0)
+
+        # Copy image to cache directory
+        dest = os.path.join(self.temp.name, "cache", file.src_path)
+        os.makedirs(os.path.dirname(dest), exist_ok = True)
+        image.save(dest, compress_level = 0)
+
+        # Return file and file system path of optimized copy
+        return file, dest
+
+    def stub_site_file(self, path: str, data: bytes):
+        """
+        Stub a file in the site directory.
+
+        Arguments:
+            path: The file path.
+            data: The file data.
+
+        Returns:
+            The file system path.
+        """
+        path = os.path.join(self.config.site_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+        # Return file system path
+        return path
+
+    def stub_variants(
+        self, plugin: OptimizePlugin, path: str,
+        variants: dict[str, list[int]], widths: list[int],
+        dimensions: tuple[int, int]
+    ):
+        """
+        Stub the variants of an optimized image.
+
+        Arguments:
+            plugin: The optimize plugin.
+            path: The file path.
+            variants: The widths of variants for each format.
+            widths: The widths of downscaled variants.
+            dimensions: The dimensions of the image.
+        """
+        plugin.images[path] = Future()
+        plugin.images[path].set_result(None)
+
+        # Associate image with variants, widths and dimensions
+        plugin.variants[path]   = variants
+        plugin.widths[path]     = widths
+        plugin.dimensions[path] = dimensions
+
+    # -------------------------------------------------------------------------
+
+    def test_settings_override(self):
+        plugin = self.stub_plugin(optimize_overrides = {
+            "screenshots/*": dict(optimize_jpg_quality = 90)
+        })
+        default = self.stub_plugin()
+
+        # Check that only files matching the pattern use different settings
+        a = stub_file(path = "a.jpg", config = self.config)
+        b = stub_file(path = "screenshots/b.jpg", config = self.config)
+        self.assertEqual(plugin._settings(a), default._settings(a))
+        self.assertNotEqual(plugin._settings(b), default._settings(b))
+        self.assertEqual(plugin._options(b)["optimize_jpg_quality"], 90)
+        self.assertEqual(plugin._options(b)["optimize_jpg_progressive"], True)
+
+    def test_settings_override_order(self):
+        plugin = self.stub_plugin(optimize_overrides = {
+            "*":             dict(optimize_png_speed = 1),
+            "screenshots/*": dict(optimize_png_speed = 5)
+        })
+
+        # Check that later patterns take precedence
+        a = stub_file(path = "a.png", config = self.config)
+        b = stub_file(path = "screenshots/b.png", config = self.config)
+        self.assertEqual(plugin._options(a)["optimize_png_speed"], 1)
+        self.assertEqual(plugin._options(b)["optimize_png_speed"], 5)
+
+    def test_settings_override_variants(self):
+        plugin = self.stub_plugin(optimize_overrides = {
+            "screenshots/*": dict(optimize_webp_quality = 90)
+        })
+
+        # Check that settings of variants are resolved per file
+        a = stub_file(path = "a.png", config = self.config)
+        b = stub_file(path = "screenshots/b.png", config = self.config)
+        self.assertEqual(plugin._settings(a), plugin._settings(b))
+        self.assertNotEqual(
+            plugin._settings(a, ".webp"),
+            plugin._settings(b, ".webp")
+        )
+        self.assertEqual(
+            plugin._settings(a, ".avif"),
+            plugin._settings(b, ".avif")
+        )
+
+    def test_check_image(self):
+        file = self.stub_image("screenshots/a.jpg")
+        path = os.path.join(self.temp.name, "cache", file.src_path)
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        open(path, "wb").close()
+
+        # Check that the image is unchanged with the same settings
+        plugin = self.stub_plugin()
+        entry, changed = plugin._check_image(file, path)
+        self.assertTrue(changed)
+        plugin.manifest = { f"image:{file.url}": entry }
+        _, changed = plugin._check_image(file, path)
+        self.assertFalse(changed)
+
+        # Check that the image changed when its effective settings changed
+        plugin = self.stub_plugin(optimize_overrides = {
+            "screenshots/*": dict(optimize_jpg_quality = 90)
+        })
+        plugin.manifest = { f"image:{file.url}": entry }
+        _, changed = plugin._check_image(file, path)
+        self.assertTrue(changed)
+
+    def test_batch(self):
+        plugin = self.stub_plugin(
+            concurrency = 1, optimize_png_batch = 10,
+            optimize_overrides = {
+                "screenshots/*": dict(optimize_png_strip = False)
+            }
+        )
+        plugin.pngquant  = "pngquant"
+        plugin.quantizer = "pngquant"
+
+        # Check that PNG images are batched by their effective settings
+        batch = [
+            (stub_file(path = path, config = self.config), path, Future())
+                for path in ["a.png", "screenshots/b.png", "c.png", "d.jpg"]
+        ]
+        chunks = [
+            [path for _, path, _ in chunk]
+                for chunk in plugin._batch(batch)
+        ]
+        self.assertEqual(chunks, [
+            ["d.jpg"], ["a.png", "c.png"], ["screenshots/b.png"]
+        ])
+
+    def test_rewrite_images(self):
+        plugin = self.stub_plugin(optimize_widths = [640])
+        self.stub_variants(plugin, "a.png", {}, [640], (1280, 720))
+
+        # Check that source set, sizes and intrinsic size are added
+        page = stub_page(path = "index.md", config = self.config)
+        self.assertEqual(
+            plugin._rewrite_images("<img src=\"a.png\">", page),
+            "<img src=\"a.png\" srcset=\"a.640w.png 640w, a.png 1280w\" "
+            "width=\"1280\" height=\"720\">"
+        )
+
+    def test_rewrite_images_width(self):
+        plugin = self.stub_plugin(
+            optimize_widths = [640], optimize_sizes = "100vw"
+        )
+        self.stub_variants(plugin, "a.png", {}, [640], (1280, 720))
+
+        # Check that sizes and height are derived from width set by author
+        page = stub_page(path = "index.md", config = self.config)
+        self.assertEqual(
+            plugin._rewrite_images("<img src=\"a.png\" width=\"320\">", page),
+            "<img src=\"a.png\" width=\"320\" "
+            "srcset=\"a.640w.png 640w, a.png 1280w\" sizes=\"320px\" "
+            "height=\"180\">"
+        )
+
+    def test_rewrite_images_height(self):
+        plugin = self.stub_plugin(optimize_webp = True)
+        self.stub_variants(plugin, "a.png", {}, [], (1280, 720))
+
+        # Check that width is derived from height set by author
+        page = stub_page(path = "index.md", config = self.config)
+        self.assertEqual(
+            plugin._rewrite_images("<img src=\"a.png\" height=\"360\">", page),
+            "<img src=\"a.png\" height=\"360\" width=\"640\">"
+        )
+
+    def test_rewrite_images_variants(self):
+        plugin = self.stub_plugin(
+            optimize_webp = True, optimize_widths = [320, 640]
+        )
+        self.stub_variants(
+            plugin, "a.png", { "webp": [640] }, [320, 640], (1280, 720)
+        )
+
+        # Check that downscaled images are used for variants that are larger
+        page = stub_page(path = "index.md", config = self.config)
+        self.assertEqual(
+            plugin._rewrite_images("<img src=\"a.png\">", page),
+            "<picture>"
+            "<source type=\"image/webp\" srcset=\"a.320w.png 320w, "
+            "a.640w.png.webp 640w, a.png.webp 1280w\">"
+            "<img src=\"a.png\" srcset=\"a.320w.png 320w, a.640w.png 640w, "
+            "a.png 1280w\" width=\"1280\" height=\"720\">"
+            "</picture>"
+        )
+
+    def test_is_minifiable(self):
+        plugin = self.stub_plugin(minify = True)
+
+        # Check that vendored and already minified scripts are excluded
+        for path, expected in [
+            ("assets/javascripts/extra.js", True),
+            ("assets/javascripts/lunr/tinyseg.js", False),
+            ("assets/javascripts/lunr/wordcut.js", False),
+            ("assets/javascripts/bundle.min.js", False),
+            ("assets/stylesheets/extra.css", True)
+        ]:
+            file = stub_file(path = path, config = self.config)
+            self.assertEqual(plugin._is_minifiable(file), expected, path)
+
+    def test_is_optimizable_svg(self):
+        plugin = self.stub_plugin(optimize = False, minify = True)
+
+        # Check that SVG images are minified independent of optimization
+        a = stub_file(path = "a.svg", config = self.config)
+        b = stub_file(path = "b.png", config = self.config)
+        self.assertTrue(plugin._is_optimizable(a))
+        self.assertFalse(plugin._is_optimizable(b))
+
+    def test_on_config_reset(self):
+        plugin = self.stub_plugin(minify = True, compress = True)
+        plugin.minified["index.html"] = (2, 1)
+        plugin.compressed["index.html.gz"] = (2, 1)
+
+        # Check that sizes of previous builds are reset
+        plugin.on_config(self.config)
+        self.assertEqual(plugin.minified, {})
+        self.assertEqual(plugin.compressed, {})
+
+    def test_compress(self):
+        plugin = self.stub_plugin(
+            compress = True, compress_brotli = False,
+            print_gain_summary = False
+        )
+        path = self.stub_site_file("index.html", b"<p>Hello</p>" * 100)
+
+        # Check that side-car is written and associated with hash
+        plugin._on_post_build_compress(config = self.config)
+        with gzip.open(f"{path}.gz") as f:
+            self.assertEqual(f.read(), b"<p>Hello</p>" * 100)
+        self.assertIn("compressed:index.html.gz", plugin.manifest)
+        self.assertIn(f"{path}.gz", plugin.compressed)
+
+    def test_compress_min_size(self):
+        plugin = self.stub_plugin(
+            compress = True, compress_brotli = False,
+            print_gain_summary = False
+        )
+        path = self.stub_site_file("index.html", b"<p>Hello</p>" * 100)
+        plugin._on_post_build_compress(config = self.config)
+
+        # Check that side-car is removed when file is below the threshold
+        self.stub_site_file("index.html", b"<p>Hello</p>")
+        plugin._on_post_build_compress(config = self.config)
+        self.assertFalse(os.path.isfile(f"{path}.gz"))
+        self.assertNotIn("compressed:index.html.gz", plugin.manifest)
+
+    def test_compress_existing(self):
+        plugin = self.stub_plugin(
+            compress = True, compress_brotli = False,
+            print_gain_summary = False
+        )
+        self.stub_site_file("sitemap.xml", b"<urlset/>" * 200)
+        path = self.stub_site_file("sitemap.xml.gz", b"sitemap")
+
+        # Check that side-cars not written by the plugin are left untouched
+        plugin._on_post_build_compress(config = self.config)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"sitemap")
+        self.assertNotIn("compressed:sitemap.xml.gz", plugin.manifest)
+
+    def test_compress_prune(self):
+        plugin = self.stub_plugin(
+            compress = True, compress_brotli = False,
+            print_gain_summary = False
+        )
+        a = self.stub_site_file("a.html", b"<p>A</p>" * 200)
+        b = self.stub_site_file("b.html", b"<p>B</p>" * 200)
+        plugin._on_post_build_compress(config = self.config)
+
+        # Check that entries and cached files of removed files are pruned
+        os.remove(b)
+        os.remove(f"{b}.gz")
+        plugin._on_post_build_compress(config = self.config)
+        self.assertEqual(
+            [key for key in plugin.manifest if key.endswith(".gz")],
+            ["compressed:a.html.gz"]
+        )
+        names = []
+        for _, _, files in os.walk(plugin.config.cache_dir):
+            names.extend(name for name in files if name.endswith(".gz"))
+        self.assertEqual(names, [
+            f"{plugin.manifest['compressed:a.html.gz']['hash']}.gz"
+        ])
+        self.assertTrue(os.path.isfile(f"{a}.gz"))
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_convert_image(self):
+        plugin = self.stub_plugin()
+        file, path = self.stub_png("a.png")
+
+        # Check that variants are generated and used if they're smaller
+        for format in ["webp", "avif"]:
+            with self.subTest(format = format):
+                if not features.check(format):
+                    self.skipTest(f"pillow lacks support for {format}")
+
+                # Convert image and check variant and manifest entry
+                self.assertTrue(
+                    plugin._convert_image(file, path, "a", format, self.config)
+                )
+                with Image.open(f"{path}.{format}") as image:
+                    self.assertEqual(image.format, format.upper())
+                    self.assertEqual(image.size, (64, 64))
+                self.assertEqual(
+                    plugin.manifest[f"variant:a.png.{format}"]["hash"], "a"
+                )
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_convert_image_width(self):
+        plugin = self.stub_plugin()
+        file, path = self.stub_png("a.png")
+        with open(path, "rb") as f:
+            data = f.read()
+
+        # Stub downscaled image, as it's only compared by size
+        with open(os.path.join(os.path.dirname(path), "a.32w.png"), "wb") as f:
+            f.write(data)
+
+        # Check that downscaled variants are converted
+        self.assertTrue(
+            plugin._convert_image(file, path, "a", "webp", self.config, 32)
+        )
+        with Image.open(os.path.join(
+            os.path.dirname(path), "a.32w.png.webp"
+        )) as image:
+            self.assertEqual(image.size, (32, 32))
+        self.assertIn("variant:a.32w.png.webp", plugin.manifest)
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_convert_image_larger(self):
+        plugin = self.stub_plugin()
+        file, path = self.stub_png("a.png")
+        with open(path, "wb") as f:
+            f.write(b"a")
+
+        # Check that variants larger than the optimized image are not used
+        self.assertFalse(
+            plugin._convert_image(file, path, "a", "webp", self.config)
+        )
+        self.assertTrue(os.path.isfile(f"{path}.webp"))
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_convert_image_cached(self):
+        plugin = self.stub_plugin()
+        file, path = self.stub_png("a.png")
+        plugin._convert_image(file, path, "a", "webp", self.config)
+
+        # Check that variants are not converted again if unchanged
+        os.remove(file.abs_src_path)
+        self.assertTrue(
+            plugin._convert_image(file, path, "a", "webp", self.config)
+        )
+
+        # Check that variants are converted again if the image changed
+        with self.assertRaises(FileNotFoundError):
+            plugin._convert_image(file, path, "b", "webp", self.config)
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_convert_image_unsupported(self):
+        plugin = self.stub_plugin(optimize_avif = True)
+        file, path = self.stub_png("a.png")
+
+        # Check that an error is raised if pillow lacks support for the format
+        with patch.object(features, "check", return_value = False):
+            with self.assertRaisesRegex(PluginError, "'avif'"):
+                plugin._convert_image(file, path, "a", "avif", self.config)
+        self.assertFalse(os.path.exists(f"{path}.avif"))
+        self.assertNotIn("variant:a.png.avif", plugin.manifest)
+
+    def test_quantizer(self):
+        self.addCleanup(_version_pngquant.cache_clear)
+        with patch("material.plugins.optimize.plugin.which") as which:
+            which.return_value = "/usr/bin/pngquant"
+            with patch("subprocess.run"):
+                plugin = self.stub_plugin()
+
+        # Check that pngquant is used, if available
+        self.assertEqual(plugin.quantizer, "pngquant")
+        self.assertEqual(plugin.pngquant, "/usr/bin/pngquant")
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_quantizer_fallback(self):
+        with patch("material.plugins.optimize.plugin.which") as which:
+            which.return_value = None
+            with self.assertLogs("mkdocs.material.optimize", "INFO"):
+                plugin = self.stub_plugin()
+
+        # Check that pillow is used, if pngquant is not available
+        self.assertEqual(plugin.quantizer, "pillow")
+        self.assertIsNone(plugin.pngquant)
+        self.assertEqual(
+            plugin._settings(stub_file(path = "a.png", config = self.config)),
+            self.stub_plugin(optimize_png_quantizer = "pillow")._settings(
+                stub_file(path = "a.png", config = self.config)
+            )
+        )
+
+    def test_version_pngquant(self):
+        _version_pngquant.cache_clear()
+        self.addCleanup(_version_pngquant.cache_clear)
+
+        # Check that pngquant is only run once for each binary
+        with patch("subprocess.run") as run:
+            run.return_value.stdout = "3.0.3\n"
+            self.assertEqual(_version_pngquant("/a/pngquant"), "3.0.3")
+            self.assertEqual(_version_pngquant("/a/pngquant"), "3.0.3")
+            self.assertEqual(run.call_count, 1)
+            _version_pngquant("/b/pngquant")
+            self.assertEqual(run.call_count, 2)
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_optimize_image_png_pillow(self):
+        plugin = self.stub_plugin(optimize_png_quantizer = "pillow")
+        file, path = self.stub_png("a.png")
+        os.remove(path)
+
+        # Check that the image is quantized to a palette
+        plugin._optimize_image_png(file, path, self.config)
+        with Image.open(path) as image:
+            self.assertEqual(image.mode, "P")
+            self.assertEqual(image.size, (64, 64))
+        self.assertLess(
+            os.path.getsize(path), os.path.getsize(file.abs_src_path)
+        )
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_optimize_image_png_pillow_alpha(self):
+        plugin = self.stub_plugin(optimize_png_quantizer = "pillow")
+        file = stub_file(path = "a.png", config = self.config)
+        image = Image.linear_gradient("L").resize((64, 64)).convert("RGBA")
+        image.putalpha(Image.linear_gradient("L").resize((64, 64)))
+        image.save(file.abs_src_path, compress_level = 0)
+
+        # Check that images with an alpha channel are quantized
+        path = os.path.join(self.temp.name, "cache", "a.png")
+        plugin._optimize_image_png(file, path, self.config)
+        with Image.open(path) as image:
+            self.assertEqual(image.mode, "P")
+
+    @unittest.skipUnless(Image, "requires pillow")
+    def test_optimize_image_png_pillow_larger(self):
+        plugin = self.stub_plugin(optimize_png_quantizer = "pillow")
+        file = stub_file(path = "a.png", config = self.config)
+        Image.new("P", (1, 1)).save(file.abs_src_path, optimize = True)
+
+        # Check that the original image is used, if the result is larger
+        path = os.path.join(self.temp.name, "cache", "a.png")
+        plugin._optimize_image_png(file, path, self.config)
+        with open(path, "rb") as a, open(file.abs_src_path, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_manifest_kinds(self):
+        plugin = self.stub_plugin(print_gain_summary = False)
+        page = stub_page(path = "a.md", config = self.config)
+        file = stub_file(path = "a/index.html", config = self.config)
+        self.assertEqual(page.file.dest_uri, file.dest_uri)
+
+        # Check that pages and assets with the same path don't collide
+        for data, name, item in [
+            ("<p>A</p>", "a.html", page.file),
+            ("<p>B</p>", "b.html", file)
+        ]:
+            path = os.path.join(self.temp.name, "cache", name)
+            plugin._minify_data(data, path, item, self.config)
+        self.assertEqual(sorted(plugin.manifest), [
+            "asset:a/index.html", "page:a/index.html"
+        ])
+
+    def test_manifest_legacy(self):
+        path = os.path.join(self.temp.name, "cache", "manifest.json")
+        with open(path, "w") as f:
+            json.dump({
+                "a.png": "hash",
+                "a.png.webp": { "hash": "hash" },
+                "image:a.png": { "hash": "hash" }
+            }, f)
+
+        # Check that entries without kinds are discarded
+        plugin = self.stub_plugin()
+        self.assertEqual(plugin.manifest, {
+            "image:a.png": { "hash": "hash" }
+        })
@@ -0,0 +1,184 @@
+# Copyright (c) 2016-2024 Martin Donath <martin.donath@squidfunk.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import time
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from material.plugins.privacy.fetcher import Fetcher
+from threading import Event, Lock, Thread
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+class TestFetcher(unittest.TestCase):
+    """
+    Test cases for fetcher.
+    """
+
+    def setUp(self):
+        self.pool = ThreadPoolExecutor(8)
+        self.fetcher = Fetcher(self.pool, 2)
+
+    def tearDown(self):
+        self.fetcher.shutdown()
+        self.pool.shutdown()
+
+    # -------------------------------------------------------------------------
+
+    def test_submit_dedupe(self):
+        """
+        Should run jobs with the same key only once.
+        """
+        calls = []
+        def fn(value: str):
+            calls.append(value)
+            return value
+
+        # Submit jobs and perform assertions
+        a = self.fetcher.submit("key", "https://example.com/a", fn, "a")
+        b = self.fetcher.submit("key", "https://example.com/a", fn, "b")
+        self.assertIs(a, b)
+        self.assertEqual(a.result(timeout = 5), "a")
+        self.assertEqual(calls, ["a"])
+        self.assertIn("key", self.fetcher)
+
+    def test_run_dedupe(self):
+        """
+        Should wait for a job with the same key that is already running.
+        """
+        started, release = Event(), Event()
+        def fn(value: str):
+            started.set()
+            release.wait(5)
+            return value
+
+        # Run job in another thread, and wait for it to start
+        results = []
+        thread = Thread(target = lambda: results.append(
+            self.fetcher.run("key", fn, "a")
+        ))
+        thread.start()
+        started.wait(5)
+
+        # Run job with the same key, which must wait for the first job
+        release.set()
+        self.assertEqual(self.fetcher.run("key", fn, "b"), "a")
+        thread.join(5)
+        self.assertEqual(results, ["a"])
+
+    def test_submit_concurrency_per_host(self):
+        """
+        Should limit the number of concurrent jobs for each host.
+        """
+        lock = Lock()
+        running, peak = {}, {}
+        def fn(host: str):
+            with lock:
+                running[host] = running.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), running[host])
+            time.sleep(0.05)
+            with lock:
+                running[host] -= 1
+
+        # Submit jobs for two hosts and wait for them
+        for i in range(6):
+            for host in ["a.com", "b.com"]:
+                url = f"https://{host}/{i}"
+                self.fetcher.submit(url, url, fn, host)
+
+        # Wait for jobs and perform assertions
+        self.fetcher.wait()
+        self.assertEqual(peak, { "a.com": 2, "b.com": 2 })
+
+    def test_submit_error(self):
+        """
+        Should propagate errors of jobs to their futures.
+        """
+        def fn():
+            raise ValueError("failed")
+
+        # Submit job and perform assertions
+        job = self.fetcher.submit("key", "https://example.com", fn)
+        self.fetcher.wait()
+        with self.assertRaises(ValueError):
+            job.result()
+
+    def test_run_error(self):
+        """
+        Should raise errors of jobs in the owner and in waiting threads.
+        """
+        def fn():
+            raise ValueError("failed")
+
+        # Run job and perform assertions
+        with self.assertRaises(ValueError):
+            self.fetcher.run("key", fn)
+        with self.assertRaises(ValueError):
+            self.fetcher.run("key", fn)
+
+    def test_run_in_job(self):
+        """
+        Should not wait for other jobs when running inside a job.
+
+        This ensures that a job that runs another job which is queued in the
+        executor behind it doesn't deadlock when the executor is exhausted.
+        """
+        pool = ThreadPoolExecutor(1)
+        fetcher = Fetcher(pool, 1)
+        try:
+            queued = Event()
+            def fn():
+                queued.wait(5)
+                return fetcher.run("b", lambda: "c")
+
+            # Submit job that runs a job with the key of a job which is queued
+            # in the executor behind it, as the executor has only one thread
+            job = fetcher.submit("a", "https://example.org/a", fn)
+            blocked = fetcher.submit("b", "https://example.com/b", lambda: "b")
+            queued.set()
+
+            # Ensure that the jobs don't wait for each other
+            self.assertIsNone(job.result(timeout = 5))
+            self.assertEqual(blocked.result(timeout = 5), "b")
+
+        # Shut down fetcher and executor
+        finally:
+            fetcher.shutdown()
+            pool.shutdown()
+
+    def test_shutdown(self):
+        """
+        Should cancel jobs waiting for a free slot, and allow repeated calls.
+        """
+        release = Event()
+        jobs = [
+            self.fetcher.submit(str(i), "https://example.com", release.wait, 5)
+                for i in range(4)
+        ]
+
+        # Wait for the first jobs to start, then shut down
+        time.sleep(0.1)
+        release.set()
+        self.fetcher.shutdown()
+        self.fetcher.shutdown()
+        self.assertTrue(all(job.done() for job in jobs))
+        self.assertTrue(any(job.cancelled() for job in jobs))
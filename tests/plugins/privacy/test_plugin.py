@@ -0,0 +1,1094 @@
+# Copyright (c) 2016-2024 Martin Donath <martin.donath@squidfunk.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import json
+import os
+import requests
+import time
+import unittest
+
+from concurrent.futures import Future
+from fnmatch import fnmatch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import combinations
+from material.plugins.privacy.plugin import (
+    PrivacyPlugin, _compile, _metadata
+)
+from mkdocs.structure.files import File
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from unittest.mock import Mock
+from urllib.parse import urlparse
+
+from tests.helpers import stub_config, stub_file
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler for stub server, which answers with the responses that
+    are registered for each path, in order, repeating the last response.
+    """
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        responses = self.server.responses[self.path]
+        status, headers, body = responses[0]
+        if len(responses) > 1:
+            responses.pop(0)
+
+        # Send response
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Stub server, which runs in a background thread.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.responses: dict[str, list[tuple[int, dict, bytes]]] = {}
+        self.requests: list[tuple[str, dict]] = []
+
+        # Start server in background thread
+        self.thread = Thread(target = self.serve_forever, daemon = True)
+        self.thread.start()
+
+    def url(self, path: str) -> str:
+        """
+        Compute URL for the given path.
+
+        Arguments:
+            path: The path.
+
+        Returns:
+            The URL.
+        """
+        host, port = self.server_address
+        return f"http://{host}:{port}{path}"
+
+    def stop(self):
+        """
+        Stop server and wait for background thread to finish.
+        """
+        self.shutdown()
+        self.server_close()
+        self.thread.join()
+
+# -----------------------------------------------------------------------------
+
+class TestPrivacyPlugin(unittest.TestCase):
+    """
+    Test cases for privacy plugin.
+    """
+
+    def setUp(self):
+        self.temp = TemporaryDirectory()
+        os.makedirs(os.path.join(self.temp.name, "docs"))
+
+        # Create configuration with docs and site directory in temporary
+        # directory, so that we can write files to both of them
+        self.config = stub_config(
+            site_url = "https://example.com/",
+            docs_dir = os.path.join(self.temp.name, "docs"),
+            site_dir = os.path.join(self.temp.name, "site")
+        )
+        self.config.config_file_path = os.path.join(
+            self.temp.name, "mkdocs.yml"
+        )
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    # -------------------------------------------------------------------------
+
+    def stub_plugin(self, **settings: dict) -> PrivacyPlugin:
+        """
+        Stub a privacy plugin with the given settings.
+
+        Arguments:
+            **settings: Plugin settings.
+
+        Returns:
+            The privacy plugin.
+        """
+        plugin = PrivacyPlugin()
+        settings.setdefault("cache_dir", os.path.join(self.temp.name, "cache"))
+        self.assertEqual(plugin.load_config(settings), ([], []))
+
+        # Initialize plugin, and shut it down after the test
+        plugin.on_config(self.config)
+        self.addCleanup(plugin.on_shutdown)
+        return plugin
+
+    def stub_job(self, error: Exception | None = None) -> Future:
+        """
+        Stub a finished job.
+
+        Arguments:
+            error: The error the job failed with.
+
+        Returns:
+            The job.
+        """
+        job = Future()
+        if error:
+            job.set_exception(error)
+        else:
+            job.set_result(None)
+        return job
+
+    def stub_server(self) -> StubServer:
+        """
+        Stub a server, and stop it after the test.
+
+        Returns:
+            The server.
+        """
+        server = StubServer()
+        self.addCleanup(server.stop)
+        return server
+
+    def stub_response(self, headers: dict, chunks: list) -> Mock:
+        """
+        Stub a streamed response.
+
+        Arguments:
+            headers: The response headers.
+            chunks: The chunks of the response body, or errors to raise.
+
+        Returns:
+            The response.
+        """
+        res = Mock(headers = headers, consumed = 0)
+
+        # Yield chunks, or raise errors
+        def iter_content(chunk_size: int):
+            for chunk in chunks:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                res.consumed += 1
+                yield chunk
+
+        # Return response
+        res.iter_content = iter_content
+        return res
+
+    def stub_asset(self, plugin: PrivacyPlugin, path: str) -> File:
+        """
+        Stub a downloaded external asset.
+
+        Arguments:
+            plugin: The privacy plugin.
+            path: The path of the external asset.
+
+        Returns:
+            The file.
+        """
+        file = plugin._path_to_file(path, self.config)
+        file.url = file.dest_uri
+        plugin.assets.append(file)
+        return file
+
+    def stub_source(self, path: str, content: str) -> File:
+        """
+        Stub a file with the given content in the docs directory.
+
+        Arguments:
+            path: The file path.
+            content: The file content.
+
+        Returns:
+            The file.
+        """
+        file = stub_file(path = path, config = self.config)
+        with open(file.abs_src_path, "w") as f:
+            f.write(content)
+
+        # Return file
+        return file
+
+    # -------------------------------------------------------------------------
+
+    def test_lock_file(self):
+        """
+        Should resolve the lockfile relative to the configuration file.
+        """
+        plugin = self.stub_plugin(lock = True, lock_file = "locks/privacy.lock")
+        self.assertEqual(
+            plugin.lock_file,
+            os.path.join(self.temp.name, "locks", "privacy.lock")
+        )
+
+    def test_lock_file_frozen(self):
+        """
+        Should resolve external assets from an existing lockfile.
+        """
+        lock = { "https://example.org/image.png": { "skipped": True } }
+        with open(os.path.join(self.temp.name, "privacy.lock"), "w") as f:
+            json.dump(lock, f)
+
+        # Initialize plugin and perform assertions
+        plugin = self.stub_plugin(lock = True)
+        self.assertTrue(plugin.lock_frozen)
+        self.assertEqual(plugin.lock, lock)
+
+    def test_lock_file_corrupt(self):
+        """
+        Should print a warning and recreate a lockfile that can't be read.
+        """
+        with open(os.path.join(self.temp.name, "privacy.lock"), "w") as f:
+            f.write("{ \"https://example.org/image.png\": {")
+
+        # Initialize plugin and perform assertions
+        with self.assertLogs("mkdocs.material.privacy", "WARNING"):
+            plugin = self.stub_plugin(lock = True)
+        self.assertFalse(plugin.lock_frozen)
+        self.assertEqual(plugin.lock, {})
+
+    def test_parse_html_dedupe_fragment(self):
+        """
+        Should add hash fragments without changing files of duplicates.
+        """
+        plugin = self.stub_plugin(assets_dedupe = True)
+        files = []
+        for path in ["example.org/a.png", "example.org/b.png"]:
+            file = plugin._path_to_file(path, self.config)
+            file.url = file.dest_uri
+            plugin.assets.append(file)
+            files.append(file)
+
+        # Mark second external asset as duplicate of the first
+        a, b = files
+        plugin.assets_canonical[b.src_uri] = a
+
+        # Parse HTML and perform assertions
+        initiator = stub_file(path = "index.md", config = self.config)
+        html = plugin._parse_html("".join([
+            "<img src=\"https://example.org/a.png#only-dark\">",
+            "<img src=\"https://example.org/b.png\">",
+            "<img src=\"https://example.org/a.png\">"
+        ]), initiator, self.config)
+        self.assertEqual(html, "".join([
+            "<img src=\"assets/external/example.org/a.png#only-dark\">",
+            "<img src=\"assets/external/example.org/a.png\">",
+            "<img src=\"assets/external/example.org/a.png\">"
+        ]))
+        self.assertEqual(a.url, "assets/external/example.org/a.png")
+
+    def test_check_jobs_late(self):
+        """
+        Should raise errors of external assets that were discovered late.
+        """
+        plugin = self.stub_plugin()
+        full = "assets/external/example.org/script.js"
+        file = plugin._path_to_file("example.org/script.js", self.config)
+        plugin.assets_late[full] = (file, file)
+
+        # Check jobs and perform assertions
+        with self.assertRaises(ConnectionError):
+            plugin._check_jobs({ full: self.stub_job(ConnectionError()) })
+
+    def test_check_jobs_concurrent(self):
+        """
+        Should report errors and keep the URLs of other external assets.
+        """
+        plugin = self.stub_plugin()
+        full = "assets/external/example.org/image.png"
+        file = plugin._path_to_file("example.org/image.png", self.config)
+        file.url = "https://example.org/image.png"
+        plugin.assets.append(file)
+
+        # Check jobs and perform assertions
+        with self.assertLogs("mkdocs.material.privacy", "WARNING") as logs:
+            plugin._check_jobs({
+                full: self.stub_job(ConnectionError()),
+                "assets/external/example.org/other.png": self.stub_job()
+            })
+            plugin._check_jobs({ full: self.stub_job(ConnectionError()) })
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(plugin.assets_skipped, set([file.url]))
+
+    def test_check_jobs_prefetched(self):
+        """
+        Should ignore errors of prefetched external assets never referenced.
+        """
+        plugin = self.stub_plugin()
+        full = "assets/external/example.org/image.png"
+        file = plugin._path_to_file("example.org/image.png", self.config)
+        plugin.assets_prefetched[full] = file
+
+        # Check jobs and perform assertions
+        plugin._check_jobs({ full: self.stub_job(ConnectionError()) })
+        self.assertEqual(plugin.assets_skipped, set())
+
+    def test_patch(self):
+        """
+        Should patch external assets in style sheets and copy them to the site.
+        """
+        plugin = self.stub_plugin()
+        self.stub_asset(plugin, "example.org/font.woff2")
+        initiator = self.stub_source(
+            "style.css", "a { src: url(https://example.org/font.woff2) }"
+        )
+
+        # Patch style sheet and perform assertions
+        plugin._patch(initiator)
+        with open(initiator.abs_dest_path) as f:
+            self.assertEqual(
+                f.read(),
+                "a { src: url(assets/external/example.org/font.woff2) }"
+            )
+
+        # Patched file must not share its inode with the cache
+        self.assertEqual(len(plugin.patches_paths), 1)
+        for path in plugin.patches_paths:
+            self.assertFalse(os.path.samefile(path, initiator.abs_dest_path))
+            self.assertEqual(os.stat(initiator.abs_dest_path).st_nlink, 1)
+
+    def test_patch_cache_hit(self):
+        """
+        Should copy patched files from the cache, if the source is unchanged.
+        """
+        plugin = self.stub_plugin()
+        self.stub_asset(plugin, "example.org/font.woff2")
+        initiator = self.stub_source(
+            "style.css", "a { src: url(https://example.org/font.woff2) }"
+        )
+        plugin._patch(initiator)
+
+        # Change patched file in cache, so we know it's used
+        for path in plugin.patches_paths:
+            with open(path, "w") as f:
+                f.write("cached")
+
+        # Patch style sheet again in next build and perform assertions
+        patches = plugin.patches_used
+        plugin = self.stub_plugin()
+        self.stub_asset(plugin, "example.org/font.woff2")
+        plugin.patches = patches
+        plugin._patch(initiator)
+        with open(initiator.abs_dest_path) as f:
+            self.assertEqual(f.read(), "cached")
+
+    def test_patch_cache_miss(self):
+        """
+        Should patch files again, if the source changed.
+        """
+        plugin = self.stub_plugin()
+        self.stub_asset(plugin, "example.org/font.woff2")
+        initiator = self.stub_source(
+            "style.css", "a { src: url(https://example.org/font.woff2) }"
+        )
+        plugin._patch(initiator)
+
+        # Change source and patch style sheet again in next build
+        patches = plugin.patches_used
+        plugin = self.stub_plugin()
+        self.stub_asset(plugin, "example.org/font.woff2")
+        plugin.patches = patches
+        initiator = self.stub_source(
+            "style.css", "b { src: url(https://example.org/font.woff2) }"
+        )
+        plugin._patch(initiator)
+
+        # Perform assertions
+        with open(initiator.abs_dest_path) as f:
+            self.assertEqual(
+                f.read(),
+                "b { src: url(assets/external/example.org/font.woff2) }"
+            )
+        self.assertNotEqual(list(plugin.patches_used), list(patches))
+
+    def test_patch_cache_settings(self):
+        """
+        Should patch files again, if settings affecting extraction changed.
+        """
+        plugin = self.stub_plugin()
+        self.stub_asset(plugin, "example.org/font.woff2")
+        initiator = self.stub_source(
+            "style.css", "a { src: url(https://example.org/font.woff2) }"
+        )
+        plugin._patch(initiator)
+
+        # Change patched file in cache, so we'd know if it's used
+        for path in plugin.patches_paths:
+            with open(path, "w") as f:
+                f.write("cached")
+
+        # Patch style sheet again with different settings in the next build
+        for settings in [
+            dict(assets_exclude = ["example.org/*.css"]),
+            dict(assets_include = ["example.org/*"]),
+            dict(assets_expr_map = { ".css": r"url\((https?[^)]+)\)" })
+        ]:
+            patches = plugin.patches_used
+            plugin = self.stub_plugin(**settings)
+            self.stub_asset(plugin, "example.org/font.woff2")
+            plugin.patches = patches
+            plugin._patch(initiator)
+
+            # Perform assertions
+            with open(initiator.abs_dest_path) as f:
+                self.assertNotEqual(f.read(), "cached", settings)
+            self.assertNotEqual(list(plugin.patches_used), list(patches))
+
+    def test_prune(self):
+        """
+        Should prune patched files and blobs not used in this build.
+        """
+        plugin = self.stub_plugin(assets_dedupe = True)
+        self.stub_asset(plugin, "example.org/font.woff2")
+        initiator = self.stub_source(
+            "style.css", "a { src: url(https://example.org/font.woff2) }"
+        )
+        plugin._patch(initiator)
+
+        # Create blobs and a patched file that is not used anymore
+        cache = os.path.join(self.temp.name, "cache")
+        files = {}
+        for name, digest in [("used", "ab" * 32), ("stale", "cd" * 32)]:
+            files[name] = os.path.join(cache, "blobs", digest[:2], digest)
+            plugin._save_to_file(files[name], name)
+        plugin.assets_digest["a"] = "ab" * 32
+        stale = os.path.join(cache, "patches", "ef", "ef.css")
+        plugin._save_to_file(stale, "stale")
+
+        # Prune cache and perform assertions
+        plugin._prune()
+        self.assertTrue(os.path.isfile(files["used"]))
+        self.assertFalse(os.path.isfile(files["stale"]))
+        self.assertFalse(os.path.isfile(stale))
+        for path in plugin.patches_paths:
+            self.assertTrue(os.path.isfile(path))
+
+    def test_compile(self):
+        """
+        Should match the same paths as matching each pattern with fnmatch.
+        """
+        plugin = self.stub_plugin()
+        paths = [
+            plugin._path_from_url(urlparse(url)) for url in [
+                "https://example.org/a.png",
+                "https://example.org/c.png",
+                "https://example.org/ab.png",
+                "https://example.org/nested/a.png",
+                "https://example.org:8080/a.js",
+                "https://example.org/css?family=Roboto",
+                "https://example.org/css.js?v=1",
+                "https://unpkg.com/mermaid@10/dist/mermaid.min.js"
+            ]
+        ]
+        patterns = [
+            "*",
+            "*.js",
+            "example.org/*",
+            "example.org/?.png",
+            "example.org/[ab].png",
+            "example.org/[!ab].png",
+            "example.org:8080/*",
+            "example.org/css.*",
+            "example.org/css.*.js",
+            "unpkg.com/mermaid@*/*"
+        ]
+
+        # Check single patterns and combinations of patterns
+        for size in [1, 2, 3]:
+            for group in combinations(patterns, size):
+                expr = _compile(list(group))
+                for path in paths:
+                    with self.subTest(patterns = group, path = path):
+                        self.assertEqual(
+                            bool(expr.match(path)),
+                            any(fnmatch(path, pattern) for pattern in group)
+                        )
+
+    def test_compile_empty(self):
+        """
+        Should return nothing if no patterns are given.
+        """
+        self.assertIsNone(_compile([]))
+
+    def test_resolve_exclusion(self):
+        """
+        Should report the reason for excluding external assets.
+        """
+        for settings, url, reason in [
+            ({}, "https://example.com/a.png", "internal"),
+            ({}, "https://example.org/a.png", None),
+            (dict(assets = False), "https://example.org/a.png", "assets"),
+            (dict(assets_fetch = False), "https://example.org/a.png", "fetch"),
+            (
+                dict(assets_include = ["example.org/*"]),
+                "https://example.org/a.png", None
+            ),
+            (
+                dict(assets_include = ["example.org/*"]),
+                "https://example.net/a.png", "inclusion"
+            ),
+            (
+                dict(assets_exclude = ["example.org/*.png"]),
+                "https://example.org/a.png", "exclusion"
+            ),
+            (
+                dict(assets_exclude = ["example.org/*.png"]),
+                "https://example.org/a.jpg", None
+            ),
+            (
+                dict(
+                    assets_include = ["example.org/*"],
+                    assets_exclude = ["example.org/*"]
+                ),
+                "https://example.net/a.png", "inclusion"
+            ),
+            (
+                dict(assets_include = ["example.org/*"], assets_fetch = False),
+                "https://example.org/a.png", None
+            )
+        ]:
+            with self.subTest(settings = settings, url = url):
+                plugin = self.stub_plugin(**settings)
+                self.assertEqual(
+                    plugin._resolve_exclusion(urlparse(url)), reason
+                )
+
+    def test_queue_prefetched_failed(self):
+        """
+        Should report errors of prefetched external assets and keep the URL.
+        """
+        plugin = self.stub_plugin()
+        url = urlparse("https://example.org/image")
+        full = "assets/external/example.org/image"
+        file = plugin._path_to_file("example.org/image", self.config)
+        file.url = url.geturl()
+
+        # Prefetch external asset with a job that fails
+        def fail():
+            raise ConnectionError()
+        plugin.assets_prefetched[full] = file
+        plugin.fetcher.submit(full, file.url, fail)
+
+        # Queue external asset twice and perform assertions
+        with self.assertLogs("mkdocs.material.privacy", "WARNING") as logs:
+            self.assertIsNone(plugin._queue(url, self.config))
+            self.assertIsNone(plugin._queue(url, self.config))
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(plugin.assets_skipped, set([file.url]))
+        self.assertEqual(plugin.assets_failed, set([full]))
+
+    def test_queue_prefetched_timeout(self):
+        """
+        Should stop waiting for prefetched external assets after the timeout.
+        """
+        plugin = self.stub_plugin(assets_fetch_timeout = 0.1)
+        url = urlparse("https://example.org/image")
+        full = "assets/external/example.org/image"
+        file = plugin._path_to_file("example.org/image", self.config)
+        file.url = url.geturl()
+
+        # Prefetch external asset with a job that blocks until released
+        event = Event()
+        plugin.assets_prefetched[full] = file
+        plugin.fetcher.submit(full, file.url, event.wait)
+        self.addCleanup(event.set)
+
+        # Queue external asset and perform assertions
+        with self.assertLogs("mkdocs.material.privacy", "WARNING"):
+            self.assertIsNone(plugin._queue(url, self.config))
+        self.assertEqual(plugin.assets_skipped, set())
+
+    def test_create_session(self):
+        """
+        Should retry failed requests and limit connections per host.
+        """
+        plugin = self.stub_plugin(
+            concurrency_per_host = 3, retries = 5, retries_backoff = 2
+        )
+
+        # Check adapter for HTTP and HTTPS
+        for scheme in ["http", "https"]:
+            adapter = plugin.session.get_adapter(f"{scheme}://example.org")
+            self.assertEqual(adapter._pool_maxsize, 3)
+            self.assertTrue(adapter._pool_block)
+
+            # Check retries
+            retry = adapter.max_retries
+            self.assertEqual(retry.total, 5)
+            self.assertEqual(retry.backoff_factor, 2)
+            self.assertFalse(retry.raise_on_status)
+            self.assertLessEqual(
+                set([429, 500, 502, 503, 504]), set(retry.status_forcelist)
+            )
+
+    def test_create_session_retry(self):
+        """
+        Should retry requests on rate limiting and server errors.
+        """
+        plugin = self.stub_plugin(retries_backoff = 0)
+        server = self.stub_server()
+        server.responses["/a.png"] = [
+            (429, {}, b""), (503, {}, b""), (500, {}, b""), (200, {}, b"a")
+        ]
+
+        # Send request and perform assertions
+        res = plugin.session.get(server.url("/a.png"))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.content, b"a")
+        self.assertEqual(len(server.requests), 4)
+
+    def test_create_session_retry_exhausted(self):
+        """
+        Should return the last response if all retries failed.
+        """
+        plugin = self.stub_plugin(retries = 2, retries_backoff = 0)
+        server = self.stub_server()
+        server.responses["/a.png"] = [(503, {}, b"")]
+
+        # Send request and perform assertions
+        res = plugin.session.get(server.url("/a.png"))
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(len(server.requests), 3)
+
+    def stub_cached(
+        self, plugin: PrivacyPlugin, url: str, content: bytes, meta: dict
+    ) -> File:
+        """
+        Stub a cached copy of an external asset, and its metadata.
+
+        Arguments:
+            plugin: The privacy plugin.
+            url: The URL of the external asset.
+            content: The content of the cached copy.
+            meta: The metadata of the last response.
+
+        Returns:
+            The file.
+        """
+        path = plugin._path_from_url(urlparse(url))
+        file = plugin._path_to_file(path, self.config)
+        file.url = url
+        plugin._save_to_file(file.abs_src_path, content)
+        plugin.manifest[url] = meta
+        return file
+
+    def test_is_stale(self):
+        """
+        Should consider cached copies stale once their time to live expired.
+        """
+        plugin = self.stub_plugin(cache_revalidate = True, cache_ttl = 60)
+        file = plugin._path_to_file("example.org/a.png", self.config)
+        file.url = "https://example.org/a.png"
+
+        # Check cached copies without metadata, and with or without max age
+        now = time.time()
+        for meta, stale in [
+            (None, True),
+            ({ "time": now, "max_age": 3600 }, False),
+            ({ "time": now - 7200, "max_age": 3600 }, True),
+            ({ "time": now - 30, "max_age": None }, False),
+            ({ "time": now - 90, "max_age": None }, True),
+            ({ "time": now, "max_age": 0 }, True)
+        ]:
+            with self.subTest(meta = meta):
+                plugin.manifest = { file.url: meta } if meta else {}
+                self.assertEqual(plugin._is_stale(file), stale)
+
+    def test_is_stale_disabled(self):
+        """
+        Should never consider cached copies stale, if revalidation is disabled.
+        """
+        plugin = self.stub_plugin()
+        file = plugin._path_to_file("example.org/a.png", self.config)
+        file.url = "https://example.org/a.png"
+        self.assertFalse(plugin._is_stale(file))
+
+    def test_metadata(self):
+        """
+        Should compute validators and time to live from response headers.
+        """
+        last = { "etag": "\"a\"", "last_modified": "Mon", "max_age": 60 }
+        for status, headers, expected in [
+            (200, {}, { "etag": "\"a\"", "max_age": None }),
+            (200, { "etag": "\"b\"" }, { "etag": "\"b\"", "max_age": None }),
+            (200, { "cache-control": "max-age=600" }, { "max_age": 600 }),
+            (200, { "cache-control": "max-age=600", "age": "100" }, {
+                "max_age": 500
+            }),
+            (200, { "cache-control": "no-cache, max-age=600" }, {
+                "max_age": 0
+            }),
+            (304, {}, { "max_age": 60, "last_modified": "Mon" })
+        ]:
+            with self.subTest(status = status, headers = headers):
+                res = requests.Response()
+                res.status_code = status
+                res.headers.update(headers)
+                meta = _metadata(res, last)
+                for key, value in expected.items():
+                    self.assertEqual(meta[key], value)
+
+    def test_fetch_fresh(self):
+        """
+        Should use cached copies without requests while they're fresh.
+        """
+        plugin = self.stub_plugin(cache_revalidate = True)
+        server = self.stub_server()
+        file = self.stub_cached(plugin, server.url("/a.png"), b"old", {
+            "etag": "\"a\"", "time": time.time(), "max_age": 3600
+        })
+
+        # Fetch external asset and perform assertions
+        plugin._fetch(file, self.config)
+        self.assertEqual(server.requests, [])
+        self.assertEqual(plugin.stats[server.url("/a.png")]["status"], "hit")
+
+    def test_fetch_stale_not_modified(self):
+        """
+        Should revalidate stale cached copies and keep them if not modified.
+        """
+        plugin = self.stub_plugin(cache_revalidate = True)
+        server = self.stub_server()
+        server.responses["/a.png"] = [
+            (304, { "cache-control": "max-age=600" }, b"")
+        ]
+        file = self.stub_cached(plugin, server.url("/a.png"), b"old", {
+            "etag": "\"a\"", "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "time": time.time() - 7200, "max_age": 3600
+        })
+
+        # Fetch external asset and perform assertions
+        plugin._fetch(file, self.config)
+        _, headers = server.requests[0]
+        self.assertEqual(headers["If-None-Match"], "\"a\"")
+        self.assertEqual(
+            headers["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+        with open(file.abs_src_path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+
+        # Check that metadata was updated
+        meta = plugin.manifest[server.url("/a.png")]
+        self.assertEqual(meta["etag"], "\"a\"")
+        self.assertEqual(meta["max_age"], 600)
+        self.assertGreater(meta["time"], time.time() - 60)
+        self.assertEqual(
+            plugin.stats[server.url("/a.png")]["status"], "revalidated"
+        )
+
+    def test_fetch_stale_modified(self):
+        """
+        Should revalidate stale cached copies and replace them if modified.
+        """
+        plugin = self.stub_plugin(cache_revalidate = True)
+        server = self.stub_server()
+        server.responses["/a.png"] = [
+            (200, { "content-type": "image/png", "etag": "\"b\"" }, b"new")
+        ]
+        file = self.stub_cached(plugin, server.url("/a.png"), b"old", {
+            "etag": "\"a\"", "time": time.time() - 7200, "max_age": 3600
+        })
+
+        # Fetch external asset and perform assertions
+        plugin._fetch(file, self.config)
+        _, headers = server.requests[0]
+        self.assertEqual(headers["If-None-Match"], "\"a\"")
+        with open(file.abs_src_path, "rb") as f:
+            self.assertEqual(f.read(), b"new")
+
+        # Check that metadata was updated
+        meta = plugin.manifest[server.url("/a.png")]
+        self.assertEqual(meta["etag"], "\"b\"")
+        self.assertEqual(
+            plugin.stats[server.url("/a.png")]["status"], "downloaded"
+        )
+
+    def test_parse_html_scope(self):
+        """
+        Should resolve memoized fragments relative to each initiator.
+        """
+        plugin = self.stub_plugin()
+        self.stub_asset(plugin, "example.org/a.png")
+
+        # Parse the same fragment for initiators in different scopes
+        fragment = "<img src=\"https://example.org/a.png\">"
+        for path, expected in [
+            ("index.md", "assets/external/example.org/a.png"),
+            ("a/b.md", "../../assets/external/example.org/a.png"),
+            ("c/d.md", "../../assets/external/example.org/a.png"),
+            ("assets/e.md", "../external/example.org/a.png"),
+            ("assets/external/f.md", "../example.org/a.png"),
+            ("a/b/c.md", "../../../assets/external/example.org/a.png")
+        ]:
+            with self.subTest(path = path):
+                initiator = stub_file(path = path, config = self.config)
+                self.assertEqual(
+                    plugin._parse_html(fragment, initiator, self.config),
+                    f"<img src=\"{expected}\">"
+                )
+
+        # Initiators in the same scope share memoized fragments
+        self.assertEqual(len(plugin.fragments), 5)
+
+    def test_save_from_response(self):
+        """
+        Should stream responses to a file and return the number of bytes.
+        """
+        plugin = self.stub_plugin(assets_max_size = 10)
+        file = plugin._path_to_file("example.org/a.png", self.config)
+        path = file.abs_src_path
+
+        # Save response and perform assertions
+        res = self.stub_response({ "content-length": "6" }, [b"abc", b"def"])
+        self.assertEqual(plugin._save_from_response(path, res, file), 6)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"abcdef")
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_save_from_response_oversized(self):
+        """
+        Should skip responses exceeding the maximum size before streaming.
+        """
+        plugin = self.stub_plugin(assets_max_size = 10)
+        file = plugin._path_to_file("example.org/a.png", self.config)
+        path = file.abs_src_path
+
+        # Save response and perform assertions
+        res = self.stub_response({ "content-length": "12" }, [b"a" * 12])
+        with self.assertLogs("mkdocs.material.privacy", "WARNING"):
+            self.assertIsNone(plugin._save_from_response(path, res, file))
+        self.assertEqual(res.consumed, 0)
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_save_from_response_oversized_no_skip(self):
+        """
+        Should save responses exceeding the maximum size, if not skipped.
+        """
+        plugin = self.stub_plugin(
+            assets_max_size = 10, assets_max_size_skip = False
+        )
+        file = plugin._path_to_file("example.org/a.png", self.config)
+        path = file.abs_src_path
+
+        # Save response and perform assertions
+        res = self.stub_response({}, [b"a" * 8, b"a" * 8])
+        with self.assertLogs("mkdocs.material.privacy", "WARNING") as logs:
+            self.assertEqual(plugin._save_from_response(path, res, file), 16)
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(os.path.getsize(path), 16)
+
+    def test_save_from_response_abort(self):
+        """
+        Should abort streaming once the maximum size is exceeded.
+        """
+        plugin = self.stub_plugin(assets_max_size = 10)
+        file = plugin._path_to_file("example.org/a.png", self.config)
+        path = file.abs_src_path
+        plugin._save_to_file(path, b"old")
+
+        # Save response without content length and perform assertions
+        res = self.stub_response({}, [b"a" * 8, b"a" * 8, b"a" * 8])
+        with self.assertLogs("mkdocs.material.privacy", "WARNING"):
+            self.assertIsNone(plugin._save_from_response(path, res, file))
+        self.assertEqual(res.consumed, 2)
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+        # Cached copy must be left untouched
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+
+    def test_save_from_response_error(self):
+        """
+        Should remove the temporary file if the transfer fails.
+        """
+        plugin = self.stub_plugin()
+        file = plugin._path_to_file("example.org/a.png", self.config)
+        path = file.abs_src_path
+
+        # Save response that fails midway and perform assertions
+        error = requests.ConnectionError()
+        res = self.stub_response({}, [b"abc", error])
+        with self.assertRaises(requests.ConnectionError):
+            plugin._save_from_response(path, res, file)
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_parse_markdown(self):
+        """
+        Should find inline, reference-style and HTML images in Markdown.
+        """
+        plugin = self.stub_plugin()
+        initiator = self.stub_source("index.md", "\n".join([
+            "![a](https://example.org/a.png)",
+            "![b](<https://example.org/b.png> \"Title\")",
+            "![c][c] ![D][] ![e][missing]",
+            "<img alt=\"f\" src=\"https://example.org/f.png\">",
+            "[](https://example.org/g.png)",
+            "![h](assets/h.png)",
+            "",
+            "[c]: https://example.org/c.png",
+            "[d]: <https://example.org/d.png>"
+        ]))
+
+        # Parse Markdown and perform assertions
+        urls = [url.geturl() for url in plugin._parse_markdown(initiator)]
+        self.assertCountEqual(urls, [
+            "https://example.org/a.png",
+            "https://example.org/b.png",
+            "https://example.org/c.png",
+            "https://example.org/d.png",
+            "https://example.org/f.png"
+        ])
+
+    def test_parse_markdown_code(self):
+        """
+        Should ignore images in code blocks and code spans.
+        """
+        plugin = self.stub_plugin()
+        initiator = self.stub_source("index.md", "\n".join([
+            "``` markdown",
+            "![a](https://example.org/a.png)",
+            "```",
+            "",
+            "=== \"Tab\"",
+            "",
+            "    ~~~~ html",
+            "    <img src=\"https://example.org/b.png\">",
+            "    ~~~",
+            "    ![c][c]",
+            "    ~~~~",
+            "",
+            "Use `![d](https://example.org/d.png)` or",
+            "``![e](https://example.org/e.png) with ` inside``",
+            "",
+            "![f](https://example.org/f.png)",
+            "",
+            "[c]: https://example.org/c.png"
+        ]))
+
+        # Parse Markdown and perform assertions
+        urls = [url.geturl() for url in plugin._parse_markdown(initiator)]
+        self.assertEqual(urls, ["https://example.org/f.png"])
+
+    def test_parse_markdown_code_unclosed(self):
+        """
+        Should ignore images after unclosed fenced code blocks.
+        """
+        plugin = self.stub_plugin()
+        initiator = self.stub_source("index.md", "\n".join([
+            "![a](https://example.org/a.png)",
+            "",
+            "```",
+            "![b](https://example.org/b.png)"
+        ]))
+
+        # Parse Markdown and perform assertions
+        urls = [url.geturl() for url in plugin._parse_markdown(initiator)]
+        self.assertEqual(urls, ["https://example.org/a.png"])
+
+    def test_record(self):
+        """
+        Should record statistics and the size of the cached copy.
+        """
+        plugin = self.stub_plugin()
+        file = self.stub_cached(plugin, "https://example.org/a.png", b"abc", {})
+
+        # Record statistics and perform assertions
+        plugin._record(file.url, file, "downloaded", 3, 0.5)
+        self.assertEqual(plugin.stats[file.url], {
+            "host": "example.org",
+            "status": "downloaded",
+            "transferred": 3,
+            "latency": 0.5,
+            "size": 3
+        })
+
+        # Record statistics for failed external asset
+        file = plugin._path_to_file("example.org/b.png", self.config)
+        plugin._record("https://example.org/b.png", file, "failed", 0, 0.25)
+        self.assertEqual(plugin.stats["https://example.org/b.png"]["size"], 0)
+
+    def test_fetch_reference(self):
+        """
+        Should record style sheets as initiators of the assets they reference.
+        """
+        plugin = self.stub_plugin(cache_revalidate = True)
+        server = self.stub_server()
+        server.responses["/bg.png"] = [
+            (200, { "content-type": "image/png" }, b"png")
+        ]
+        style = f"body {{ background: url({server.url('/bg.png')}) }}"
+        file = self.stub_cached(plugin, server.url("/style.css"),
+            style.encode("utf-8"), { "time": time.time(), "max_age": 3600 }
+        )
+
+        # Fetch style sheet, reconcile jobs and perform assertions
+        plugin._fetch(file, self.config)
+        plugin._check_jobs(plugin.fetcher.wait())
+        self.assertEqual(
+            plugin.references[server.url("/bg.png")], { file.src_uri }
+        )
+        self.assertEqual(
+            plugin.stats[server.url("/bg.png")]["status"], "downloaded"
+        )
+
+    def test_write_summary(self):
+        """
+        Should write statistics and initiators of external assets as JSON.
+        """
+        plugin = self.stub_plugin()
+        plugin.summary_file = os.path.join(self.temp.name, "a", "summary.json")
+        file = self.stub_cached(plugin, "https://example.org/a.png", b"abc", {})
+
+        # Record statistics and initiators of external assets
+        url = urlparse(f"{file.url}#fragment")
+        plugin._record(file.url, file, "hit", 0, 0.5)
+        plugin._reference(url, stub_file(path = "b.md", config = self.config))
+        plugin._reference(url, stub_file(path = "a.md", config = self.config))
+        plugin._reference(url, plugin._path_to_file(
+            "example.org/style.css", self.config
+        ))
+
+        # Write summary and perform assertions
+        plugin._write_summary()
+        with open(plugin.summary_file) as f:
+            self.assertEqual(json.load(f), {
+                file.url: {
+                    "host": "example.org",
+                    "status": "hit",
+                    "transferred": 0,
+                    "latency": 0.5,
+                    "size": 3,
+                    "pages": [
+                        "a.md",
+                        "assets/external/example.org/style.css",
+                        "b.md"
+                    ]
+                }
+            })
@@ -0,0 +1,294 @@
+# Copyright (c) 2016-2024 Martin Donath <martin.donath@squidfunk.com>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import json
+import unittest
+
+from material.plugins.search.plugin import (
+    SearchIndex,
+    _dumps,
+    _strip_search_attrs,
+    jieba
+)
+from mkdocs.structure.files import Files
+from mkdocs.structure.pages import Page
+from unittest.mock import patch
+
+from tests.helpers import stub_config, stub_page
+
+# -----------------------------------------------------------------------------
+# Functions
+# -----------------------------------------------------------------------------
+
+def stub_rendered_page(markdown: str, **settings: dict) -> Page:
+    """
+    Stub a page and render the given Markdown.
+
+    Arguments:
+        markdown: The Markdown.
+        **settings: Configuration settings.
+
+    Returns:
+        The page.
+    """
+    config = stub_config(**settings)
+    page = stub_page(path = "page.md", config = config)
+
+    # Render page, which also computes the table of contents
+    page.markdown = markdown
+    page.render(config, Files([page.file]))
+    return page
+
+# -----------------------------------------------------------------------------
+# Classes
+# -----------------------------------------------------------------------------
+
+class TestSearchIndex(unittest.TestCase):
+    """
+    Test cases for search index.
+    """
+
+    def test_add_entry_from_context(self):
+        """
+        Should add an entry for each section of the page.
+        """
+        page = stub_rendered_page("# Title\n\nText\n\n## Section\n\nText\n")
+
+        # Add page to search index and perform assertions
+        index = SearchIndex()
+        index.add_entry_from_context(page)
+        self.assertEqual(
+            [entry["location"] for entry in index.entries],
+            ["page/", "page/#section"]
+        )
+
+    def test_add_entry_from_context_with_many_headings(self):
+        """
+        Should resolve locations of sections on pages with many headings.
+        """
+        markdown = ["# API reference"]
+        for i in range(500):
+            markdown.append(f"{'#' * (2 + i % 4)} Symbol {i}\n\nText")
+
+        # Add page to search index and perform assertions
+        page = stub_rendered_page("\n\n".join(markdown))
+        index = SearchIndex()
+        index.add_entry_from_context(page)
+        self.assertEqual(len(index.entries), 501)
+        self.assertEqual(index.entries[-1]["location"], "page/#symbol-499")
+
+    def test_map_toc_by_id(self):
+        """
+        Should map identifiers of nested items to anchors.
+        """
+        page = stub_rendered_page("# Title\n\n## Section\n\n### Section\n")
+
+        # Map table of contents and perform assertions
+        index = SearchIndex()
+        anchors = index._map_toc_by_id(page.toc)
+        self.assertEqual(anchors["section"], "#section")
+        self.assertEqual(anchors["section_1"], "#section_1")
+
+    def test_add_entry_from_context_with_search_attrs(self):
+        """
+        Should return positions of tags with search attributes.
+        """
+        page = stub_rendered_page("\n".join([
+            "# Title",
+            "",
+            "Text",
+            "{ data-search-exclude=\"true\" }",
+            "",
+            "## Section { data-search-boost=\"2\" }",
+            "",
+            "Text"
+        ]), markdown_extensions = ["attr_list", "toc"])
+
+        # Add page to search index and strip search attributes
+        index = SearchIndex()
+        spans = index.add_entry_from_context(page)
+        self.assertEqual(len(spans), 2)
+        self.assertNotIn(
+            "data-search-",
+            _strip_search_attrs(page.content, spans)
+        )
+
+    def test_add_entry_from_context_without_search_attrs(self):
+        """
+        Should return no positions if no tag has search attributes.
+        """
+        page = stub_rendered_page("# Title\n\nText\n")
+
+        # Add page to search index and perform assertions
+        index = SearchIndex()
+        spans = index.add_entry_from_context(page)
+        self.assertEqual(spans, [])
+        self.assertIs(_strip_search_attrs(page.content, spans), page.content)
+
+    def test_generate_search_index_compact(self):
+        """
+        Should encode entries in columns, storing pages only once.
+        """
+        page = stub_rendered_page("# Title\n\nText\n\n## Section\n\nText\n")
+        page.meta["tags"] = ["foo", "bar"]
+
+        # Add page to search index and generate compact encoding
+        index = SearchIndex(
+            lang = ["en"], separator = "[\\s]+", pipeline = [], fields = {},
+            compact = True
+        )
+        index.add_entry_from_context(page)
+        data = json.loads(index.generate_search_index(None))
+        self.assertEqual(data["schema"], 1)
+        self.assertEqual(data["tags"], ["foo", "bar"])
+        self.assertEqual(data["pages"], {
+            "location": ["page/"],
+            "title": ["Title"],
+            "tags": [[0, 1]]
+        })
+        self.assertEqual(data["sections"]["page"], [0, 0])
+        self.assertEqual(data["sections"]["anchor"], ["", "#section"])
+        self.assertEqual(data["sections"]["title"], [None, "Section"])
+
+    def test_generate_search_index_with_budget_page_truncate(self):
+        """
+        Should truncate text of pages exceeding the budget.
+        """
+        page = stub_rendered_page("\n\n".join(
+            ["# Title"] + [f"## Section {i}\n\n{'Text ' * 100}" for i in range(5)]
+        ))
+
+        # Add page to search index and generate search index
+        index = SearchIndex(
+            lang = ["en"], separator = "[\\s]+", pipeline = [], fields = {},
+            budget_page = 1000, budget_page_truncate = True
+        )
+        index.add_entry_from_context(page)
+        data = json.loads(index.generate_search_index(None))
+        self.assertLessEqual(index.stats["pages"]["page/"], 1000)
+        self.assertEqual(len(data["docs"]), 6)
+        self.assertEqual(data["docs"][-1]["text"], "")
+        self.assertTrue(data["docs"][1]["text"].startswith("<p>Text"))
+
+    def test_generate_search_index_compact_with_budget_page_truncate(self):
+        """
+        Should encode entries once, and write truncated text when compact.
+        """
+        page = stub_rendered_page("\n\n".join(["# Title"] + [
+            f"## Section {i}\n\n{'Text ' * 100}" for i in range(5)
+        ]))
+
+        # Add page to search index and generate search index
+        index = SearchIndex(
+            lang = ["en"], separator = "[\\s]+", pipeline = [], fields = {},
+            compact = True, print_size = True,
+            budget_page = 1000, budget_page_truncate = True
+        )
+        index.add_entry_from_context(page)
+        with patch.object(
+            index, "_compact_entries", wraps = index._compact_entries
+        ) as compact:
+            data = json.loads(index.generate_search_index(None))
+            self.assertEqual(compact.call_count, 1)
+
+        # The written text must match the truncated entries
+        self.assertLessEqual(index.stats["pages"]["page/"], 1000)
+        self.assertEqual(
+            data["sections"]["text"],
+            [entry["text"] for entry in index.entries]
+        )
+        self.assertEqual(data["sections"]["text"][-1], "")
+        self.assertEqual(
+            index.stats["fields"]["sections.text"],
+            len(_dumps(data["sections"]["text"]))
+        )
+
+    def test_generate_search_index_compact_with_print_size(self):
+        """
+        Should measure the compact encoding that is actually written.
+        """
+        page = stub_rendered_page("\n\n".join(
+            ["# Title"] + [f"## Section {i}\n\nText {i}" for i in range(10)]
+        ))
+
+        # Add page to search index and generate search index
+        index = SearchIndex(
+            lang = ["en"], separator = "[\\s]+", pipeline = [], fields = {},
+            compact = True, print_size = True
+        )
+        index.add_entry_from_context(page)
+        data = json.loads(index.generate_search_index(None))
+
+        # The size of the page must match the size of the cells in the page
+        # and section tables, including a separator for each cell
+        size, columns = 0, 0
+        for table in ["pages", "sections"]:
+            size += len(_dumps(data[table]))
+            size -= len(_dumps(dict.fromkeys(data[table], [])))
+            columns += len(data[table])
+        self.assertEqual(index.stats["pages"]["page/"], size + columns)
+        self.assertEqual(
+            index.stats["fields"]["sections.text"],
+            len(_dumps(data["sections"]["text"]))
+        )
+
+    def test_truncate_entry_closes_tags(self):
+        """
+        Should close tags that are left open after truncating text.
+        """
+        text = "<p>" + "Text <strong>bold <em>text</em></strong> " * 20 + "</p>"
+        for excess in range(1, len(text), 7):
+            entry = { "text": text }
+            removed = SearchIndex()._truncate_entry(entry, excess)
+            self.assertGreaterEqual(removed, excess)
+            self.assertEqual(
+                len(_dumps(text)) - len(_dumps(entry["text"])),
+                removed
+            )
+
+            # Ensure that tags are balanced
+            if entry["text"]:
+                self.assertTrue(entry["text"].startswith("<p>"))
+                self.assertTrue(entry["text"].endswith("</p>"))
+            for name in ["p", "strong", "em"]:
+                self.assertEqual(
+                    entry["text"].count(f"<{name}>"),
+                    entry["text"].count(f"</{name}>")
+                )
+
+    @unittest.skipIf(not jieba, "jieba is not installed")
+    def test_segment_entries(self):
+        """
+        Should segment Chinese characters once for each run of characters.
+        """
+        entries = [
+            { "location": "a/", "title": "中文", "text": "使用中文编写" },
+            { "location": "b/", "title": "中文", "text": "Text" }
+        ]
+
+        # Segment entries and perform assertions
+        index = SearchIndex()
+        index._segment_entries(entries)
+        self.assertEqual(entries[0]["title"], index._segment_chinese("中文"))
+        self.assertEqual(entries[1]["text"], "Text")
+        self.assertEqual(
+            index.segments_used,
+            set(["中文", "使用中文编写"])
+        )